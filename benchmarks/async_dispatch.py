@@ -0,0 +1,173 @@
+"""
+Count thread pool hops of requests served by Django ASGI handler
+without middleware, for async and sync views registered in router.
+Hops of the handler itself (signals and closing of response) are
+counted apart from hops between resolving and response of view.
+
+Run from the repository root:
+    python -m benchmarks.async_dispatch
+"""
+import sys
+
+from types import ModuleType
+
+from .utils import setup, print_table
+
+setup(
+    DEBUG=False,
+    ALLOWED_HOSTS=['testserver'],
+    ROOT_URLCONF='bench_urls',
+    SECRET_KEY='bench',
+    MIDDLEWARE=[],
+)
+
+import asyncio
+import time
+
+from asgiref.sync import AsyncToSync, SyncToAsync, sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from django.views.decorators.http import require_http_methods
+
+from django_routify import Router, include_router
+
+NUMBER = 5000
+
+hops = {'handler': 0, 'view': 0}
+in_view = False
+
+
+def count_hops() -> None:
+    """
+    Count every call of SyncToAsync and AsyncToSync,
+    calls made while view is dispatched are counted apart.
+    :return: None
+    """
+
+    sync_to_async_call = SyncToAsync.__call__
+    async_to_sync_call = AsyncToSync.__call__
+
+    def count_sync_to_async(adapter, *args, **kwargs):
+        hops['view' if in_view else 'handler'] += 1
+        return sync_to_async_call(adapter, *args, **kwargs)
+
+    def count_async_to_sync(adapter, *args, **kwargs):
+        hops['view' if in_view else 'handler'] += 1
+        return async_to_sync_call(adapter, *args, **kwargs)
+
+    SyncToAsync.__call__ = count_sync_to_async
+    AsyncToSync.__call__ = count_async_to_sync
+
+
+def build_urlconf() -> None:
+    """
+    Register urlconf with async and sync views.
+    :return: None
+    """
+
+    router = Router('/api', 'api', auto_trailing_slash=True)
+
+    @router.get('/async')
+    async def async_view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse('')
+
+    @router.route('/class')
+    class AsyncView(View):
+        async def get(self, request: HttpRequest) -> HttpResponse:
+            return HttpResponse('')
+
+    @router.route('/guarded')
+    @require_http_methods(['GET'])
+    async def guarded_view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse('')
+
+    @router.get('/sync')
+    def sync_view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse('')
+
+    # hops made while dispatcher runs are counted as hops of view,
+    # sync dispatcher is adapted the same way as Django handler adapts it
+    router.urls
+    for dispatcher in router.dispatchers.values():
+        view = dispatcher.view
+        if not asyncio.iscoroutinefunction(view):
+            view = sync_to_async(view, thread_sensitive=True)
+
+        async def counted(request, *args, _view=view, **kwargs):
+            global in_view
+            in_view = True
+            try:
+                return await _view(request, *args, **kwargs)
+            finally:
+                in_view = False
+
+        for url_pattern in dispatcher.url_patterns:
+            url_pattern.callback = counted
+
+    urls = ModuleType('bench_urls')
+    urls.urlpatterns = [include_router(router)]
+    sys.modules['bench_urls'] = urls
+
+
+async def run(application: ASGIHandler, path: str, number: int) -> float:
+    """
+    Returns average latency of number requests in microseconds.
+    :param application: ASGIHandler
+    :param path: str
+    :param number: int
+    :return: float
+    """
+
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': path,
+        'query_string': b'',
+        'headers': [(b'host', b'testserver')],
+    }
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(number):
+        messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await asyncio.Event().wait() # client never disconnects
+
+        await application(dict(scope), receive, send)
+    return (time.perf_counter() - start) / number * 1_000_000
+
+
+def main() -> None:
+    build_urlconf()
+    count_hops()
+    application = ASGIHandler()
+
+    rows = []
+    for name, path in (
+        ('async function', '/api/async/'),
+        ('async class', '/api/class/'),
+        ('require_http_methods', '/api/guarded/'),
+        ('sync function', '/api/sync/'),
+    ):
+        asyncio.run(run(application, path, 100)) # warm up
+        hops.update(handler=0, view=0)
+
+        latency = asyncio.run(run(application, path, NUMBER))
+        rows.append((
+            name,
+            f'{hops["view"] / NUMBER:.1f}',
+            f'{hops["handler"] / NUMBER:.1f}',
+            f'{latency:.1f}',
+        ))
+
+    print_table(('view', 'view hops', 'handler hops', 'request, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare registration of routes one by one with router decorators
+against registration of all of them with Router.add_routes.
+Both do the same work for every route, add_routes validates the whole batch
+before anything is registered, it is not expected to be faster.
+
+Run from the repository root:
+    python -m benchmarks.bulk_registration
+"""
+import gc
+import time
+
+from typing import Any, Callable, List, Tuple
+
+from .utils import setup, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router
+
+
+def build_specs(count: int) -> List[Tuple[Any, ...]]:
+    """
+    Build (url_path, view, methods, name) records of count routes,
+    half of them are static and half of them have int param.
+    :param count: int
+    :return: List[Tuple[Any, ...]]
+    """
+
+    specs = []
+    for i in range(count):
+        if i % 2:
+            def view(request: HttpRequest, pk: int) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/items{i}/<int:pk>'
+        else:
+            def view(request: HttpRequest) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/static{i}'
+
+        view.__name__ = f'view_{i}'
+        specs.append((url_path, view, ['GET'], None))
+    return specs
+
+
+def with_decorators(specs: List[Tuple[Any, ...]]) -> Router:
+    router = Router('/bench', 'bench', auto_trailing_slash=True)
+    for url_path, view, methods, name in specs:
+        router.route(url_path, methods=list(methods), name=name)(view)
+    return router
+
+
+def with_add_routes(specs: List[Tuple[Any, ...]]) -> Router:
+    router = Router('/bench', 'bench', auto_trailing_slash=True)
+    router.add_routes(specs)
+    return router
+
+
+def timed(build: Callable[[List[Tuple[Any, ...]]], Router], specs: List[Tuple[Any, ...]]) -> float:
+    """
+    Returns time of building router in milliseconds, without garbage collection.
+    :param build: Callable[[List[Tuple[Any, ...]]], Router]
+    :param specs: List[Tuple[Any, ...]]
+    :return: float
+    """
+
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        build(specs)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    rows = []
+    for count in (1_000, 10_000, 50_000):
+        specs = build_specs(count)
+        repeat = 5 if count < 50_000 else 3
+
+        decorators = min(timed(with_decorators, specs) for _ in range(repeat))
+        bulk = min(timed(with_add_routes, specs) for _ in range(repeat))
+
+        rows.append((count, f'{decorators:.1f}', f'{bulk:.1f}'))
+
+    print_table(('routes', 'decorators, ms', 'add_routes, ms'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare resolving with generated module against stock include_router.
+
+Run from the repository root:
+    python -m benchmarks.compiled_engine
+"""
+import sys
+import tempfile
+import time
+
+from .utils import setup, build_router, sample_paths, measure, print_table
+
+setup(ROUTIFY_CACHE_DIR=tempfile.mkdtemp())
+
+from django_routify import include_router
+
+
+def main() -> None:
+    rows = []
+    for count in (100, 1_000, 10_000):
+        router = build_router(count)
+        paths = sample_paths(count)
+
+        for engine in ('django', 'compiled'):
+            resolver = include_router(router, engine=engine)
+
+            start = time.perf_counter()
+            resolver.resolve(paths[-1]) # first request compiles/imports routes
+            first = (time.perf_counter() - start) * 1_000_000
+
+            cached = '-'
+            if engine == 'compiled':
+                # imitate restart of process, module is imported from cache directory
+                sys.modules.pop(resolver.compiled.module.__name__)
+                resolver = include_router(router, engine=engine)
+
+                start = time.perf_counter()
+                resolver.resolve(paths[-1])
+                cached = f'{(time.perf_counter() - start) * 1_000_000:.1f}'
+
+            def resolve_all():
+                for path in paths:
+                    resolver.resolve(path)
+
+            average = measure(resolve_all, number=20) / len(paths)
+            rows.append((count, engine, f'{first:.1f}', cached, f'{average:.2f}'))
+
+    print_table(
+        ('routes', 'engine', 'first request, us', 'first request (cached), us', 'resolve, us'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Compare the same JSON view served by fast lane and by Django handler
+with the usual middleware stack, in-process under WSGI.
+
+Run from the repository root:
+    python -m benchmarks.fast_lane
+"""
+import sys
+
+from types import ModuleType
+
+from .utils import setup, print_table
+
+setup(
+    DEBUG=False,
+    ALLOWED_HOSTS=['testserver'],
+    ROOT_URLCONF='bench_urls',
+    SECRET_KEY='bench',
+    INSTALLED_APPS=[
+        'django.contrib.auth',
+        'django.contrib.contenttypes',
+        'django.contrib.sessions',
+        'django.contrib.messages',
+    ],
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+    MIDDLEWARE=[
+        'django.middleware.security.SecurityMiddleware',
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.middleware.common.CommonMiddleware',
+        'django.middleware.csrf.CsrfViewMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    ],
+)
+
+import gc
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.http import HttpRequest, JsonResponse
+from django.test import RequestFactory
+
+from django_routify import FastLaneWSGI, Router, include_router
+
+
+def build_urlconf(count: int) -> None:
+    """
+    Register urlconf with router of count routes and the same view
+    served by fast lane and normally.
+    :param count: int
+    :return: None
+    """
+
+    router = Router('/api', 'api', auto_trailing_slash=True)
+
+    def health(request: HttpRequest) -> JsonResponse:
+        return JsonResponse({'status': 'ok'})
+
+    def view(request: HttpRequest, **kwargs) -> JsonResponse:
+        return JsonResponse({})
+
+    router.get('/health/fast', name='fast_health', fast=True)(health)
+    router.get('/health/normal', name='normal_health')(health)
+    for i in range(count):
+        router.get(f'/items{i}/<int:pk>', name=f'item{i}')(view)
+
+    urls = ModuleType('bench_urls')
+    urls.urlpatterns = [include_router(router)]
+    sys.modules['bench_urls'] = urls
+
+
+def run(application, environ: dict, number: int) -> list:
+    """
+    Returns latencies of number requests in microseconds.
+    :param application: Callable
+    :param environ: dict
+    :param number: int
+    :return: List[float]
+    """
+
+    def start_response(status, headers):
+        pass
+
+    latencies = []
+    for _ in range(number):
+        start = time.perf_counter()
+        response = application(dict(environ), start_response)
+        b''.join(response)
+        response.close()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def main() -> None:
+    build_urlconf(200)
+    application = FastLaneWSGI(WSGIHandler())
+    factory = RequestFactory()
+
+    rows = []
+    for name, path in (('middleware stack', '/api/health/normal/'), ('fast lane', '/api/health/fast/')):
+        environ = factory.get(path).environ
+        run(application, environ, 500) # warm up
+
+        gc.disable()
+        latencies = sorted(run(application, environ, 20000))
+        gc.enable()
+
+        mean = sum(latencies) / len(latencies)
+        rows.append((
+            name,
+            f'{1_000_000 / mean:.0f}',
+            f'{latencies[len(latencies) // 2]:.1f}',
+            f'{latencies[int(len(latencies) * 0.99)]:.1f}',
+        ))
+
+    print_table(('served by', 'RPS', 'p50, us', 'p99, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
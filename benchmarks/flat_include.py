@@ -0,0 +1,73 @@
+"""
+Compare resolving of router tree with nested resolvers against flat mode.
+
+Run from the repository root:
+    python -m benchmarks.flat_include
+"""
+from .utils import setup, measure, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router, include_router
+
+
+def build_tree(children: int, routes: int) -> Router:
+    """
+    Build router with children small routers,
+    each of them has its own included router.
+    :param children: int
+    :param routes: int := Count of routes of each router
+    :return: Router
+    """
+
+    def view(request: HttpRequest, **kwargs) -> HttpResponse:
+        return HttpResponse('')
+
+    router = Router('/bench', 'bench', auto_trailing_slash=True)
+    for i in range(children):
+        child = Router(f'/app{i}', f'app{i}', auto_trailing_slash=True)
+        nested = Router('/<int:pk>/items', 'items', auto_trailing_slash=True)
+
+        for j in range(routes):
+            child.get(f'/static{j}', name=f'static{j}')(view)
+            nested.get(f'/item{j}/<slug:slug>', name=f'item{j}')(view)
+
+        child.include(nested)
+        router.include(child)
+
+    return router
+
+
+def main() -> None:
+    rows = []
+    for children, routes in ((10, 10), (50, 20)):
+        router = build_tree(children, routes)
+        paths = [
+            f'bench/app{children - 1}/static{routes - 1}/',
+            f'bench/app{children // 2}/42/items/item{routes // 2}/hello/',
+            f'bench/app{children - 1}/42/items/item{routes - 1}/hello/',
+        ]
+
+        for engine in ('django', 'radix'):
+            for flat in (False, True):
+                resolver = include_router(router, engine=engine, flat=flat)
+
+                def resolve_all():
+                    for path in paths:
+                        resolver.resolve(path)
+
+                average = measure(resolve_all, number=200) / len(paths)
+                rows.append((
+                    children * routes * 2,
+                    engine,
+                    'flat' if flat else 'nested',
+                    f'{average:.2f}',
+                ))
+
+    print_table(('routes', 'engine', 'mode', 'resolve, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
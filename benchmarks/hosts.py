@@ -0,0 +1,93 @@
+"""
+Compare host routing with include_hosts against middleware
+which matches host regexes in order and swaps request urlconf.
+
+Run from the repository root:
+    python -m benchmarks.hosts
+"""
+from .utils import setup, measure, print_table
+
+setup(ALLOWED_HOSTS=['*'])
+
+import re
+
+from types import ModuleType
+
+from django.http import HttpRequest, HttpResponse
+from django.urls import get_resolver, set_urlconf
+
+from django_routify import Router, include_hosts, include_router
+from django_routify.hosts import _current_host
+
+
+def build_routers(hosts: int, routes: int) -> list:
+    """
+    Build router for each static host and one router for "{tenant}.example.com".
+    :param hosts: int
+    :param routes: int := Count of routes of each router
+    :return: List[Router]
+    """
+
+    def view(request: HttpRequest, **kwargs) -> HttpResponse:
+        return HttpResponse('')
+
+    routers = []
+    for i in range(hosts):
+        router = Router('/', f'host{i}', host=f'api{i}.example.com', auto_trailing_slash=True)
+        for j in range(routes):
+            router.get(f'/page{j}', name=f'page{j}')(view)
+        routers.append(router)
+
+    tenant_router = Router('/', 'tenant', host='{tenant}.example.com', auto_trailing_slash=True)
+    for j in range(routes):
+        tenant_router.get(f'/page{j}', name=f'page{j}')(view)
+    routers.append(tenant_router)
+    return routers
+
+
+def main() -> None:
+    rows = []
+    routes = 10
+    for hosts in (10, 100, 500):
+        routers = build_routers(hosts, routes)
+        requests = [
+            (f'api{hosts - 1}.example.com', f'/page{routes - 1}/'),
+            ('acme.example.com', f'/page{routes - 1}/'),
+        ]
+
+        # urlconf of each host, found by matching host regexes in order
+        urlconfs = []
+        for router in routers:
+            regex = re.compile(re.escape(router.host).replace(r'\{tenant\}', '[^.]+'))
+            urlconf = ModuleType(f'{router.app_name}_urls')
+            urlconf.urlpatterns = [include_router(router)]
+            urlconfs.append((regex, urlconf))
+
+        def swap_urlconf():
+            for host, path in requests:
+                for regex, urlconf in urlconfs:
+                    if regex.fullmatch(host):
+                        break
+                set_urlconf(urlconf)
+                get_resolver(urlconf).resolve(path)
+            set_urlconf(None)
+
+        host_urlconf = ModuleType('hosts_urls')
+        host_urlconf.urlpatterns = [include_hosts(*routers)]
+        resolver = get_resolver(host_urlconf)
+
+        def host_dispatch():
+            for host, path in requests:
+                token = _current_host.set(host)
+                resolver.resolve(path)
+                _current_host.reset(token)
+
+        for name, func in (('urlconf swap', swap_urlconf), ('include_hosts', host_dispatch)):
+            func() # populate resolvers
+            rows.append((hosts + 1, name, f'{measure(func, number=2000) / len(requests):.2f}'))
+
+    print_table(('hosts', 'routing', 'resolve, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare startup time of router with live normalizing of routes
+against router loaded from precompiled manifest.
+
+Run from the repository root:
+    python -m benchmarks.manifest_startup
+"""
+import gc
+import os
+import tempfile
+import time
+
+from typing import Optional
+
+from .utils import setup, build_colon_router, print_table
+
+setup()
+
+from django_routify.manifest import write_manifest
+
+
+def timed(count: int, manifest: Optional[str] = None) -> float:
+    """
+    Returns time of building router in milliseconds, without garbage collection.
+    :param count: int
+    :param manifest: Optional[str]
+    :return: float
+    """
+
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        build_colon_router(count, manifest=manifest)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    directory = tempfile.mkdtemp()
+
+    rows = []
+    for count in (1_000, 5_000):
+        manifest = os.path.join(directory, f'bench_{count}.json')
+
+        live = min(timed(count) for _ in range(5))
+        write_manifest(build_colon_router(count, manifest=manifest))
+        loaded = min(timed(count, manifest) for _ in range(5))
+
+        rows.append((count, f'{live:.1f}', f'{loaded:.1f}', f'{live / loaded:.1f}x'))
+
+    print_table(('routes', 'live registration, ms', 'from manifest, ms', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure normalizing of dynamic urls and registration of colon based routes.
+
+Run from the repository root:
+    python -m benchmarks.pattern_tokenizer
+"""
+import gc
+import time
+
+from .utils import setup, build_colon_router, measure, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import ColonPattern, CurlyPattern, AnglePattern
+
+
+def view(request: HttpRequest, shop: str, pk: int, slug: str) -> HttpResponse:
+    return HttpResponse('')
+
+
+URLS = {
+    ColonPattern: 'shops/:shop/items/:pk/:slug/',
+    CurlyPattern: 'shops/{shop}/items/{pk}/{slug}/',
+    AnglePattern: 'shops/<shop>/items/<pk>/<slug>/',
+}
+
+
+def main() -> None:
+    rows = []
+    for pattern_class, url in URLS.items():
+        pattern = pattern_class()
+
+        def normalize():
+            if pattern.is_custom(url):
+                pattern.normalize(url, view, False)
+
+        rows.append((pattern_class.__name__, f'{measure(normalize, number=20_000):.2f}'))
+
+    print_table(('pattern', 'is_custom + normalize, us'), rows)
+    print()
+
+    rows = []
+    for count in (1_000, 10_000):
+        timings = []
+        for _ in range(5):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                build_colon_router(count)
+                timings.append((time.perf_counter() - start) * 1000)
+            finally:
+                gc.enable()
+        rows.append((count, f'{min(timings):.1f}'))
+
+    print_table(('routes', 'registration, ms'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Compare latency of async views served in-process under WSGI,
+run by Django in a new event loop for every request
+and by router in persistent event loop. The pooled view
+keeps TCP connection to local echo server for each event loop.
+
+Run from the repository root:
+    python -m benchmarks.persistent_loop
+"""
+import sys
+
+from types import ModuleType
+
+from .utils import setup, print_table
+
+setup(
+    DEBUG=False,
+    ALLOWED_HOSTS=['testserver'],
+    ROOT_URLCONF='bench_urls',
+    SECRET_KEY='bench',
+    MIDDLEWARE=[],
+)
+
+import asyncio
+import gc
+import socketserver
+import threading
+import time
+
+from weakref import WeakKeyDictionary
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from django_routify import Router, include_router
+
+NUMBER = 3000
+
+
+class EchoHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            self.wfile.write(line)
+
+
+def start_server() -> int:
+    """
+    Start echo server in daemon thread and returns its port.
+    :return: int
+    """
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), EchoHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
+
+
+def build_urlconf(port: int) -> dict:
+    """
+    Register urlconf with the same async views in router without
+    and with persistent event loop, returns counter of opened connections.
+    :param port: int
+    :return: dict
+    """
+
+    connections = {'opened': 0}
+    pool = WeakKeyDictionary()
+
+    async def view(request: HttpRequest) -> HttpResponse:
+        await asyncio.sleep(0)
+        return HttpResponse('')
+
+    async def pooled(request: HttpRequest) -> HttpResponse:
+        loop = asyncio.get_running_loop()
+        connection = pool.get(loop)
+        if connection is None:
+            connection = pool[loop] = await asyncio.open_connection('127.0.0.1', port)
+            connections['opened'] += 1
+        reader, writer = connection
+        writer.write(b'ping\n')
+        return HttpResponse(await reader.readline())
+
+    urlpatterns = []
+    for prefix, persistent in (('default', False), ('persistent', True)):
+        router = Router(f'/{prefix}', prefix, auto_trailing_slash=True, persistent_loop=persistent)
+        router.get('/view', name='view')(view)
+        router.get('/pooled', name='pooled')(pooled)
+        urlpatterns.append(include_router(router))
+
+    urls = ModuleType('bench_urls')
+    urls.urlpatterns = urlpatterns
+    sys.modules['bench_urls'] = urls
+    return connections
+
+
+def run(application, environ: dict, number: int) -> list:
+    """
+    Returns latencies of number requests in microseconds.
+    :param application: Callable
+    :param environ: dict
+    :param number: int
+    :return: List[float]
+    """
+
+    def start_response(status, headers):
+        pass
+
+    latencies = []
+    for _ in range(number):
+        start = time.perf_counter()
+        response = application(dict(environ), start_response)
+        b''.join(response)
+        response.close()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def main() -> None:
+    connections = build_urlconf(start_server())
+    application = WSGIHandler()
+    factory = RequestFactory()
+
+    rows = []
+    for name in ('view', 'pooled'):
+        for loop in ('default', 'persistent'):
+            environ = factory.get(f'/{loop}/{name}/').environ
+            run(application, environ, 100) # warm up
+            connections['opened'] = 0
+
+            gc.disable()
+            latencies = sorted(run(application, environ, NUMBER))
+            gc.enable()
+
+            rows.append((
+                f'{name}, {loop} loop',
+                f'{latencies[len(latencies) // 2]:.1f}',
+                f'{latencies[int(len(latencies) * 0.99)]:.1f}',
+                connections['opened'],
+            ))
+
+    print_table(('async view', 'p50, us', 'p99, us', 'connections'), rows)
+
+
+if __name__ == '__main__':
+    main()
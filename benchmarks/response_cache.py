@@ -0,0 +1,114 @@
+"""
+Compare latency of read heavy sync view served under WSGI
+without response cache, on cache hits and on stale hits refreshed in background.
+The view simulates ORM queries and serialization of rows.
+
+Run from the repository root:
+    python -m benchmarks.response_cache
+"""
+import sys
+
+from types import ModuleType
+
+from .utils import setup, print_table
+
+setup(
+    DEBUG=False,
+    ALLOWED_HOSTS=['testserver'],
+    ROOT_URLCONF='bench_urls',
+    SECRET_KEY='bench',
+    MIDDLEWARE=[],
+)
+
+import gc
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.test import RequestFactory
+
+from django_routify import CachePolicy, Router, include_router
+
+NUMBER = 2000
+QUERY = 0.0005
+ROWS = 200
+
+calls = {'view': 0}
+
+
+def build_urlconf() -> Router:
+    """
+    Register urlconf with the same view without cache, with cache and with stale cache.
+    :return: Router
+    """
+
+    router = Router('/api', 'api', auto_trailing_slash=True)
+
+    def products(request: HttpRequest) -> HttpResponse:
+        calls['view'] += 1
+        time.sleep(QUERY) # query to database
+        rows = [{'id': pk, 'name': f'product {pk}', 'price': pk * 1.5} for pk in range(ROWS)]
+        return JsonResponse({'products': rows})
+
+    router.get('/products/default', name='default')(products)
+    router.get('/products/cached', name='cached', cache=CachePolicy(ttl=60))(products)
+    # every hit is stale, so at most one refresh runs at once
+    router.get('/products/stale', name='stale', cache=CachePolicy(ttl=1e-9, stale=60))(products)
+
+    urls = ModuleType('bench_urls')
+    urls.urlpatterns = [include_router(router)]
+    sys.modules['bench_urls'] = urls
+    return router
+
+
+def run(application, environ: dict, number: int) -> list:
+    """
+    Returns latencies of number requests in microseconds.
+    :param application: Callable
+    :param environ: dict
+    :param number: int
+    :return: List[float]
+    """
+
+    def start_response(status, headers):
+        pass
+
+    latencies = []
+    for _ in range(number):
+        start = time.perf_counter()
+        response = application(dict(environ), start_response)
+        b''.join(response)
+        response.close()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def main() -> None:
+    router = build_urlconf()
+    application = WSGIHandler()
+    factory = RequestFactory()
+
+    rows = []
+    for name in ('default', 'cached', 'stale'):
+        environ = factory.get(f'/api/products/{name}/', {'page': 1}).environ
+        run(application, environ, 100) # warm up
+        calls['view'] = 0
+
+        gc.disable()
+        latencies = sorted(run(application, environ, NUMBER))
+        gc.enable()
+
+        rows.append((
+            name,
+            f'{latencies[len(latencies) // 2]:.1f}',
+            f'{latencies[int(len(latencies) * 0.99)]:.1f}',
+            calls['view'],
+        ))
+
+    print_table(('route', 'p50, us', 'p99, us', 'view calls'), rows)
+    for name in ('cached', 'stale'):
+        print(name, router.get_cache(name).stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Compare burst of slow sync report views served under Django ASGI handler
+in threads of thread sensitive contexts, one per request, and in bounded route executor,
+while quick sync views are requested at the same time.
+Route executor bounds count of reports running at once, e.g. queries to database.
+
+Run from the repository root:
+    python -m benchmarks.route_executor
+"""
+import sys
+
+from types import ModuleType
+
+from .utils import setup, print_table
+
+setup(
+    DEBUG=False,
+    ALLOWED_HOSTS=['testserver'],
+    ROOT_URLCONF='bench_urls',
+    SECRET_KEY='bench',
+    MIDDLEWARE=[],
+)
+
+import asyncio
+import threading
+import time
+
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router, include_router, register_executor, executor_metrics
+
+REPORTS = 32
+WORKERS = 8
+QUICK = 20
+DELAY = 0.05
+
+running = {'now': 0, 'peak': 0}
+lock = threading.Lock()
+
+
+def build_urlconf() -> None:
+    """
+    Register urlconf with the same slow view with and without route executor.
+    :return: None
+    """
+
+    register_executor('reports', WORKERS)
+    router = Router('/api', 'api', auto_trailing_slash=True)
+
+    def report(request: HttpRequest) -> HttpResponse:
+        with lock:
+            running['now'] += 1
+            running['peak'] = max(running['peak'], running['now'])
+        time.sleep(DELAY) # blocking query
+        with lock:
+            running['now'] -= 1
+        return HttpResponse('')
+
+    @router.get('/quick')
+    def quick(request: HttpRequest) -> HttpResponse:
+        return HttpResponse('')
+
+    router.get('/report/shared', name='shared')(report)
+    router.get('/report/executor', name='executor', executor='reports')(report)
+
+    urls = ModuleType('bench_urls')
+    urls.urlpatterns = [include_router(router)]
+    sys.modules['bench_urls'] = urls
+
+
+async def request(application: ASGIHandler, path: str) -> float:
+    """
+    Returns latency of request in milliseconds.
+    :param application: ASGIHandler
+    :param path: str
+    :return: float
+    """
+
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': path,
+        'query_string': b'',
+        'headers': [(b'host', b'testserver')],
+    }
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait() # client never disconnects
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await application(scope, receive, send)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(application: ASGIHandler, report_path: str) -> tuple:
+    """
+    Returns time of all requests and median latency of quick requests in milliseconds,
+    quick requests are sent after reports.
+    :param application: ASGIHandler
+    :param report_path: str
+    :return: Tuple[float, float]
+    """
+
+    start = time.perf_counter()
+    reports = [asyncio.ensure_future(request(application, report_path)) for _ in range(REPORTS)]
+    await asyncio.sleep(0)
+    quick = sorted(await asyncio.gather(*(request(application, '/api/quick/') for _ in range(QUICK))))
+    await asyncio.gather(*reports)
+    return (time.perf_counter() - start) * 1000, quick[len(quick) // 2]
+
+
+def main() -> None:
+    build_urlconf()
+    application = ASGIHandler()
+
+    rows = []
+    for name, path in (('context threads', '/api/report/shared/'), ('route executor', '/api/report/executor/')):
+        asyncio.run(request(application, path)) # warm up
+        running['peak'] = 0
+        total, quick = asyncio.run(run(application, path))
+        rows.append((name, f'{total:.0f}', f'{quick:.1f}', running['peak']))
+
+    print_table(('reports run by', 'total, ms', 'quick p50, ms', 'reports at once'), rows)
+    for metrics in executor_metrics():
+        print(metrics)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare memory of router which keeps only route records
+against the same router after its URLPatterns are created.
+
+Run from the repository root:
+    python -m benchmarks.route_memory
+"""
+import gc
+import tracemalloc
+
+from .utils import setup, build_router, print_table
+
+setup()
+
+from django_routify import include_router
+
+
+def main() -> None:
+    count = 20_000
+
+    gc.collect()
+    tracemalloc.start()
+
+    start = tracemalloc.take_snapshot()
+    router = build_router(count)
+    gc.collect()
+    records = tracemalloc.take_snapshot()
+
+    include_router(router) # creates URLPatterns
+    gc.collect()
+    materialized = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    records_size = sum(stat.size_diff for stat in records.compare_to(start, 'filename'))
+    patterns_size = sum(stat.size_diff for stat in materialized.compare_to(records, 'filename'))
+    total_size = records_size + patterns_size
+
+    rows = [
+        ('route records', f'{records_size / 1024 / 1024:.1f}', f'{records_size / count:.0f}'),
+        ('+ URLPatterns', f'{patterns_size / 1024 / 1024:.1f}', f'{patterns_size / count:.0f}'),
+        ('materialized', f'{total_size / 1024 / 1024:.1f}', f'{total_size / count:.0f}'),
+    ]
+    print(f'{count} routes, {len(router.urls)} URLPatterns')
+    print_table(('state', 'memory, MiB', 'per route, bytes'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure cost of calling views behind middleware composed once by router,
+against the same middleware built for every request,
+and cost for routes of a router without middleware.
+
+Run from the repository root:
+    python -m benchmarks.router_middleware
+"""
+from .utils import setup, measure, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from django_routify import Router
+
+COUNT = 3
+
+
+def view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('')
+
+
+def header_middleware(get_response):
+    def middleware(request: HttpRequest) -> HttpResponse:
+        response = get_response(request)
+        response['X-Bench'] = '1'
+        return response
+    return middleware
+
+
+def build(middleware=None):
+    router = Router('/bench', 'bench', auto_trailing_slash=True, middleware=middleware)
+    router.get('/items')(view)
+    router.urls
+    return router.dispatchers['items/'].view
+
+
+def per_request(request: HttpRequest) -> HttpResponse:
+    # middleware factories are called for every request
+    handler = view
+    for _ in range(COUNT):
+        handler = header_middleware(handler)
+    return handler(request)
+
+
+def main() -> None:
+    request = RequestFactory().get('/bench/items/')
+    cases = [
+        ('router without middleware', build()),
+        ('composed once', build([header_middleware] * COUNT)),
+        ('built per request', per_request),
+    ]
+
+    rows = []
+    for name, func in cases:
+        rows.append((name, f'{measure(lambda: func(request), number=20000):.2f}'))
+
+    print_table(('middleware', 'call, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
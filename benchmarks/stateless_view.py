@@ -0,0 +1,49 @@
+"""
+Measure cost of dispatching class based JSON views created by View.as_view
+for each request, against stateless dispatch by one instance.
+
+Run from the repository root:
+    python -m benchmarks.stateless_view
+"""
+from .utils import setup, measure, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.views import View
+
+from django_routify import Router
+
+
+class ItemView(View):
+    def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return HttpResponse(b'{"pk": 1}', content_type='application/json')
+
+    def post(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return HttpResponse(status=201)
+
+
+def build(stateless: bool):
+    router = Router('/bench', 'bench', auto_trailing_slash=True)
+    router.route('/items/<int:pk>', stateless=stateless)(ItemView)
+    router.urls
+    return router.dispatchers['items/<int:pk>/'].view
+
+
+def main() -> None:
+    request = RequestFactory().get('/bench/items/1/')
+
+    rows = []
+    for name, func in (
+        ('as_view', build(False)),
+        ('stateless', build(True)),
+        ('view only', lambda request, pk: ItemView.get(None, request, pk)),
+    ):
+        rows.append((name, f'{measure(lambda: func(request, pk=1), number=50000):.2f}'))
+
+    print_table(('dispatch', 'call, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+import time
+
+from typing import Any, Callable, List, Sequence
+
+import django
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router, ColonPattern
+
+
+def setup(**options) -> None:
+    """
+    Configure Django settings for benchmarks if they are not configured yet.
+    :param options: Any
+    :return: None
+    """
+
+    if not settings.configured:
+        settings.configure(**options)
+        django.setup()
+
+
+def build_router(count: int, **kwargs) -> Router:
+    """
+    Build router with count routes, half of them are static
+    and half of them have int param.
+    :param count: int
+    :param kwargs: Any := Router kwargs
+    :return: Router
+    """
+
+    router = Router('/bench', 'bench', auto_trailing_slash=True, **kwargs)
+
+    for i in range(count):
+        if i % 2:
+            def view(request: HttpRequest, pk: int) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/items{i}/<int:pk>'
+        else:
+            def view(request: HttpRequest) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/static{i}'
+
+        view.__name__ = f'view_{i}'
+        router.get(url_path)(view)
+
+    return router
+
+
+def build_colon_router(count: int, **kwargs) -> Router:
+    """
+    Build router with count colon based routes, half of them are static
+    and half of them have params, which types come from annotations.
+    :param count: int
+    :param kwargs: Any := Router kwargs
+    :return: Router
+    """
+
+    router = Router(
+        '/bench',
+        'bench',
+        auto_trailing_slash=True,
+        dynamic_pattern=ColonPattern,
+        **kwargs,
+    )
+
+    for i in range(count):
+        if i % 2:
+            def view(request: HttpRequest, pk: int, slug: str) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/items{i}/:pk/:slug'
+        else:
+            def view(request: HttpRequest) -> HttpResponse:
+                return HttpResponse('')
+            url_path = f'/static{i}'
+
+        view.__name__ = f'ViewNumber{i}'
+        router.get(url_path)(view)
+
+    return router
+
+
+def sample_paths(count: int) -> List[str]:
+    """
+    Paths spread over routes built by build_router.
+    :param count: int
+    :return: List[str]
+    """
+
+    paths = []
+    for i in range(0, count, max(count // 50, 1)):
+        if i % 2:
+            paths.append(f'bench/items{i}/42/')
+        else:
+            paths.append(f'bench/static{i}/')
+    return paths
+
+
+def measure(func: Callable[[], Any], number: int = 1000) -> float:
+    """
+    Returns average time of func call in microseconds.
+    :param func: Callable[[], Any]
+    :param number: int
+    :return: float
+    """
+
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1_000_000
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """
+    Print rows aligned by columns.
+    :param headers: Sequence[str]
+    :param rows: Sequence[Sequence[Any]]
+    :return: None
+    """
+
+    rows = [[str(value) for value in row] for row in [headers, *rows]]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(headers))]
+
+    for row in rows:
+        print('  '.join(value.rjust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,59 @@
+"""
+Measure cost of selecting API version of request by versioned dispatcher,
+against plain method dispatch and a version check inside the view.
+
+Run from the repository root:
+    python -m benchmarks.version_dispatch
+"""
+from .utils import setup, measure, print_table
+
+setup()
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from django_routify import Router
+
+
+def view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('')
+
+
+def checked_view(request: HttpRequest) -> HttpResponse:
+    # version check inside each view
+    version = request.META.get('HTTP_X_API_VERSION') or '1'
+    if version == '2':
+        return HttpResponse('')
+    return HttpResponse('')
+
+
+def build(versioning=None, versions=('1', '2', '3')):
+    router = Router('/bench', 'bench', auto_trailing_slash=True, versioning=versioning)
+    if versioning is None:
+        router.get('/items')(view)
+    else:
+        for version in versions:
+            router.get('/items', version=version, name=f'items_v{version}')(view)
+    router.urls
+    return router.dispatchers['items/'].view
+
+
+def main() -> None:
+    factory = RequestFactory()
+    cases = [
+        ('plain dispatch', build(), factory.get('/bench/items/')),
+        ('check in view', checked_view, factory.get('/bench/items/', HTTP_X_API_VERSION='2')),
+        ('accept', build('accept'), factory.get('/bench/items/', HTTP_ACCEPT='application/json; version=2')),
+        ('header', build('header'), factory.get('/bench/items/', HTTP_X_API_VERSION='2')),
+        ('query', build('query'), factory.get('/bench/items/', {'version': '2'})),
+    ]
+
+    rows = []
+    for name, func, request in cases:
+        rows.append((name, f'{measure(lambda: func(request), number=20000):.2f}'))
+
+    print_table(('dispatch', 'call, us'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Compare the first request of a fresh process with and without django_routify.warmup().
+Every measurement runs in its own process, so nothing is warm from a previous one.
+
+Run from the repository root:
+    python -m benchmarks.warmup
+"""
+import subprocess
+import sys
+import time
+import types
+
+from .utils import print_table
+
+COUNT = 2_000
+
+
+def child(warm: bool) -> None:
+    """
+    Build urlconf, optionally warm it and print time of the first
+    and of the thousandth resolving and reversing in microseconds.
+    :param warm: bool
+    :return: None
+    """
+
+    from .utils import setup, build_router, sample_paths
+
+    setup(ROOT_URLCONF='bench_urls')
+
+    from django.urls import get_resolver, reverse
+
+    from django_routify import include_router, warmup
+
+    router = build_router(COUNT)
+    module = types.ModuleType('bench_urls')
+    module.urlpatterns = [include_router(router)]
+    sys.modules['bench_urls'] = module
+
+    if warm:
+        warmup(freeze=True)
+
+    path = '/' + sample_paths(COUNT)[-1]
+
+    def request() -> float:
+        start = time.perf_counter()
+        get_resolver().resolve(path)
+        reverse('bench:view_1', kwargs={'pk': 1})
+        return (time.perf_counter() - start) * 1_000_000
+
+    first = request()
+    for _ in range(998):
+        request()
+    print(first, request())
+
+
+def main() -> None:
+    rows = []
+    for warm in (False, True):
+        results = []
+        for _ in range(5):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.warmup', 'warm' if warm else 'cold'],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            results.append([float(value) for value in output.split()])
+
+        first = min(result[0] for result in results)
+        thousandth = min(result[1] for result in results)
+        rows.append(('warmup()' if warm else 'cold', f'{first:.0f}', f'{thousandth:.0f}'))
+
+    print_table(('process', 'first request, us', '1000th request, us'), rows)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        child(sys.argv[1] == 'warm')
+    else:
+        main()
@@ -1,5 +1,12 @@
 from .router import Router
-from .include import include_router
+from .include import include_router, include_hosts
+from .hosts import HostMiddleware, get_current_host
+from .fastlane import FastLaneWSGI, FastLaneASGI
+from .executors import register_executor, executor_metrics, ExecutorMetrics
+from .caching import CachePolicy
+from .lazy import LazyView
+from .bulk import RouteSpec, RouteSpecError
+from .warmup import warmup, warm_routes, WarmResult
 from .patterns import (
     ColonPattern,
     CurlyPattern,
@@ -10,6 +17,28 @@ __all__ = [
     Router,         # Router
 
     include_router, # Include router
+    include_hosts,  # Include routers by their hosts
+
+    HostMiddleware, # Set host of request for include_hosts
+    get_current_host, # Host of request being handled
+
+    FastLaneWSGI,   # Serve fast routes without middleware under WSGI
+    FastLaneASGI,   # Serve fast routes without middleware under ASGI
+
+    register_executor, # Register named thread pool for sync views
+    executor_metrics,  # Queue depth and utilization of thread pools
+    ExecutorMetrics,   # Metrics of thread pool
+
+    CachePolicy,    # Options of in-process response cache of route
+
+    LazyView,       # View registered by dotted import path
+
+    RouteSpec,      # Route record for Router.add_routes
+    RouteSpecError, # Errors of invalid route records
+
+    warmup,         # Warm every router before forking workers
+    warm_routes,    # Send synthetic GET requests to routes
+    WarmResult,     # Result of synthetic GET request
 
     ColonPattern,   # ColonPattern for each of urls
     CurlyPattern,   # CurlyPattern for each of urls
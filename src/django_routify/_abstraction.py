@@ -1,8 +1,13 @@
+import os
+
 from abc import ABC, abstractmethod
+from threading import RLock
+from weakref import WeakKeyDictionary, WeakSet
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -11,7 +16,7 @@ from typing import (
 )
 
 from django.http import HttpRequest, HttpResponse
-from django.urls import URLPattern
+from django.urls import URLPattern, URLResolver
 from django.views import View
 
 
@@ -112,6 +117,16 @@ class BasePattern(ABC):
 
 
 from .validator import _validate_type
+from .dispatch import MethodDispatcher, RouteRecord
+from .lazy import LazyView
+from .manifest import get_config, load_manifest
+from .filters import PathFilter
+from .hosts import HostPattern
+from .middleware import _get_middleware
+from .versioning import Versioning, _get_versioning
+from .registry import register_router
+from .reverse import UrlTemplate
+from .table import RouteTable
 from .patterns import (
     Pattern,
     ColonPattern,
@@ -131,8 +146,34 @@ class BaseRouter(ABC):
     Attributes:
         ALLOWED_METHODS: str                := ALLOWED_METHODS is a valid HTTP methods
         __app_name: Optional[str]           := Application name same as app_name in urls.py
+        __host: Optional[str] = None        := Host or host pattern served by router with include_hosts
         __prefix: str                       := Prefix for each url paths
+        __prefix_normalized: bool = False   := Is prefix already normalized with dynamic pattern
         __urls: List[URLPattern]            := List of URLPatterns that can be included in urlpatterns
+        __records: List[Any]                := Route records and URLResolvers waiting for creating URLPatterns
+        __materialized: bool = False        := Were urls accessed, after that URLPatterns are created at once
+        __static_urls: Dict[str, URLPattern] := Index of URLPatterns without dynamic params by url path
+        __dispatchers: Dict[str, MethodDispatcher] := Method dispatchers by url path
+        __version: int = 0                  := Counter of changes of urls
+        __children: List[BaseRouter]        := Routers included with include
+        __parents: List[BaseRouter]         := Routers this router is included into
+        __path_filter: PathFilter           := First segments and segment counts of urls
+        __reverse_table: Dict[str, List[UrlTemplate]] := Url templates by name, last registered first
+        __mounts: WeakKeyDictionary         := Static paths where router is included by root URLResolver
+        __lazy_views: List[LazyView]        := Views registered by dotted import path
+        __warm_kwargs: Dict[str, Dict[str, Any]] := Sample kwargs of GET routes for synthetic warm up requests by url path
+        __manifest: Optional[str] = None    := File of precompiled routes
+        __manifest_config: Optional[List[Any]] := Options of router which manifest depends on
+        __manifest_routes: Optional[tuple]  := Normalized prefix and routes loaded from manifest
+        __registrations: List[tuple]        := Registered views with their keys, url paths and names
+        __routes: List[Any]                 := View records and URLResolvers of included routers in order
+        __table: Optional[RouteTable]       := Snapshot of routes used by resolvers
+        __lock: RLock                       := Lock of changing routes at runtime
+        __resolvers: WeakSet                := URLResolvers made by include_router for router
+        __versioning: Optional[Versioning]  := Selecting API version of request for versioned views
+        __middleware: List[Any]             := Middleware factories wrapping every view of router
+        __persistent_loop: bool = False     := Run async views in persistent event loop under WSGI
+        __executor: Optional[str] = None    := Route executor running sync views under ASGI
         __auto_naming: bool = True          := Auto naming for every view
         __auto_trailing_slash: bool = False := Auto trailing slash for every view path
         __dynamic_pattern: Pattern          := Dynamic pattern for parsing and normalizing custom urls
@@ -143,10 +184,63 @@ class BaseRouter(ABC):
 
     __app_name: Optional[str]
     'Application name same as app_name in urls.py'
+    __host: Optional[str]
+    'Host or host pattern served by router with include_hosts | By default equals None'
     __prefix: str
     'Prefix for each url paths | By default equals ""'
+    __prefix_normalized: bool
+    'Is prefix already normalized with dynamic pattern | By default equals False'
     __urls: List[URLPattern]
     'List of URLPatterns that can be included in urlpatterns'
+    __records: List[Any]
+    'Route records and URLResolvers waiting for creating URLPatterns'
+    __materialized: bool
+    'Were urls accessed, after that URLPatterns are created at once | By default equals False'
+    __static_urls: Dict[str, URLPattern]
+    'Index of URLPatterns without dynamic params by url path'
+    __dispatchers: Dict[str, MethodDispatcher]
+    'Method dispatchers by url path'
+    __version: int
+    'Counter of changes of urls | By default equals 0'
+    __children: List['BaseRouter']
+    'Routers included with include'
+    __parents: List['BaseRouter']
+    'Routers this router is included into'
+    __path_filter: PathFilter
+    'First segments and segment counts of urls'
+    __reverse_table: Dict[str, List[UrlTemplate]]
+    'Url templates by name, last registered first'
+    __mounts: WeakKeyDictionary
+    'Static paths where router is included by root URLResolver, None if reverse() must be used'
+    __lazy_views: List[LazyView]
+    'Views registered by dotted import path'
+    __warm_kwargs: Dict[str, Dict[str, Any]]
+    'Sample kwargs of GET routes for synthetic warm up requests by url path'
+    __manifest: Optional[str]
+    'File of precompiled routes | By default equals None'
+    __manifest_config: Optional[List[Any]]
+    'Options of router which manifest depends on'
+    __manifest_routes: Optional[tuple]
+    'Normalized prefix and routes loaded from manifest, None if it is missing or outdated'
+    __registrations: List[tuple]
+    'Registered views with their keys, url paths and names, kept only for writing manifest'
+    __routes: List[Any]
+    'View records and URLResolvers of included routers in order, routes are rebuilt from them'
+    __table: Optional[RouteTable]
+    'Snapshot of routes used by resolvers, None until it is taken'
+    __lock: RLock
+    'Lock of changing routes at runtime and taking snapshots'
+    __resolvers: WeakSet
+    'URLResolvers made by include_router for router'
+
+    __versioning: Optional[Versioning]
+    'Selecting API version of request for versioned views | By default equals None'
+    __middleware: List[Any]
+    'Middleware factories wrapping every view of router, the first one is the outermost'
+    __persistent_loop: bool
+    'Run async views in persistent event loop under WSGI | By default equals False'
+    __executor: Optional[str]
+    'Name of route executor running sync views under ASGI | By default equals None'
 
     __auto_naming: bool
     'Auto naming for every view | By default equals True'
@@ -171,6 +265,10 @@ class BaseRouter(ABC):
         auto_naming = kwargs.get('auto_naming', True)
         auto_trailing_slash = kwargs.get('auto_trailing_slash', False)
         dynamic_pattern = kwargs.get('dynamic_pattern', Pattern)()
+        manifest = kwargs.get('manifest', None)
+        host = kwargs.get('host', None)
+        persistent_loop = kwargs.get('persistent_loop', False)
+        executor = kwargs.get('executor', None)
 
         _validate_type('prefix', prefix, (str, type(None)))
         _validate_type('app_name', app_name, (str, type(None)))
@@ -181,6 +279,12 @@ class BaseRouter(ABC):
             dynamic_pattern,
             (Pattern, ColonPattern, CurlyPattern, AnglePattern),
         )
+        _validate_type('manifest', manifest, (str, os.PathLike, type(None)))
+        _validate_type('host', host, (str, type(None)))
+        _validate_type('persistent_loop', persistent_loop, bool)
+        _validate_type('executor', executor, (str, type(None)))
+        if persistent_loop and executor is not None:
+            raise ValueError('Options "persistent_loop" and "executor" can not be used together')
 
         self.__prefix = prefix or ''
         self.__prefix = self.__prefix.lstrip('/')
@@ -191,12 +295,42 @@ class BaseRouter(ABC):
         if self.__prefix == '/':
             self.__prefix = ''
 
+        self.__prefix_normalized = False
         self.__app_name = app_name or ''
         self.__auto_naming = auto_naming
         self.__auto_trailing_slash = auto_trailing_slash
         self.__dynamic_pattern = dynamic_pattern
+        self.__versioning = _get_versioning(kwargs)
+        self.__middleware = _get_middleware(kwargs.get('middleware', None))
+        self.__persistent_loop = persistent_loop
+        self.__executor = executor
+        # validated at once, resolvers compile it again
+        self.__host = None if host is None else HostPattern(host).host
 
         self.__urls = []
+        self.__records = []
+        self.__materialized = False
+        self.__static_urls = {}
+        self.__dispatchers = {}
+        self.__version = 0
+        self.__children = []
+        self.__parents = []
+        self.__path_filter = PathFilter()
+        self.__reverse_table = {}
+        self.__mounts = WeakKeyDictionary()
+        self.__lazy_views = []
+        self.__warm_kwargs = {}
+
+        self.__manifest = None if manifest is None else os.fspath(manifest)
+        self.__manifest_config = None if manifest is None else get_config(self)
+        self.__registrations = []
+        self.__routes = []
+        self.__table = None
+        self.__lock = RLock()
+        self.__resolvers = WeakSet()
+        self.__manifest_routes = load_manifest(self)
+
+        register_router(self)
 
     @property
     def prefix(self) -> str:
@@ -216,15 +350,249 @@ class BaseRouter(ABC):
         """
         return self.__app_name
 
+    @property
+    def versioning(self) -> Optional[Versioning]:
+        """
+        versioning getter\n
+        Selecting API version of request by Accept header, custom header or query parameter,
+        set with "versioning", "version_param" and "default_version" options
+        :return: Optional[django_routify.versioning.Versioning]
+        """
+        return self.__versioning
+
+    @property
+    def middleware(self) -> List[Any]:
+        """
+        middleware getter\n
+        Middleware factories composed once with every view registered in router,
+        set with "middleware" option
+        :return: List[Callable]
+        """
+        return self.__middleware
+
+    @property
+    def persistent_loop(self) -> bool:
+        """
+        persistent_loop getter\n
+        Are async views run in one event loop of worker process,
+        instead of a new event loop for every request under WSGI.
+        Dispatchers of router are sync then, so it is meant for WSGI only
+        :return: bool
+        """
+        return self.__persistent_loop
+
+    @property
+    def executor(self) -> Optional[str]:
+        """
+        executor getter\n
+        Name of route executor which runs sync views of router under ASGI,
+        instead of the one thread shared by thread sensitive views
+        :return: Optional[str]
+        """
+        return self.__executor
+
+    @property
+    def host(self) -> Optional[str]:
+        """
+        host getter\n
+        Host or host pattern like "{tenant}.example.com" served by router
+        when it is included with include_hosts
+        :return: Optional[str]
+        """
+        return self.__host
+
+    def __materialize(self) -> None:
+        """
+        Private method which creates URLPatterns of route records waiting for it,
+        on the first call dispatching views of every url path are built
+        :return: None
+        """
+
+        if not self.__materialized:
+            self.__materialized = True
+            for dispatcher in self.__dispatchers.values():
+                dispatcher.rebuild()
+
+        records, self.__records = self.__records, []
+        for record in records:
+            if isinstance(record, RouteRecord):
+                url_pattern = record.materialize()
+                if not record.alias and not url_pattern.pattern.converters:
+                    self.__static_urls[record.url_path] = url_pattern
+            else:
+                url_pattern = record # URLResolver of included router
+            self.__urls.append(url_pattern)
+            self.__path_filter.add(url_pattern)
+
     @property
     def urls(self) -> List[URLPattern]:
         """
         urls getter\n
-        List of URLPatterns that can be included in urlpatterns
+        List of URLPatterns that can be included in urlpatterns,
+        they are created from route records on the first access
         :return: List[django.urls.URLPattern]
         """
+        if self.__records or not self.__materialized:
+            self.__materialize()
         return self.__urls
 
+    @property
+    def materialized(self) -> bool:
+        """
+        materialized getter\n
+        Were urls accessed, after that URLPatterns are created at once
+        :return: bool
+        """
+        return self.__materialized
+
+    @property
+    def static_urls(self) -> Dict[str, URLPattern]:
+        """
+        static_urls getter\n
+        Index of URLPatterns without dynamic params by url path
+        :return: Dict[str, django.urls.URLPattern]
+        """
+        if self.__records or not self.__materialized:
+            self.__materialize()
+        return self.__static_urls
+
+    @property
+    def dispatchers(self) -> Dict[str, MethodDispatcher]:
+        """
+        dispatchers getter\n
+        Method dispatchers by url path
+        :return: Dict[str, django_routify.dispatch.MethodDispatcher]
+        """
+        return self.__dispatchers
+
+    @property
+    def version(self) -> int:
+        """
+        version getter\n
+        Counter of changes of urls of router and included routers,
+        used for invalidating resolver caches
+        :return: int
+        """
+        return self.__version
+
+    @property
+    def children(self) -> List['BaseRouter']:
+        """
+        children getter\n
+        Routers included with include
+        :return: List[Router]
+        """
+        return self.__children
+
+    @property
+    def parents(self) -> List['BaseRouter']:
+        """
+        parents getter\n
+        Routers this router is included into
+        :return: List[Router]
+        """
+        return self.__parents
+
+    @property
+    def path_filter(self) -> PathFilter:
+        """
+        path_filter getter\n
+        First segments and segment counts of urls,
+        used for rejecting impossible paths before pattern matching
+        :return: django_routify.filters.PathFilter
+        """
+        if self.__records or not self.__materialized:
+            self.__materialize()
+        return self.__path_filter
+
+    @property
+    def reverse_table(self) -> Dict[str, List[UrlTemplate]]:
+        """
+        reverse_table getter\n
+        Url templates by name, last registered first as Django reverses them
+        :return: Dict[str, List[django_routify.reverse.UrlTemplate]]
+        """
+        return self.__reverse_table
+
+    @property
+    def lazy_views(self) -> List[LazyView]:
+        """
+        lazy_views getter\n
+        Views registered by dotted import path
+        :return: List[django_routify.lazy.LazyView]
+        """
+        return self.__lazy_views
+
+    @property
+    def warm_kwargs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        warm_kwargs getter\n
+        Sample kwargs of GET routes by url path, declared with "warm_kwargs" option,
+        so routes with params get synthetic warm up requests too
+        :return: Dict[str, Dict[str, Any]]
+        """
+        return self.__warm_kwargs
+
+    @property
+    def manifest(self) -> Optional[str]:
+        """
+        manifest getter\n
+        File of precompiled routes, written by "manage.py routify_compile"
+        :return: Optional[str]
+        """
+        return self.__manifest
+
+    @property
+    def manifest_config(self) -> Optional[List[Any]]:
+        """
+        manifest_config getter\n
+        Options of router which manifest depends on, taken before any registration
+        :return: Optional[List[Any]]
+        """
+        return self.__manifest_config
+
+    @property
+    def registrations(self) -> List[tuple]:
+        """
+        registrations getter\n
+        Registered views with their keys and (url path, name), kept only if router has manifest
+        :return: List[tuple]
+        """
+        return self.__registrations
+
+    @property
+    def table(self) -> RouteTable:
+        """
+        table getter\n
+        Snapshot of routes used by resolvers,
+        taken again after routes were changed
+        :return: django_routify.table.RouteTable
+        """
+
+        table = self.__table
+        if table is not None and table.version == self.__version:
+            return table
+
+        with self.__lock:
+            table = self.__table
+            if table is None or table.version != self.__version:
+                table = self.__table = RouteTable(
+                    self.__version,
+                    tuple(self.urls),
+                    dict(self.static_urls),
+                    self.path_filter,
+                )
+            return table
+
+    @property
+    def resolvers(self) -> WeakSet:
+        """
+        resolvers getter\n
+        URLResolvers made by include_router for router
+        :return: WeakSet
+        """
+        return self.__resolvers
+
     @property
     def auto_naming(self) -> bool:
         """
@@ -255,7 +623,15 @@ class BaseRouter(ABC):
     @abstractmethod
     def route(self, url_path: str, **kwargs):
         """
-        Router decorator that register view in urlpatterns with django.urls.path
+        Router decorator that register view in urlpatterns with django.urls.path.
+        With "view" dotted import path in kwargs registers LazyView at once and returns it.
+        With "warm_kwargs" in kwargs synthetic warm up requests use them as sample params.
+        With "version" in kwargs view serves only requests of this API version.
+        With "fast" in kwargs view is served by fast lane without Django middleware.
+        With "middleware" in kwargs view is wrapped into them inside middleware of router.
+        With "executor" in kwargs sync view runs in named route executor under ASGI.
+        With "stateless" in kwargs class based view is dispatched by one instance without setup().
+        With "cache" CachePolicy in kwargs responses of GET and HEAD requests are cached in process
         :param url_path: str
         :param kwargs: Dict[str, Any]
         :return: Any
@@ -317,6 +693,121 @@ class BaseRouter(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_routes(self, specs: Iterable[Any]) -> List[Any]:
+        """
+        Register many routes given by (url_path, view, methods, name) records at once.
+        Every spec is validated before anything is registered,
+        errors of all invalid specs are raised together in RouteSpecError.
+        Duplicated specs are registered once. Returns registered views
+        :param specs: Iterable[Union[RouteSpec, Tuple[Any, ...]]]
+        :return: List[Union[FUNC_BASED_VIEW, View, LazyView]]
+        """
+        pass
+
+    @abstractmethod
+    def url_for(self, name: str, **kwargs) -> str:
+        """
+        Returns url of view registered with name, same as reverse("app_name:name")
+        :param name: str
+        :param kwargs: Dict[str, Any]
+        :return: str
+        """
+        pass
+
+    @abstractmethod
+    def add(
+        self,
+        url_path: str,
+        view: Any,
+        methods: Optional[List[str]] = None,
+        name: Optional[str] = None,
+    ) -> Any:
+        """
+        Register view at runtime and swap new snapshot of routes into resolvers.
+        Returns registered view
+        :param url_path: str
+        :param view: Union[FUNC_BASED_VIEW, View, LazyView, str]
+        :param methods: Optional[List[str]]
+        :param name: Optional[str]
+        :return: Union[FUNC_BASED_VIEW, View, LazyView]
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, name: str) -> int:
+        """
+        Remove every view registered with name at runtime
+        and swap new snapshot of routes into resolvers.
+        Returns count of removed views
+        :param name: str
+        :return: int
+        """
+        pass
+
+    @abstractmethod
+    def replace(self, name: str, view: Any) -> Any:
+        """
+        Replace every view registered with name by view at runtime,
+        keeping their url paths and methods, and swap new snapshot of routes into resolvers.
+        Returns view
+        :param name: str
+        :param view: Union[FUNC_BASED_VIEW, View, LazyView, str]
+        :return: Union[FUNC_BASED_VIEW, View, LazyView]
+        """
+        pass
+
+    @abstractmethod
+    def get_middleware(self, name: str) -> List[Any]:
+        """
+        Returns middleware factories wrapping view registered with name,
+        middleware of router first, the outermost first
+        :param name: str
+        :return: List[Callable]
+        """
+        pass
+
+    @abstractmethod
+    def get_cache(self, name: str) -> Optional[Any]:
+        """
+        Returns response cache of view registered with name,
+        None if view is registered without "cache" option
+        :param name: str
+        :return: Optional[django_routify.caching.ResponseCache]
+        """
+        pass
+
+    @abstractmethod
+    def include(self, router: 'BaseRouter', **kwargs) -> 'BaseRouter':
+        """
+        Include router into this router, its urls are resolved after urls registered before.
+        Returns included router
+        :param router: Router
+        :param kwargs: Dict[str, Any] := include_router kwargs
+        :return: Router
+        """
+        pass
+
+    @abstractmethod
+    def walk(self) -> List['BaseRouter']:
+        """
+        Returns router and every router included into it, depth first
+        :return: List[Router]
+        """
+        pass
+
+    @abstractmethod
+    def warmup(self, resolver: Optional[URLResolver] = None) -> None:
+        """
+        Prepare router and every router included into it for the first request:
+        import views registered by dotted import path, create URLPatterns, compile their regexes,
+        parse url templates and build resolvers and reverse dictionaries.
+        With root URLResolver finds where router is included for url_for
+        :param resolver: Optional[django.urls.URLResolver]
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def __str__(self) -> str:
         """
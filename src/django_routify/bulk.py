@@ -0,0 +1,60 @@
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+
+class RouteSpec(NamedTuple):
+    """
+    Record of one route registered with Router.add_routes.
+
+    Attributes:
+        url_path: str                   := Url path, same as for Router.route
+        view: Any                       := View, LazyView or dotted import path of view
+        methods: Optional[List[str]]    := HTTP methods, any method if empty
+        name: Optional[str]             := Name of url path
+    """
+
+    url_path: str
+    view: Any
+    methods: Optional[List[str]] = None
+    name: Optional[str] = None
+
+
+class RouteSpecError(ValueError):
+    """
+    Error of Router.add_routes with every invalid route spec.
+    Nothing from specs is registered when it is raised.
+
+    Attributes:
+        errors: List[Tuple[int, Exception]] := Index of spec and its error
+    """
+
+    def __init__(self, errors: List[Tuple[int, Exception]]) -> None:
+        """
+        Initial method for RouteSpecError.
+        :param errors: List[Tuple[int, Exception]]
+        """
+
+        self.errors = errors
+        lines = [f'{len(errors)} route specs are invalid:']
+        lines.extend(
+            f'  spec {index}: {type(error).__name__}: {error}'
+            for index, error in errors
+        )
+        super().__init__('\n'.join(lines))
+
+
+def _get_spec(spec: Any) -> RouteSpec:
+    """
+    Returns RouteSpec of (url_path, view, methods, name) record,
+    methods and name may be omitted
+    :param spec: Union[RouteSpec, Tuple[Any, ...], List[Any]]
+    :return: RouteSpec
+    """
+
+    if isinstance(spec, RouteSpec):
+        return spec
+    if not isinstance(spec, (tuple, list)) or not 2 <= len(spec) <= 4:
+        raise TypeError(
+            f'Expected route spec to be (url_path, view, methods, name) record, '
+            f'instead got {spec!r}'
+        )
+    return RouteSpec(*spec)
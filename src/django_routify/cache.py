@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional
+
+from .validator import _validate_type
+
+
+class LRUCache:
+    """
+    Bounded cache with least recently used eviction.
+    Safe for threads and asyncio tasks, because it never awaits while locked.
+
+    Attributes:
+        max_size: int       := Maximal count of entries
+        hits: int = 0       := Count of found keys
+        misses: int = 0     := Count of not found keys
+        evictions: int = 0  := Count of entries removed to free space
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initial method for LRUCache.
+        :param max_size: int
+        """
+
+        _validate_type('max_size', max_size, int)
+        if max_size < 1:
+            raise ValueError(f'Expected "max_size" to be positive, instead got {max_size}')
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns value of key and marks it as recently used
+        :param key: Hashable
+        :param default: Any
+        :return: Any
+        """
+
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Set value of key, evicting least recently used entry if cache is full
+        :param key: Hashable
+        :param value: Any
+        :return: None
+        """
+
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove key and returns its value
+        :param key: Hashable
+        :param default: Any
+        :return: Any
+        """
+
+        with self.__lock:
+            return self.__entries.pop(key, default)
+
+    def clear(self) -> None:
+        """
+        Remove every entry, statistics are kept
+        :return: None
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        stats getter\n
+        Size and counters of cache
+        :return: Dict[str, int]
+        """
+        return {
+            'size': len(self),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __repr__(self) -> str:
+        return f'LRUCache(size={len(self)}, max_size={self.max_size})'
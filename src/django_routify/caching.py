@@ -0,0 +1,494 @@
+import asyncio
+import re
+
+from functools import update_wrapper
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+from .cache import LRUCache
+from .lazy import LazyView
+from .loop import persistent_loop
+from .validator import _validate_type
+
+SAFE_METHODS = ('GET', 'HEAD')
+'Methods which responses are cached'
+
+CACHED_RESPONSE = Tuple[int, str, List[Tuple[str, str]], bytes]
+'Status code, reason phrase, headers and content of cached response'
+
+VARY_DELIMITER = re.compile(r'\s*,\s*')
+'Delimiter of headers listed in Vary header'
+
+PRIVATE_META = ('HTTP_COOKIE', 'HTTP_AUTHORIZATION', 'CSRF_COOKIE', 'CSRF_COOKIE_NEEDS_UPDATE')
+'Keys of META which are not copied into request of background refresh'
+
+
+class CachePolicy:
+    """
+    Options of in-process response cache of route, e.g. CachePolicy(ttl=30, max_entries=10_000).
+    Responses of GET and HEAD requests are cached by method, host, path, args and kwargs of view,
+    normalized query and values of listed request headers, or by method and key returned by "key" function.
+    Requests with Authorization header or session cookie are not cached by default key,
+    "key" function must include user of such requests into key or return None for them.
+    Each route registered with the policy has its own cache.
+
+    Attributes:
+        ttl: float                      := Seconds response is fresh
+        max_entries: int = 1024         := Max count of responses, least recently used are evicted
+        key: Optional[Callable] = None  := Returns key of request from request, args and kwargs of view, None to skip cache
+        vary: Tuple[str, ...] = ()      := Request headers which responses vary on
+        stale: float = 0                := Seconds after ttl stale response is served while it is refreshed in background
+    """
+
+    __slots__ = ('ttl', 'max_entries', 'key', 'vary', 'stale')
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 1024,
+        key: Optional[Callable[..., Optional[Hashable]]] = None,
+        vary: Sequence[str] = (),
+        stale: float = 0,
+    ) -> None:
+        """
+        Initial method for CachePolicy.
+        :param ttl: float
+        :param max_entries: int
+        :param key: Optional[Callable[..., Optional[Hashable]]]
+        :param vary: Sequence[str]
+        :param stale: float
+        """
+
+        _validate_type('ttl', ttl, (int, float))
+        _validate_type('max_entries', max_entries, int)
+        _validate_type('vary', vary, (list, tuple))
+        _validate_type('stale', stale, (int, float))
+        if key is not None and not callable(key):
+            raise TypeError(f'Expected "key" to be callable, instead got {key!r}')
+        if ttl <= 0:
+            raise ValueError(f'Expected "ttl" to be positive, instead got {ttl}')
+        if max_entries < 1:
+            raise ValueError(f'Expected "max_entries" to be positive, instead got {max_entries}')
+        if stale < 0:
+            raise ValueError(f'Expected "stale" to be not negative, instead got {stale}')
+        for header in vary:
+            _validate_type('vary', header, str)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.key = key
+        self.vary = tuple(header.lower() for header in vary)
+        self.stale = stale
+
+    def get_key(self, request: HttpRequest, args: tuple, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Returns cache key of request, None if response must not be cached
+        :param request: django.http.HttpRequest
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: Optional[Hashable]
+        """
+
+        if self.key is not None:
+            key = self.key(request, *args, **kwargs)
+            return None if key is None else (request.method, key)
+
+        # responses of authenticated requests must not be served to other users
+        if 'HTTP_AUTHORIZATION' in request.META or settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+
+        query = tuple(sorted((name, tuple(values)) for name, values in request.GET.lists()))
+        headers = tuple(request.headers.get(header) for header in self.vary)
+        # host and params of host patterns select tenant, responses of tenants must not be shared
+        params = args, tuple(sorted(kwargs.items()))
+        return request.method, request.get_host(), request.path, params, query, headers
+
+    def __repr__(self) -> str:
+        return f'CachePolicy(ttl={self.ttl!r}, max_entries={self.max_entries!r}, stale={self.stale!r})'
+
+
+def _is_cacheable(request: HttpRequest, response: HttpResponse, vary: Tuple[str, ...]) -> bool:
+    """
+    Returns can response be served to other requests with the same key.
+    Responses which vary on not listed headers, set cookies or were built
+    with session or CSRF token of request are not cached
+    :param request: django.http.HttpRequest
+    :param response: django.http.HttpResponse
+    :param vary: Tuple[str, ...] := Lower cased request headers of policy
+    :return: bool
+    """
+
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+        return False # template response middleware must render it
+
+    cache_control = response.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control or 'private' in cache_control:
+        return False
+    if response.has_header('Vary'):
+        for header in VARY_DELIMITER.split(response['Vary']):
+            if header.strip().lower() not in vary:
+                return False
+
+    session = getattr(request, 'session', None)
+    if session is not None and getattr(session, 'accessed', False):
+        return False
+    return not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+
+
+class RefreshRequest(HttpRequest):
+    """
+    Copy of request for background refresh of its cached response, which outlives request.
+    Method, path, query, scheme and headers are copied,
+    body, cookies, authorization, session and user of request are not
+    """
+
+    def __init__(self, request: HttpRequest) -> None:
+        """
+        Initial method for RefreshRequest.
+        :param request: django.http.HttpRequest
+        """
+
+        super().__init__()
+        self.method = request.method
+        self.path = request.path
+        self.path_info = request.path_info
+        self.GET = request.GET.copy()
+        self.META = {
+            key: value
+            for key, value in request.META.items()
+            if isinstance(value, str) and key not in PRIVATE_META
+        }
+        self.resolver_match = request.resolver_match
+        if hasattr(request, 'urlconf'):
+            self.urlconf = request.urlconf
+        if hasattr(request, 'user'):
+            from django.contrib.auth.models import AnonymousUser
+
+            self.user = AnonymousUser() # only requests without session are cached
+        self.__scheme = request.scheme
+
+    def _get_scheme(self) -> str:
+        return self.__scheme
+
+
+class ResponseCache:
+    """
+    In-process cache of responses of one route.
+    Concurrent misses of the same key are coalesced, only the first request calls view.
+    Stale responses are served while one background refresh of key runs.
+
+    Attributes:
+        policy: CachePolicy             := Options of cache
+        store: LRUCache                 := Cached responses with their fresh and stale deadlines by key
+        stale_hits: int = 0             := Count of stale responses served
+        refreshes: int = 0              := Count of background refreshes started
+    """
+
+    def __init__(self, policy: CachePolicy) -> None:
+        """
+        Initial method for ResponseCache.
+        :param policy: CachePolicy
+        """
+
+        _validate_type('cache', policy, CachePolicy)
+        self.policy = policy
+        self.store = LRUCache(policy.max_entries)
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.__lock = Lock()
+        self.__pending: Dict[Hashable, Any] = {}
+        self.__refreshing: Set[Hashable] = set()
+        self.__tasks: Set[asyncio.Task] = set()
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[HttpResponse], bool]:
+        """
+        Returns cached response of key or None, and must key be refreshed in background
+        :param key: Hashable
+        :return: Tuple[Optional[django.http.HttpResponse], bool]
+        """
+
+        entry = self.store.get(key)
+        if entry is None:
+            return None, False
+
+        cached, expires, stale_until = entry
+        now = monotonic()
+        if now < expires:
+            return _thaw(cached), False
+        if now >= stale_until:
+            return None, False
+
+        with self.__lock:
+            self.stale_hits += 1
+            refresh = key not in self.__refreshing
+            if refresh:
+                self.__refreshing.add(key)
+                self.refreshes += 1
+        return _thaw(cached), refresh
+
+    def put(self, key: Hashable, request: HttpRequest, response: HttpResponse) -> None:
+        """
+        Cache response of key if it can be served to other requests
+        :param key: Hashable
+        :param request: django.http.HttpRequest
+        :param response: django.http.HttpResponse
+        :return: None
+        """
+
+        if not _is_cacheable(request, response, self.policy.vary):
+            return
+
+        cached = (response.status_code, response.reason_phrase, list(response.items()), response.content)
+        expires = monotonic() + self.policy.ttl
+        self.store.set(key, (cached, expires, expires + self.policy.stale))
+
+    def fill(self, key: Hashable, request: HttpRequest, view: Callable, args: tuple, kwargs: Dict[str, Any]) -> HttpResponse:
+        """
+        Returns response of sync view for missed key, requests waiting for the same key
+        get cached response of the first one
+        :param key: Hashable
+        :param request: django.http.HttpRequest
+        :param view: Callable
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: django.http.HttpResponse
+        """
+
+        with self.__lock:
+            pending = self.__pending.get(key)
+            if pending is None:
+                event = self.__pending[key] = Event()
+
+        if pending is not None:
+            if isinstance(pending, Event):
+                pending.wait()
+                response, _ = self.lookup(key)
+                if response is not None:
+                    return response
+            return view(request, *args, **kwargs) # not cacheable or filled by async view
+
+        try:
+            response = view(request, *args, **kwargs)
+            self.put(key, request, response)
+            return response
+        finally:
+            with self.__lock:
+                del self.__pending[key]
+            event.set()
+
+    async def afill(
+        self,
+        key: Hashable,
+        request: HttpRequest,
+        view: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> HttpResponse:
+        """
+        Returns response of async view for missed key, requests waiting for the same key
+        in the same event loop get cached response of the first one
+        :param key: Hashable
+        :param request: django.http.HttpRequest
+        :param view: Callable
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: django.http.HttpResponse
+        """
+
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            pending = self.__pending.get(key)
+            if pending is None:
+                event = asyncio.Event()
+                self.__pending[key] = (loop, event)
+
+        if pending is not None:
+            if isinstance(pending, tuple) and pending[0] is loop:
+                await pending[1].wait()
+                response, _ = self.lookup(key)
+                if response is not None:
+                    return response
+            return await view(request, *args, **kwargs) # not cacheable or filled in other thread
+
+        try:
+            response = await view(request, *args, **kwargs)
+            self.put(key, request, response)
+            return response
+        finally:
+            with self.__lock:
+                del self.__pending[key]
+            event.set()
+
+    def refresh(self, key: Hashable, request: HttpRequest, view: Callable, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """
+        Call sync view again with copy of request and cache its response, run in background thread.
+        Stale response is kept if view fails
+        :param key: Hashable
+        :param request: django.http.HttpRequest
+        :param view: Callable
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: None
+        """
+
+        try:
+            self.put(key, request, view(request, *args, **kwargs))
+        except Exception:
+            pass # the next stale hit tries again
+        finally:
+            with self.__lock:
+                self.__refreshing.discard(key)
+            connections.close_all() # connections of this thread are not closed by request_finished
+
+    def refresh_async(
+        self,
+        key: Hashable,
+        request: HttpRequest,
+        view: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Start background refresh of async view, in running event loop under ASGI
+        and in persistent one, otherwise in persistent event loop,
+        which outlives event loop of request under WSGI
+        :param key: Hashable
+        :param request: django.http.HttpRequest := Request the refresh is started by
+        :param view: Callable
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: None
+        """
+
+        refresh = self.arefresh(key, RefreshRequest(request), view, args, kwargs)
+        loop = asyncio.get_running_loop()
+        if isinstance(request, ASGIRequest) or loop is persistent_loop.loop:
+            task = loop.create_task(refresh)
+            self.__tasks.add(task) # event loop keeps only weak references of tasks
+            task.add_done_callback(self.__tasks.discard)
+        else:
+            persistent_loop.submit(refresh)
+
+    async def arefresh(
+        self,
+        key: Hashable,
+        request: HttpRequest,
+        view: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Call async view again and cache its response, run in background by refresh_async.
+        Stale response is kept if view fails
+        :param key: Hashable
+        :param request: django.http.HttpRequest
+        :param view: Callable
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :return: None
+        """
+
+        try:
+            self.put(key, request, await view(request, *args, **kwargs))
+        except Exception:
+            pass # the next stale hit tries again
+        finally:
+            with self.__lock:
+                self.__refreshing.discard(key)
+
+    def clear(self) -> None:
+        """
+        Remove every cached response, e.g. after data of route is changed
+        :return: None
+        """
+        self.store.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        stats getter\n
+        Size and counters of cache
+        :return: Dict[str, int]
+        """
+        return {**self.store.stats, 'stale_hits': self.stale_hits, 'refreshes': self.refreshes}
+
+    def __repr__(self) -> str:
+        return f'ResponseCache({self.policy!r}, size={len(self.store)})'
+
+
+def _thaw(cached: CACHED_RESPONSE) -> HttpResponse:
+    """
+    Returns new response built from cached one, so requests never share response objects
+    :param cached: Tuple[int, str, List[Tuple[str, str]], bytes]
+    :return: django.http.HttpResponse
+    """
+
+    status, reason, headers, content = cached
+    response = HttpResponse(content, status=status, reason=reason)
+    for header, value in headers:
+        response[header] = value
+    return response
+
+
+def cache_view(view: Callable, cache: ResponseCache) -> Callable:
+    """
+    Returns view which serves responses of GET and HEAD requests from cache,
+    in the same mode as view, so async views stay async
+    :param view: Callable
+    :param cache: ResponseCache
+    :return: Callable
+    """
+
+    policy = cache.policy
+
+    if iscoroutinefunction(view):
+        async def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method not in SAFE_METHODS:
+                return await view(request, *args, **kwargs)
+            key = policy.get_key(request, args, kwargs)
+            if key is None:
+                return await view(request, *args, **kwargs)
+
+            response, refresh = cache.lookup(key)
+            if response is None:
+                return await cache.afill(key, request, view, args, kwargs)
+            if refresh:
+                cache.refresh_async(key, request, view, args, kwargs)
+            return response
+    else:
+        def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method not in SAFE_METHODS:
+                return view(request, *args, **kwargs)
+            key = policy.get_key(request, args, kwargs)
+            if key is None:
+                return view(request, *args, **kwargs)
+
+            response, refresh = cache.lookup(key)
+            if response is None:
+                return cache.fill(key, request, view, args, kwargs)
+            if refresh:
+                refresh_request = RefreshRequest(request)
+                Thread(target=cache.refresh, args=(key, refresh_request, view, args, kwargs), daemon=True).start()
+            return response
+
+    # state of not imported view is not copied, only its declared metadata
+    if isinstance(view, LazyView):
+        update_wrapper(wrapped, view, updated=())
+        wrapped.csrf_exempt = view.csrf_exempt
+    else:
+        update_wrapper(wrapped, view)
+    wrapped.cache = cache
+    return wrapped
@@ -0,0 +1,208 @@
+import dis
+
+from functools import update_wrapper
+from inspect import iscoroutine, isfunction, unwrap
+from types import CodeType
+from typing import Any, Callable, List, Optional, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+REQUEST_ATTRIBUTES = ('request', 'args', 'kwargs')
+'Attributes set on instance of class based view by View.setup for each request'
+
+
+def _is_async_view_class(view_class: Type[View]) -> bool:
+    """
+    Returns are handlers of class based view coroutine functions,
+    checked the same way as View.view_is_async of Django >= 4.1
+    :param view_class: Type[django.views.View]
+    :return: bool
+    """
+
+    handlers = [
+        getattr(view_class, method)
+        for method in view_class.http_method_names
+        if method != 'options' and hasattr(view_class, method)
+    ]
+    if not handlers:
+        return False
+
+    is_async = iscoroutinefunction(handlers[0])
+    if not all(iscoroutinefunction(handler) == is_async for handler in handlers[1:]):
+        raise ImproperlyConfigured(
+            f'{view_class.__qualname__} HTTP handlers must either be all sync or all async.'
+        )
+    return is_async
+
+
+def as_view(view_class: Type[View]) -> Callable:
+    """
+    Returns view of class based view, which is a coroutine function
+    if its handlers are coroutine functions, so dispatcher of url path
+    calls it natively instead of adapting it in thread.
+    Django >= 4.1 marks such views itself, on older versions
+    view is wrapped into coroutine function
+    :param view_class: Type[django.views.View]
+    :return: Callable
+    """
+
+    view = view_class.as_view()
+    if iscoroutinefunction(view) or not _is_async_view_class(view_class):
+        return view
+
+    async def async_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        response = view(request, *args, **kwargs)
+        # options and http_method_not_allowed are sync before Django 4.1
+        if iscoroutine(response):
+            response = await response
+        return response
+
+    update_wrapper(async_view, view)
+    return async_view
+
+
+SETATTR_NAMES = ('setattr', 'delattr', '__setattr__', '__delattr__')
+'Builtins and methods which assign attributes of any object by name, instance of view included'
+
+
+def _loads_self(instruction: dis.Instruction, name: str) -> bool:
+    """
+    Returns is instruction loading of local or closure variable name onto stack top
+    :param instruction: dis.Instruction
+    :param name: str
+    :return: bool
+    """
+
+    if instruction.opname in ('LOAD_FAST', 'LOAD_FAST_CHECK', 'LOAD_FAST_BORROW', 'LOAD_DEREF'):
+        return instruction.argval == name
+    if instruction.opname in ('LOAD_FAST_LOAD_FAST', 'LOAD_FAST_BORROW_LOAD_FAST_BORROW'): # Python >= 3.13
+        return instruction.argval[-1] == name
+    return False
+
+
+def _get_code_state(code: CodeType, name: Optional[str]) -> List[str]:
+    """
+    Returns state code keeps in instance of variable name, with state of nested functions,
+    lambdas and comprehensions which use it from closure
+    :param code: CodeType
+    :param name: Optional[str] := Name of variable of instance, None if code has no access to it
+    :return: List[str]
+    """
+
+    state = []
+    previous = None
+    for instruction in dis.get_instructions(code):
+        if instruction.opname in ('LOAD_GLOBAL', 'LOAD_NAME', 'LOAD_ATTR', 'LOAD_METHOD'):
+            if instruction.argval in SETATTR_NAMES:
+                state.append(instruction.argval)
+        if previous is not None and _loads_self(previous, name):
+            if instruction.opname in ('STORE_ATTR', 'DELETE_ATTR'):
+                state.append(f'self.{instruction.argval}')
+            elif instruction.opname in ('LOAD_ATTR', 'LOAD_METHOD') and (
+                instruction.argval in REQUEST_ATTRIBUTES or instruction.argval == '__dict__'
+            ):
+                state.append(f'self.{instruction.argval}')
+        previous = instruction
+
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            # setattr is stateful in any nested code, instance only in code which closes over it
+            nested = name if name in const.co_freevars else None
+            state.extend(_get_code_state(const, nested))
+    return state
+
+
+def _get_instance_state(func: Any) -> List[str]:
+    """
+    Returns attributes of instance which method assigns, deletes,
+    or reads from the ones set by View.setup for each request,
+    and setattr like builtins it uses, nested code included
+    :param func: Callable := Function defined in class
+    :return: List[str]
+    """
+
+    code = getattr(unwrap(func), '__code__', None)
+    if code is None:
+        return []
+    return _get_code_state(code, code.co_varnames[0] if code.co_argcount else None)
+
+
+def _validate_stateless(view_class: Type[View]) -> None:
+    """
+    Raise ValueError if class based view keeps state of request in its instance,
+    View.__init__, setup and dispatch must not be overridden,
+    and methods must not assign attributes of instance, use setattr or read request, args and kwargs of it
+    :param view_class: Type[django.views.View]
+    :return: None
+    """
+
+    errors = []
+    for method in ('__init__', 'setup', 'dispatch'):
+        if getattr(view_class, method) is not getattr(View, method):
+            errors.append(f'overrides {method}()')
+
+    for klass in view_class.__mro__:
+        if klass is View or klass is object:
+            continue
+        for attribute, func in vars(klass).items():
+            if not isfunction(func):
+                continue # static and class methods, properties and attributes
+            for state in dict.fromkeys(_get_instance_state(func)):
+                errors.append(f'uses {state} in {klass.__qualname__}.{attribute}()')
+
+    if errors:
+        raise ValueError(
+            f'Class based view {view_class.__qualname__} is not stateless, it ' + ', '.join(errors)
+        )
+
+
+def stateless_view(view_class: Type[View]) -> Callable:
+    """
+    Returns view of stateless class based view, which has one instance
+    and handlers bound to it once, so requests do not create instances,
+    call setup and dispatch. Class is validated by _validate_stateless
+    :param view_class: Type[django.views.View]
+    :return: Callable
+    """
+
+    _validate_stateless(view_class)
+    is_async = _is_async_view_class(view_class)
+
+    instance = view_class()
+    handlers = {
+        method: getattr(instance, method)
+        for method in view_class.http_method_names
+        if hasattr(instance, method)
+    }
+    if 'get' in handlers and 'head' not in handlers:
+        handlers['head'] = handlers['get'] # the same as View.setup
+    not_allowed = instance.http_method_not_allowed
+
+    if is_async:
+        async def view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            handler = handlers.get(request.method.lower(), not_allowed)
+            response = handler(request, *args, **kwargs)
+            # options and http_method_not_allowed are sync before Django 4.1
+            if iscoroutine(response):
+                response = await response
+            return response
+    else:
+        def view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            return handlers.get(request.method.lower(), not_allowed)(request, *args, **kwargs)
+
+    # the same attributes as view of View.as_view
+    view.view_class = view_class
+    view.view_initkwargs = {}
+    view.__doc__ = view_class.__doc__
+    view.__module__ = view_class.__module__
+    view.__annotations__ = view_class.dispatch.__annotations__
+    view.__dict__.update(view_class.dispatch.__dict__)
+    view.stateless = True
+    return view
@@ -0,0 +1,481 @@
+import getpass
+import hashlib
+import hmac
+import marshal
+import os
+import sys
+import tempfile
+import types
+
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import URLPattern
+
+from .radix import RadixNode, RadixTree
+
+CODEGEN_VERSION = 2
+'Version of generated code, part of the route table hash'
+
+MODULE_PREFIX = 'django_routify_compiled_'
+'Prefix of generated module names'
+
+MAX_CACHED_MODULES = 64
+'Max count of generated modules kept in cache directory, the least recently used are removed'
+
+_references: Dict[str, int] = {}
+'Count of CompiledRoutes using each generated module imported into sys.modules'
+_lock = Lock()
+'Lock of importing and releasing generated modules'
+
+
+class CompiledRoutes:
+    """
+    Routes compiled into a generated Python module.
+
+    Attributes:
+        patterns: List[URLPattern]  := Patterns the module was generated from
+        module: ModuleType          := Imported generated module
+        path: str                   := Path of generated module in cache directory
+    """
+
+    def __init__(self, patterns: List[URLPattern], module: Any, path: str) -> None:
+        """
+        Initial method for CompiledRoutes.
+        :param patterns: List[django.urls.URLPattern]
+        :param module: ModuleType
+        :param path: str
+        """
+
+        self.patterns = patterns
+        self.module = module
+        self.path = path
+
+    @property
+    def dispatch(self) -> Callable[[str], List[Tuple[int, Optional[Dict[str, Any]]]]]:
+        """
+        dispatch getter\n
+        Generated function which returns sorted (pattern index, converted kwargs) pairs
+        for path, kwargs equal None if pattern must be resolved by Django
+        :return: Callable[[str], List[Tuple[int, Optional[Dict[str, Any]]]]]
+        """
+        return self.module.dispatch
+
+
+def get_cache_dir() -> str:
+    """
+    Returns directory for generated modules, ROUTIFY_CACHE_DIR setting
+    or private "django_routify-<user id>" in temporary directory
+    :return: str
+    """
+
+    cache_dir = None
+    if settings.configured:
+        cache_dir = getattr(settings, 'ROUTIFY_CACHE_DIR', None)
+    if cache_dir:
+        return str(cache_dir)
+
+    user = os.getuid() if hasattr(os, 'getuid') else getpass.getuser()
+    return os.path.join(tempfile.gettempdir(), f'django_routify-{user}')
+
+
+def _check_cache_dir(cache_dir: str) -> None:
+    """
+    Create cache directory readable only by current user if it does not exist,
+    and refuse directory other users own or can write to,
+    because modules from it are executed
+    :param cache_dir: str
+    :return: None
+    """
+
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):
+        return # temporary directory is private to user on Windows
+
+    stat = os.lstat(cache_dir)
+    if os.path.islink(cache_dir) or stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        raise ImproperlyConfigured(
+            f'Cache directory "{cache_dir}" of compiled routes must be owned '
+            f'and writable only by current user, set ROUTIFY_CACHE_DIR to private directory'
+        )
+
+
+SIGNATURE = b'\n# routify signature: '
+'Separator of signature appended to cached source and code'
+
+
+def _sign(digest: str, content: bytes) -> bytes:
+    """
+    Returns content with signature appended, hash of route table and content
+    keyed with SECRET_KEY, so changed artifacts or artifacts of other route tables are never executed.
+    Signature is the last line, so lines of cached source match lines of generated one
+    :param digest: str := Hash of route table
+    :param content: bytes
+    :return: bytes
+    """
+
+    key = ''
+    if settings.configured:
+        try:
+            key = settings.SECRET_KEY
+        except ImproperlyConfigured:
+            pass # private cache directory still keeps artifacts of other users out
+    key = str(key).encode('utf-8')
+    message = digest.encode('ascii') + hashlib.sha256(content).digest()
+    return content + SIGNATURE + hmac.new(key, message, hashlib.sha256).hexdigest().encode('ascii')
+
+
+def _read(file_path: str, digest: str) -> Optional[bytes]:
+    """
+    Returns content of cached artifact, None if it does not exist
+    or its signature does not match route table and content
+    :param file_path: str
+    :param digest: str := Hash of route table
+    :return: Optional[bytes]
+    """
+
+    try:
+        with open(file_path, 'rb') as file:
+            signed = file.read()
+    except OSError:
+        return None
+
+    content, separator, _ = signed.rpartition(SIGNATURE)
+    if not separator or not hmac.compare_digest(signed, _sign(digest, content)):
+        return None
+    return content
+
+
+def _get_converters(tree: RadixTree) -> Tuple[List[Any], Dict[Tuple[int, str], int]]:
+    """
+    Returns unique converters in order of first use
+    and their positions by (pattern index, parameter name)
+    :param tree: django_routify.radix.RadixTree
+    :return: Tuple[List[Any], Dict[Tuple[int, str], int]]
+    """
+
+    converters = []
+    positions = {}
+    seen = {}
+    for index, segments in enumerate(tree.segments):
+        for segment, regex, parameter in segments or ():
+            if parameter is None:
+                continue
+
+            converter = tree.patterns[index].pattern.converters[parameter]
+            if id(converter) not in seen:
+                seen[id(converter)] = len(converters)
+                converters.append(converter)
+            positions[(index, parameter)] = seen[id(converter)]
+
+    return converters, positions
+
+
+def _get_table(prefix: str, tree: RadixTree) -> list:
+    """
+    Returns route table description, which generated module depends on
+    :param prefix: str
+    :param tree: django_routify.radix.RadixTree
+    :return: list
+    """
+
+    converters, positions = _get_converters(tree)
+
+    table = [CODEGEN_VERSION, prefix]
+    table.extend(type(converter).__qualname__ for converter in converters)
+    for index, segments in enumerate(tree.segments):
+        url_pattern = tree.patterns[index]
+        if segments is None:
+            table.append(None)
+            continue
+
+        params = []
+        for segment, regex, parameter in segments:
+            if parameter is not None:
+                params.append((parameter, positions[(index, parameter)], segment))
+            else:
+                params.append(segment)
+
+        table.append((str(url_pattern.pattern), url_pattern.name, params))
+
+    return table
+
+
+def _generate(tree: RadixTree) -> str:
+    """
+    Generate source of module with dispatch function for radix tree.
+    Every node becomes a function with inlined segment checks
+    :param tree: django_routify.radix.RadixTree
+    :return: str
+    """
+
+    lines = [
+        '# Generated by django_routify.codegen, do not edit.',
+        'import re',
+        '',
+    ]
+    regexes: Dict[str, str] = {}
+    static_tables: List[str] = []
+    functions: List[str] = []
+    sources: List[str] = []
+
+    converters, positions = _get_converters(tree)
+    converter_names = [f'_C{position}' for position in range(len(converters))]
+
+    def regex_name(regex: str) -> str:
+        if regex not in regexes:
+            regexes[regex] = f'_R{len(regexes)}'
+            lines.append(f'{regexes[regex]} = re.compile({regex!r})')
+        return regexes[regex]
+
+    def leaf(index: int) -> List[str]:
+        values = []
+        for position, (segment, regex, parameter) in enumerate(tree.segments[index]):
+            if parameter is not None:
+                converter = converter_names[positions[(index, parameter)]]
+                values.append(f'{parameter!r}: {converter}.to_python(segments[{position}])')
+
+        if not values:
+            return [f'        found.append(({index}, {{}}))']
+        return [
+            '        try:',
+            f'            found.append(({index}, {{{", ".join(values)}}}))',
+            '        except ValueError:',
+            '            pass',
+        ]
+
+    def node_function(node: RadixNode, level: int) -> str:
+        name = f'_n{len(functions)}'
+        functions.append(name)
+
+        body = [
+            f'def {name}(segments, depth, found):',
+            f'    if depth == {level}:',
+        ]
+        for index in node.routes:
+            body.extend(leaf(index))
+        body.append('        return')
+
+        if node.static or node.dynamic:
+            body.append(f'    segment = segments[{level}]')
+
+        if len(node.static) == 1:
+            segment, child = next(iter(node.static.items()))
+            body.append(f'    if segment == {segment!r}:')
+            body.append(f'        {node_function(child, level + 1)}(segments, depth, found)')
+        elif node.static:
+            children = {
+                segment: node_function(child, level + 1)
+                for segment, child in node.static.items()
+            }
+            table = f'_S{len(static_tables)}'
+            static_tables.append(
+                f'{table} = {{' + ', '.join(
+                    f'{segment!r}: {child}' for segment, child in children.items()
+                ) + '}'
+            )
+            body.append(f'    child = {table}.get(segment)')
+            body.append('    if child is not None:')
+            body.append('        child(segments, depth, found)')
+
+        for regex, (_, child) in node.dynamic.items():
+            body.append(f'    if {regex_name(regex)}.fullmatch(segment):')
+            body.append(f'        {node_function(child, level + 1)}(segments, depth, found)')
+
+        sources.append('\n'.join(body))
+        return name
+
+    root = node_function(tree.root, 0)
+
+    lines.append('')
+    lines.extend(f'{converter} = None' for converter in converter_names)
+    lines.append('')
+    lines.append('')
+    lines.append('def bind(converters):')
+    if converter_names:
+        lines.append(f'    global {", ".join(converter_names)}')
+        lines.append(f'    {", ".join(converter_names)}, = converters')
+    else:
+        lines.append('    pass')
+    lines.append('')
+    lines.append('')
+    lines.append('\n\n\n'.join(sources))
+    lines.append('')
+    lines.append('')
+    lines.extend(static_tables)
+    lines.append(f'_FALLBACK = {tuple((index, None) for index in tree.fallback)!r}')
+    lines.append('')
+    lines.append('')
+    lines.append('def _index(item):')
+    lines.append('    return item[0]')
+    lines.append('')
+    lines.append('')
+    lines.append('def dispatch(path):')
+    lines.append("    segments = path.split('/')")
+    lines.append('    found = list(_FALLBACK)')
+    lines.append(f'    {root}(segments, len(segments), found)')
+    lines.append('    if len(found) > 1:')
+    lines.append('        found.sort(key=_index)')
+    lines.append('    return found')
+    lines.append('')
+
+    return '\n'.join(lines)
+
+
+def _write(file_path: str, content: bytes) -> None:
+    """
+    Write file into temporary file first and move it,
+    so other processes never read half of file
+    :param file_path: str
+    :param content: bytes
+    :return: None
+    """
+
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(content)
+    os.replace(temporary_path, file_path)
+
+
+def compile_routes(
+    prefix: str,
+    patterns: List[URLPattern],
+    cache_dir: Optional[str] = None,
+) -> CompiledRoutes:
+    """
+    Compile patterns into a generated module, which is written to cache directory
+    keyed by hash of the route table and imported from there.
+    Cached source and code are signed, unsigned or changed ones are generated again
+    :param prefix: str
+    :param patterns: List[django.urls.URLPattern]
+    :param cache_dir: Optional[str]
+    :return: django_routify.codegen.CompiledRoutes
+    """
+
+    tree = RadixTree(patterns)
+    table = _get_table(prefix, tree)
+    digest = hashlib.sha256(repr(table).encode('utf-8')).hexdigest()[:32]
+
+    cache_dir = cache_dir or get_cache_dir()
+    module_name = MODULE_PREFIX + digest
+    module_path = os.path.join(cache_dir, f'{module_name}.py')
+    # compiled code is cached next to source even if writing bytecode is disabled
+    code_path = os.path.join(cache_dir, f'{module_name}.{sys.implementation.cache_tag}.code')
+
+    with _lock:
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = _load(tree, digest, cache_dir, module_name, module_path, code_path)
+            sys.modules[module_name] = module
+        _references[module_name] = _references.get(module_name, 0) + 1
+
+    module.bind(_get_converters(tree)[0])
+    return CompiledRoutes(tree.patterns, module, module_path)
+
+
+def _load(tree: RadixTree, digest: str, cache_dir: str, module_name: str, module_path: str, code_path: str) -> Any:
+    """
+    Returns generated module executed from signed cached code or source,
+    generated again if they are missing or invalid
+    :param tree: django_routify.radix.RadixTree
+    :param digest: str := Hash of route table
+    :param cache_dir: str
+    :param module_name: str
+    :param module_path: str
+    :param code_path: str
+    :return: ModuleType
+    """
+
+    _check_cache_dir(cache_dir)
+
+    content = _read(code_path, digest)
+    if content is not None:
+        code = marshal.loads(content)
+        try:
+            os.utime(code_path) # recently used modules are kept by _prune
+        except OSError:
+            pass # removed by other process
+    else:
+        content = _read(module_path, digest)
+        if content is not None:
+            source = content.decode('utf-8')
+        else:
+            source = _generate(tree)
+            content = source.encode('utf-8')
+            _write(module_path, _sign(digest, content))
+
+        code = compile(source, module_path, 'exec')
+        content = marshal.dumps(code)
+        _write(code_path, _sign(digest, content))
+        _prune(cache_dir)
+
+    module = types.ModuleType(module_name)
+    module.__file__ = module_path
+    exec(code, module.__dict__)
+    return module
+
+
+def _prune(cache_dir: str) -> None:
+    """
+    Remove source and code of generated modules used least recently,
+    so cache directory keeps at most MAX_CACHED_MODULES of them,
+    e.g. when routes are swapped at runtime
+    :param cache_dir: str
+    :return: None
+    """
+
+    used: Dict[str, float] = {}
+    files: Dict[str, List[str]] = {}
+    for entry in os.scandir(cache_dir):
+        if not entry.name.startswith(MODULE_PREFIX):
+            continue
+        module_name = entry.name.split('.', 1)[0]
+        try:
+            modified = entry.stat().st_mtime
+        except OSError:
+            continue # removed by other process
+        used[module_name] = max(used.get(module_name, 0), modified)
+        files.setdefault(module_name, []).append(entry.path)
+
+    for module_name in sorted(used, key=used.__getitem__, reverse=True)[MAX_CACHED_MODULES:]:
+        if module_name in sys.modules:
+            continue
+        for file_path in files[module_name]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass # removed by other process
+
+
+def release_routes(compiled: CompiledRoutes) -> None:
+    """
+    Release generated module of compiled routes, e.g. after routes are swapped at runtime.
+    Module is removed from sys.modules when no other compiled routes use it
+    :param compiled: django_routify.codegen.CompiledRoutes
+    :return: None
+    """
+
+    module_name = compiled.module.__name__
+    with _lock:
+        count = _references.get(module_name, 0) - 1
+        if count > 0:
+            _references[module_name] = count
+            return
+        _references.pop(module_name, None)
+        if sys.modules.get(module_name) is compiled.module:
+            del sys.modules[module_name]
+
+
+def compile_router(router: Any, cache_dir: Optional[str] = None) -> CompiledRoutes:
+    """
+    Compile routes of router into a generated module
+    :param router: Router
+    :param cache_dir: Optional[str]
+    :return: django_routify.codegen.CompiledRoutes
+    """
+    return compile_routes(router.prefix, router.urls, cache_dir)
@@ -0,0 +1,456 @@
+from functools import update_wrapper
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
+from django.urls import URLPattern
+from django.urls.resolvers import RoutePattern
+from django.utils.cache import patch_vary_headers
+from django.utils.log import log_response
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+from asgiref.sync import async_to_sync
+from django.middleware.csrf import CsrfViewMiddleware
+
+from .lazy import LazyView
+from .versioning import Versioning
+
+CSRF_MIDDLEWARE = 'django.middleware.csrf.CsrfViewMiddleware'
+'Dotted import path of middleware which views of mixed CSRF exempt url paths are protected by'
+
+
+def _get_view_name(view: Callable) -> str:
+    """
+    Returns name of function based view or class of class based view
+    :param view: Callable
+    :return: str
+    """
+    return getattr(view, 'view_class', view).__name__
+
+
+def _csrf_protect(view: Callable) -> Callable:
+    """
+    Returns view checked by CsrfViewMiddleware the same way as with csrf_protect,
+    in the same mode as view, csrf_protect adapts only sync views before Django 5.0.
+    View is checked only while CsrfViewMiddleware is in MIDDLEWARE setting,
+    so it is protected the same as on url path of its own
+    :param view: Callable
+    :return: Callable
+    """
+
+    middleware = CsrfViewMiddleware(view)
+
+    if iscoroutinefunction(view):
+        async def protected(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if CSRF_MIDDLEWARE not in settings.MIDDLEWARE:
+                return await view(request, *args, **kwargs)
+            response = middleware.process_request(request) or middleware.process_view(request, view, args, kwargs)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+            return middleware.process_response(request, response)
+    else:
+        def protected(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if CSRF_MIDDLEWARE not in settings.MIDDLEWARE:
+                return view(request, *args, **kwargs)
+            response = middleware.process_request(request) or middleware.process_view(request, view, args, kwargs)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            return middleware.process_response(request, response)
+    return protected
+
+
+class AliasPattern(URLPattern):
+    """
+    URLPattern which keeps an additional name of already registered url path.
+    It is used only for reversing and never matches while resolving.
+    """
+
+    def resolve(self, path: str) -> None:
+        return None
+
+
+class ViewRecord(NamedTuple):
+    """
+    Registration of view in Router with its options,
+    views are registered again from their records when routes are changed at runtime.
+
+    Attributes:
+        view: Any                       := Registered view, class based view or LazyView
+        as_view: Optional[Callable]     := View called by dispatcher, None until record is built
+        url_path: str                   := Normalized url path
+        name: Optional[str]             := Name of url path
+        methods: Optional[List[str]]    := Upper cased HTTP methods, any method if empty
+        key: Optional[str]              := Key of registration in manifest
+        version: Optional[str]          := API version served by view
+        fast: bool                      := Is view served by fast lane
+        middleware: List[Any]           := Middleware factories of route
+        executor: Optional[str]         := Route executor of route
+        stateless: bool                 := Is class based view dispatched by one instance
+        cache: Optional[Any]            := ResponseCache of route
+    """
+
+    view: Any
+    as_view: Optional[Callable]
+    url_path: str
+    name: Optional[str]
+    methods: Optional[List[str]]
+    key: Optional[str]
+    version: Optional[str]
+    fast: bool
+    middleware: List[Any]
+    executor: Optional[str]
+    stateless: bool
+    cache: Optional[Any]
+
+
+class RouteRecord:
+    """
+    Compact record of url path registered in Router.
+    Its URLPattern is created only when urls of router are accessed for the first time,
+    so routers which are never included do not keep Django patterns.
+
+    Attributes:
+        url_path: str                   := Normalized url path
+        name: Optional[str]             := Name of url path
+        dispatcher: MethodDispatcher    := Dispatcher of url path, its view is the callback
+        alias: bool                     := Is it an additional name of url path, used only for reversing
+    """
+
+    __slots__ = ('url_path', 'name', 'dispatcher', 'alias')
+
+    def __init__(
+        self,
+        url_path: str,
+        name: Optional[str],
+        dispatcher: 'MethodDispatcher',
+        alias: bool = False,
+    ) -> None:
+        """
+        Initial method for RouteRecord.
+        :param url_path: str
+        :param name: Optional[str]
+        :param dispatcher: MethodDispatcher
+        :param alias: bool
+        """
+
+        self.url_path = url_path
+        self.name = name
+        self.dispatcher = dispatcher
+        self.alias = alias
+
+    def materialize(self) -> URLPattern:
+        """
+        Returns URLPattern of record, dispatcher must be built before
+        :return: django.urls.URLPattern
+        """
+
+        pattern_class = AliasPattern if self.alias else URLPattern
+        url_pattern = pattern_class(
+            RoutePattern(self.url_path, name=self.name, is_endpoint=True),
+            self.dispatcher.view,
+            name=self.name,
+        )
+        self.dispatcher.url_patterns.append(url_pattern)
+        return url_pattern
+
+    def __repr__(self) -> str:
+        return f'RouteRecord({self.url_path!r}, name={self.name!r}, alias={self.alias})'
+
+
+class MethodDispatcher:
+    """
+    Table of HTTP method -> view for one url path of Router.
+    All views registered on the same url path share one URLPattern,
+    which callback selects view by request method with one dict lookup.
+    Views registered with version are selected by (method, version)
+    of request, version is taken by versioning of router.
+
+    Attributes:
+        views: Dict[str, Callable]          := Views by HTTP method
+        default: Optional[Callable] = None  := View for any HTTP method, registered without methods
+        versions: Dict[Tuple[Optional[str], str], Callable] := Views by HTTP method, None for any, and version
+        versioning: Optional[Versioning] = None := Versioning of router, needed for versioned views
+        allow: str                          := Precomputed Allow header of 405 responses
+        url_patterns: List[URLPattern]      := URLPatterns which callback is this dispatcher
+        names: List[str]                    := Names of url path, each of them has its URLPattern
+        view: Optional[Callable] = None     := Dispatching view built from the table, None until built
+        warm_kwargs: Optional[Dict[str, Any]] = None := Sample kwargs of url path for synthetic warm up requests
+        fast: Set[Optional[str]]            := Methods served by fast lane, None for any method
+    """
+
+    __slots__ = (
+        'views',
+        'default',
+        'versions',
+        'versioning',
+        'allow',
+        'url_patterns',
+        'names',
+        'view',
+        'warm_kwargs',
+        'fast',
+    )
+
+    def __init__(self, versioning: Optional[Versioning] = None) -> None:
+        """
+        Initial method for MethodDispatcher.
+        :param versioning: Optional[django_routify.versioning.Versioning]
+        """
+
+        self.views: Dict[str, Callable] = {}
+        self.default: Optional[Callable] = None
+        self.versions: Dict[Tuple[Optional[str], str], Callable] = {}
+        self.versioning = versioning
+        self.allow = ''
+        self.url_patterns: List[URLPattern] = []
+        self.names: List[str] = []
+        self.view: Optional[Callable] = None
+        self.warm_kwargs: Optional[Dict[str, Any]] = None
+        self.fast: Set[Optional[str]] = set()
+
+    def add(
+        self,
+        view: Callable,
+        methods: Optional[List[str]],
+        rebuild: bool = True,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Add view for methods into table, or for any method if methods are empty,
+        and rebuild dispatching view unless it is rebuilt later for many views.
+        With version view is selected only for requests of this version
+        :param view: Callable
+        :param methods: Optional[List[str]]
+        :param rebuild: bool
+        :param version: Optional[str]
+        :return: None
+        """
+
+        if version is not None:
+            if self.versioning is None:
+                raise ValueError(f'View "{_get_view_name(view)}" has version, but router has no "versioning" option')
+
+            keys = [(method, version) for method in methods] if methods else [(None, version)]
+            for key in keys:
+                if key in self.versions:
+                    raise ValueError(
+                        f'Method "{key[0] or "any"}" of version "{version}" is already registered '
+                        f'for this url path with view "{_get_view_name(self.versions[key])}"'
+                    )
+            for key in keys:
+                self.versions[key] = view
+        elif methods:
+            for method in methods:
+                if method in self.views:
+                    raise ValueError(
+                        f'Method "{method}" is already registered '
+                        f'for this url path with view "{_get_view_name(self.views[method])}"'
+                    )
+            for method in methods:
+                self.views[method] = view
+        else:
+            if self.default is not None:
+                raise ValueError(
+                    f'View "{_get_view_name(self.default)}" is already registered '
+                    f'for this url path without methods'
+                )
+            self.default = view
+
+        if rebuild:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Rebuild dispatching view from the table and set it as callback of url patterns
+        :return: None
+        """
+
+        self.allow = ', '.join(self.methods)
+        self.view = self._build()
+
+        for url_pattern in self.url_patterns:
+            url_pattern.callback = self.view
+
+    def _build(self) -> Callable:
+        """
+        Build dispatching view.
+        Dispatcher is a coroutine function only if every view is a coroutine function,
+        so Django does not adapt async views into sync ones, and sync views of path
+        are never run in thread under WSGI because of one async view.
+        If only some views are exempt from CSRF protection,
+        dispatcher is exempt and other views are protected by themselves.
+        Views of route executors are called by sync dispatcher without event loop,
+        and dispatcher of their path only has the same sync dispatcher as "sync_view"
+        :return: Callable
+        """
+
+        views = dict(self.views)
+        default = self.default
+        versions = dict(self.versions)
+        allow = self.allow
+
+        targets = list(views.values())
+        if default is not None:
+            targets.append(default)
+        targets.extend(versions.values())
+
+        def not_allowed(request: HttpRequest) -> HttpResponse:
+            response = HttpResponseNotAllowed(())
+            response['Allow'] = allow
+            log_response(
+                'Method Not Allowed (%s): %s',
+                request.method,
+                request.path,
+                response=response,
+                request=request,
+            )
+            return response
+
+        csrf_exempt = [getattr(target, 'csrf_exempt', False) for target in targets]
+        is_async = all(iscoroutinefunction(target) for target in targets)
+
+        def make(is_async: bool) -> Callable:
+            def adapt(view: Callable) -> Callable:
+                protect = not all(csrf_exempt) and any(csrf_exempt) and not getattr(view, 'csrf_exempt', False)
+                # views of route executors run from sync code without event loop
+                if not is_async and iscoroutinefunction(view):
+                    view = getattr(view, 'sync_view', None) or async_to_sync(view)
+                return _csrf_protect(view) if protect else view
+
+            adapted = {method: adapt(view) for method, view in views.items()}
+            adapted_versions = {key: adapt(view) for key, view in versions.items()}
+            adapted_default = None if default is None else adapt(default)
+
+            if adapted_versions:
+                return self._build_versioned(adapted, adapted_default, adapted_versions, not_allowed, is_async)
+            if is_async:
+                async def dispatcher(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+                    view = adapted.get(request.method, adapted_default)
+                    if view is None:
+                        return not_allowed(request)
+                    return await view(request, *args, **kwargs)
+            else:
+                def dispatcher(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+                    view = adapted.get(request.method, adapted_default)
+                    if view is None:
+                        return not_allowed(request)
+                    return view(request, *args, **kwargs)
+            return dispatcher
+
+        dispatcher = make(is_async)
+        dispatchers = [dispatcher]
+        # path of route executors only is served by sync dispatcher under WSGI fast lane
+        if is_async and all(hasattr(target, 'sync_view') for target in targets):
+            dispatchers.append(make(False))
+
+        # Django opens transactions of ATOMIC_REQUESTS for dispatcher,
+        # except for databases which every view opts out of
+        non_atomic_requests = [getattr(target, '_non_atomic_requests', None) for target in targets]
+
+        for wrapper in dispatchers:
+            # keep name, module and view_class of the first view for ResolverMatch and reverse,
+            # state of not imported view is not copied
+            if isinstance(targets[0], LazyView):
+                update_wrapper(wrapper, targets[0], updated=())
+            else:
+                update_wrapper(wrapper, targets[0])
+            wrapper.csrf_exempt = any(csrf_exempt)
+            if any(aliases is not None for aliases in non_atomic_requests):
+                wrapper._non_atomic_requests = set.intersection(*(set(aliases or ()) for aliases in non_atomic_requests))
+            wrapper.__dict__.pop('sync_view', None)
+            wrapper.dispatcher = self
+        if len(dispatchers) > 1:
+            dispatcher.sync_view = dispatchers[1]
+        return dispatcher
+
+    def _build_versioned(
+        self,
+        views: Dict[str, Callable],
+        default: Optional[Callable],
+        versions: Dict[Tuple[Optional[str], str], Callable],
+        not_allowed: Callable,
+        is_async: bool,
+    ) -> Callable:
+        """
+        Build dispatching view which selects view by method and version of request,
+        views without version serve versions which have no views.
+        Responses vary on header version is taken from
+        :param views: Dict[str, Callable]
+        :param default: Optional[Callable]
+        :param versions: Dict[Tuple[Optional[str], str], Callable]
+        :param not_allowed: Callable
+        :param is_async: bool
+        :return: Callable
+        """
+
+        get_version = self.versioning.get_version
+        vary = self.versioning.vary
+        allowed = frozenset(self.methods)
+        any_method = default is not None or any(method is None for method, _ in versions)
+
+        def select(request: HttpRequest) -> Optional[Callable]:
+            version = get_version(request)
+            view = versions.get((request.method, version))
+            if view is None:
+                view = versions.get((None, version)) or views.get(request.method, default)
+            return view
+
+        def add_vary(response: HttpResponse) -> None:
+            if response.has_header('Vary'):
+                patch_vary_headers(response, (vary,))
+            else:
+                response['Vary'] = vary # without parsing, most responses have no Vary
+
+        def not_acceptable(request: HttpRequest) -> HttpResponse:
+            if not any_method and request.method not in allowed:
+                return not_allowed(request)
+
+            response = HttpResponse(status=406)
+            log_response(
+                'Not Acceptable (version %s): %s',
+                get_version(request),
+                request.path,
+                response=response,
+                request=request,
+            )
+            return response
+
+        if is_async:
+            async def dispatcher(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+                view = select(request)
+                if view is None:
+                    response = not_acceptable(request)
+                else:
+                    response = await view(request, *args, **kwargs)
+                if vary:
+                    add_vary(response)
+                return response
+        else:
+            def dispatcher(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+                view = select(request)
+                if view is None:
+                    response = not_acceptable(request)
+                else:
+                    response = view(request, *args, **kwargs)
+                if vary:
+                    add_vary(response)
+                return response
+        return dispatcher
+
+    @property
+    def methods(self) -> List[str]:
+        """
+        methods getter\n
+        HTTP methods which have views, of any version
+        :return: List[str]
+        """
+        methods = dict.fromkeys(self.views)
+        methods.update((method, None) for method, _ in self.versions if method is not None)
+        return list(methods)
+
+    def __repr__(self) -> str:
+        return f'MethodDispatcher(methods={self.methods}, default={self.default is not None})'
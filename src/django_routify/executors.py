@@ -0,0 +1,292 @@
+import asyncio
+import contextvars
+import functools
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.http import HttpRequest, HttpResponse
+
+from .lazy import LazyView
+from .validator import _validate_type
+
+NON_THREAD_SENSITIVE = 'non_thread_sensitive'
+'Name of executor which runs sync views with sync_to_async(thread_sensitive=False)'
+
+
+class ExecutorMetrics(NamedTuple):
+    """
+    Metrics of route executor at the moment they were taken.
+
+    Attributes:
+        name: str               := Name of executor
+        max_workers: int        := Max count of threads
+        active: int             := Views being run now
+        queued: int             := Views waiting for free thread
+        completed: int          := Views run since executor was registered
+        utilization: float      := Share of threads running views, from 0 to 1
+    """
+
+    name: str
+    max_workers: int
+    active: int
+    queued: int
+    completed: int
+    utilization: float
+
+
+class RouteExecutor:
+    """
+    Named bounded thread pool for sync views served under ASGI,
+    so slow views run in parallel without taking the one thread
+    shared by thread sensitive views. Threads are started on the first view
+    and started again in process forked after that.
+
+    Attributes:
+        name: str                   := Name of executor
+        max_workers: int            := Max count of threads
+        active: int = 0             := Views being run now
+        queued: int = 0             := Views waiting for free thread
+        completed: int = 0          := Views run since executor was registered
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """
+        Initial method for RouteExecutor.
+        :param name: str
+        :param max_workers: int
+        """
+
+        _validate_type('name', name, str)
+        _validate_type('max_workers', max_workers, int)
+        if max_workers < 1:
+            raise ValueError(f'Expected "max_workers" to be positive, instead got {max_workers}')
+
+        self.name = name
+        self.max_workers = max_workers
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.__pool: Optional[ThreadPoolExecutor] = None
+        self.__pid: Optional[int] = None
+        self.__lock = Lock()
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        """
+        Returns thread pool of current process, creates it on the first call
+        :return: concurrent.futures.ThreadPoolExecutor
+        """
+
+        with self.__lock:
+            if self.__pool is None or self.__pid != os.getpid():
+                self.__pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix=f'routify-{self.name}')
+                self.__pid = os.getpid()
+            return self.__pool
+
+    def __prepare(self, func: Callable, args: tuple, kwargs: dict) -> Callable:
+        """
+        Returns job which runs func in context of calling thread and counts it in metrics,
+        job is counted as queued until it starts
+        :param func: Callable
+        :param args: tuple
+        :param kwargs: dict
+        :return: Callable
+        """
+
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+
+        def run() -> Any:
+            with self.__lock:
+                self.queued -= 1
+                self.active += 1
+            try:
+                return call()
+            finally:
+                with self.__lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        with self.__lock:
+            self.queued += 1
+        return run
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Returns result of sync func run in thread of executor,
+        context variables are copied into it
+        :param func: Callable
+        :param args: Any
+        :param kwargs: Any
+        :return: Any
+        """
+
+        pool = self.get_pool()
+        return await asyncio.get_running_loop().run_in_executor(pool, self.__prepare(func, args, kwargs))
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Returns result of sync func run in thread of executor, blocking calling thread
+        without event loop, context variables are copied into it
+        :param func: Callable
+        :param args: Any
+        :param kwargs: Any
+        :return: Any
+        """
+
+        pool = self.get_pool()
+        return pool.submit(self.__prepare(func, args, kwargs)).result()
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        """
+        metrics getter\n
+        Queue depth and utilization of executor
+        :return: django_routify.executors.ExecutorMetrics
+        """
+
+        with self.__lock:
+            return ExecutorMetrics(
+                self.name,
+                self.max_workers,
+                self.active,
+                self.queued,
+                self.completed,
+                self.active / self.max_workers,
+            )
+
+    def __repr__(self) -> str:
+        return f'RouteExecutor({self.name!r}, max_workers={self.max_workers})'
+
+
+_executors: Dict[str, RouteExecutor] = {}
+'Route executors by name'
+_lock = Lock()
+'Lock of registering route executors'
+
+
+def register_executor(name: str, max_workers: int) -> RouteExecutor:
+    """
+    Register named thread pool for "executor" option of routers and returns it.
+    Executors can be set in settings as well, e.g. ROUTIFY_EXECUTORS = {"reports": 4}
+    :param name: str
+    :param max_workers: int
+    :return: django_routify.executors.RouteExecutor
+    """
+
+    _validate_type('name', name, str)
+    if name == NON_THREAD_SENSITIVE:
+        raise ValueError(f'Executor name "{NON_THREAD_SENSITIVE}" is reserved')
+
+    executor = RouteExecutor(name, max_workers)
+    with _lock:
+        if name in _executors:
+            raise ValueError(f'Executor "{name}" is already registered')
+        _executors[name] = executor
+    return executor
+
+
+def get_executor(name: str) -> Optional[RouteExecutor]:
+    """
+    Returns route executor by name, executors of ROUTIFY_EXECUTORS setting
+    are registered on the first call, None for non thread sensitive executor
+    :param name: str
+    :return: Optional[django_routify.executors.RouteExecutor]
+    """
+
+    _validate_type('executor', name, str)
+    if name == NON_THREAD_SENSITIVE:
+        return None
+
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None and settings.configured:
+            max_workers = getattr(settings, 'ROUTIFY_EXECUTORS', {}).get(name)
+            if max_workers is not None:
+                executor = _executors[name] = RouteExecutor(name, max_workers)
+    if executor is None:
+        raise ValueError(f'Executor "{name}" is not registered')
+    return executor
+
+
+def executor_metrics() -> List[ExecutorMetrics]:
+    """
+    Returns metrics of every registered route executor
+    :return: List[django_routify.executors.ExecutorMetrics]
+    """
+
+    with _lock:
+        executors = list(_executors.values())
+    return [executor.metrics for executor in executors]
+
+
+def _in_request(view: Callable) -> Callable:
+    """
+    Returns sync view which runs in thread of executor the way Django handler runs view:
+    old database connections of thread are closed before and after it,
+    and it is atomic for databases with ATOMIC_REQUESTS, unless it is marked
+    with django.db.transaction.non_atomic_requests
+    :param view: Callable
+    :return: Callable
+    """
+
+    non_atomic_requests = getattr(view, '_non_atomic_requests', set())
+
+    def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        close_old_connections()
+        try:
+            atomic_view = view
+            for alias, settings_dict in connections.settings.items():
+                if settings_dict['ATOMIC_REQUESTS'] and alias not in non_atomic_requests:
+                    atomic_view = transaction.atomic(using=alias)(atomic_view)
+            return atomic_view(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+    return wrapped
+
+
+def run_in_executor(view: Callable, name: str) -> Callable:
+    """
+    Returns async view which runs sync view in route executor,
+    so Django ASGI handler does not run it in the thread shared by thread sensitive views.
+    Its "sync_view" attribute runs the same view from sync code without event loop.
+    Transactions of ATOMIC_REQUESTS are opened in thread of executor,
+    so Django handler does not open them for returned view
+    :param view: Callable
+    :param name: str := Name of route executor
+    :return: Callable
+    """
+
+    executor = get_executor(name)
+    in_request = _in_request(view)
+    if executor is None:
+        wrapped = sync_to_async(in_request, thread_sensitive=False)
+
+        async def wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            return await wrapped(request, *args, **kwargs)
+
+        def sync_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            return in_request(request, *args, **kwargs)
+    else:
+        async def wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            return await executor.run(in_request, request, *args, **kwargs)
+
+        def sync_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            return executor.call(in_request, request, *args, **kwargs)
+
+    # state of not imported view is not copied, only its declared metadata
+    for wrapper in (wrapped_view, sync_view):
+        if isinstance(view, LazyView):
+            functools.update_wrapper(wrapper, view, updated=())
+            wrapper.csrf_exempt = view.csrf_exempt
+        else:
+            functools.update_wrapper(wrapper, view)
+        wrapper._non_atomic_requests = set(connections)
+    wrapped_view.executor = name
+    wrapped_view.sync_view = sync_view
+    return wrapped_view
@@ -0,0 +1,448 @@
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import ThreadSensitiveContext, async_to_sync, sync_to_async
+from django.conf import settings
+from django.core import signals
+from django.core.exceptions import RequestAborted
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.exception import response_for_exception
+from django.core.handlers.wsgi import WSGIRequest, get_path_info, get_script_name
+from django.http import HttpRequest, HttpResponse
+from django.urls import URLPattern, URLResolver, get_resolver, set_script_prefix
+from django.urls.resolvers import LocalePrefixPattern, RoutePattern
+from django.utils.log import log_response
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+from .dispatch import AliasPattern
+from .hosts import HostResolver
+from .radix import RadixTree
+from .registry import get_version
+
+FAST_MATCH = Tuple[Callable, bool, Tuple[Any, ...], Dict[str, Any]]
+'View, is view a coroutine function, args and kwargs of matched fast route'
+
+
+def _get_script_prefix(scope: Dict[str, Any]) -> str:
+    """
+    Returns script prefix of ASGI request the same way Django handler takes it,
+    django.core.handlers.asgi.get_script_prefix exists only since Django 5.0
+    :param scope: Dict[str, Any]
+    :return: str
+    """
+
+    if settings.FORCE_SCRIPT_NAME:
+        return settings.FORCE_SCRIPT_NAME
+    return scope.get('root_path', '') or ''
+
+
+class ShadowPattern:
+    """
+    Resolver or route which is left to Django, e.g. regex route or routes of hosts,
+    kept only to find fast routes registered after it which it can shadow.
+    Matches conservatively, resolver matches every path under its prefix.
+    Do not use it in your project!
+
+    Attributes:
+        prefix: RoutePattern            := Routes of outer resolvers
+        pattern: Optional[Any] = None   := Pattern of resolver or route matched after prefix
+        fast: frozenset                 := Always empty, methods are never fast
+    """
+
+    __slots__ = ('prefix', 'pattern', 'fast')
+
+    def __init__(self, prefix: str, pattern: Optional[Any] = None) -> None:
+        """
+        Initial method for ShadowPattern.
+        :param prefix: str := Routes of outer resolvers
+        :param pattern: Optional[Any] := Pattern of resolver or route, None for any path under prefix
+        """
+
+        self.prefix = RoutePattern(prefix, is_endpoint=False)
+        self.pattern = pattern
+        self.fast = frozenset()
+
+    def match(self, path: str) -> bool:
+        """
+        Returns True if Django can try resolver or route for path
+        :param path: str
+        :return: bool
+        """
+
+        match = self.prefix.match(path)
+        if not match:
+            return False
+        return self.pattern is None or bool(self.pattern.match(match[0]))
+
+
+def _match(url_pattern: Any, path: str) -> Optional[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]:
+    """
+    Returns match of collected pattern for path, or None if it does not match
+    :param url_pattern: Union[django.urls.URLPattern, ShadowPattern]
+    :param path: str
+    :return: Optional[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]
+    """
+
+    if isinstance(url_pattern, ShadowPattern):
+        return (path, (), {}) if url_pattern.match(path) else None
+    return url_pattern.pattern.match(path) or None
+
+
+def _collect(
+    url_patterns: List[Any],
+    prefix: str,
+    patterns: List[Any],
+    routers: List[Any],
+    seen: set,
+    fast: bool = True,
+) -> None:
+    """
+    Append patterns of url patterns with routes of outer resolvers compiled in,
+    in the order Django tries them, and routers of resolvers included by router.
+    Every route is appended, since route which is not fast shadows fast routes after it,
+    routes which are not fast have empty "fast" attribute
+    :param url_patterns: List[Union[django.urls.URLPattern, django.urls.URLResolver]]
+    :param prefix: str := Routes of outer resolvers
+    :param patterns: List[Union[django.urls.URLPattern, ShadowPattern]]
+    :param routers: List[Router]
+    :param seen: Set[int] := Ids of dispatchers which have fast pattern already
+    :param fast: bool := False for routes which can never be fast, e.g. routes of hosts
+    :return: None
+    """
+
+    for url_pattern in url_patterns:
+        pattern = url_pattern.pattern
+        if isinstance(pattern, LocalePrefixPattern):
+            route = pattern.language_prefix
+        elif isinstance(pattern, RoutePattern) and isinstance(pattern._route, str):
+            route = str(pattern)
+        else:
+            patterns.append(ShadowPattern(prefix, pattern)) # regex routes are left to Django
+            continue
+
+        if isinstance(url_pattern, HostResolver):
+            # host of request is known only to HostMiddleware
+            _collect(url_pattern.url_patterns, prefix + route, patterns, routers, seen, False)
+            continue
+        if isinstance(url_pattern, URLResolver):
+            router = getattr(url_pattern, 'router', None)
+            if router is not None and fast:
+                routers.append(router)
+            # default kwargs of resolver are passed only by Django
+            sub_fast = fast and not url_pattern.default_kwargs
+            _collect(url_pattern.url_patterns, prefix + route, patterns, routers, seen, sub_fast)
+            continue
+        if not isinstance(url_pattern, URLPattern) or isinstance(url_pattern, AliasPattern):
+            continue
+
+        methods = frozenset()
+        dispatcher = getattr(url_pattern.callback, 'dispatcher', None)
+        if fast and dispatcher is not None and dispatcher.fast and id(dispatcher) not in seen:
+            seen.add(id(dispatcher))
+            methods = frozenset(dispatcher.fast)
+
+        fast_pattern = URLPattern(
+            RoutePattern(prefix + route, name=url_pattern.name, is_endpoint=True),
+            url_pattern.callback,
+            url_pattern.default_args,
+            url_pattern.name,
+        )
+        fast_pattern.fast = methods
+        patterns.append(fast_pattern)
+
+
+class FastLane:
+    """
+    Routes registered with "fast" option in root urlconf,
+    matched before Django handler with one dict lookup for static paths
+    and radix tree for other paths. Fast route is served only if no route
+    Django tries before it matches the path, the same as in Django resolver.
+    Routes are collected again when url caches of Django are cleared
+    or routes of any router are changed.
+
+    Attributes:
+        resolver: Optional[URLResolver] = None  := Root resolver routes were collected from
+        routers: List[Router]                   := Routers included with include_router into root urlconf
+        version: int = -1                       := Version of every router routes were collected at
+        static: Dict[str, URLPattern]           := Fast routes without params which nothing shadows, by path
+        tree: Optional[RadixTree] = None        := Routes up to the last fast route, None if there are no fast routes
+    """
+
+    def __init__(self) -> None:
+        """
+        Initial method for FastLane.
+        """
+
+        self.resolver: Optional[URLResolver] = None
+        self.routers: List[Any] = []
+        self.version = -1
+        self.static: Dict[str, URLPattern] = {}
+        self.tree: Optional[RadixTree] = None
+        self.__lock = Lock()
+
+    def __collect(self) -> None:
+        """
+        Private method which collect fast routes of root urlconf if it was changed
+        :return: None
+        """
+
+        with self.__lock:
+            resolver = get_resolver()
+            version = get_version()
+            if resolver is self.resolver and version == self.version:
+                return
+
+            patterns = []
+            routers = []
+            _collect(resolver.url_patterns, '', patterns, routers, set())
+
+            # routes after the last fast route can not shadow it
+            last = max((index for index, pattern in enumerate(patterns) if pattern.fast), default=-1)
+            tree = RadixTree(patterns[:last + 1]) if last >= 0 else None
+
+            # static path is looked up in dict only if its fast route is the first to match it
+            static = {}
+            for pattern in patterns[:last + 1]:
+                if not pattern.fast or not isinstance(pattern, URLPattern) or pattern.pattern.converters:
+                    continue
+                path = str(pattern.pattern)
+                if path not in static and self._lookup(tree, path)[0] is pattern:
+                    static[path] = pattern
+
+            self.static = static
+            self.tree = tree
+            self.routers = routers
+            self.version = version
+            self.resolver = resolver
+
+    def match(self, method: str, path: str) -> Optional[FAST_MATCH]:
+        """
+        Returns view, is it async, args and kwargs of fast route of path,
+        or None if request must be handled by Django
+        :param method: str
+        :param path: str := Path info of request
+        :return: Optional[Tuple[Callable, bool, Tuple[Any, ...], Dict[str, Any]]]
+        """
+
+        if get_resolver() is not self.resolver or get_version() != self.version:
+            self.__collect()
+
+        path = path[1:] # root resolver matches the leading "/"
+        url_pattern = self.static.get(path)
+        if url_pattern is not None:
+            args, kwargs = (), url_pattern.default_args
+        elif self.tree is not None:
+            url_pattern, match = self._lookup(self.tree, path)
+            if url_pattern is None:
+                return None
+            _, args, kwargs = match
+            kwargs = {**kwargs, **url_pattern.default_args}
+        else:
+            return None
+
+        if method not in url_pattern.fast and None not in url_pattern.fast:
+            return None # route is not fast or other methods of path need middleware
+        view = url_pattern.callback
+        return view, iscoroutinefunction(view), args, kwargs
+
+    @staticmethod
+    def _lookup(tree: RadixTree, path: str) -> Tuple[Any, Optional[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]]:
+        """
+        Returns the first collected pattern which matches path and its match,
+        or (None, None) if nothing matches
+        :param tree: django_routify.radix.RadixTree
+        :param path: str
+        :return: Tuple[Union[django.urls.URLPattern, ShadowPattern, None], Optional[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]]
+        """
+
+        for url_pattern in tree.lookup(path):
+            match = _match(url_pattern, path)
+            if match:
+                return url_pattern, match
+        return None, None
+
+    @staticmethod
+    def get_response(request: HttpRequest, found: FAST_MATCH) -> HttpResponse:
+        """
+        Returns response of view of fast route, exceptions are converted
+        into responses the same way Django handler converts them
+        :param request: django.http.HttpRequest
+        :param found: Tuple[Callable, bool, Tuple[Any, ...], Dict[str, Any]]
+        :return: django.http.HttpResponse
+        """
+
+        view, is_async, args, kwargs = found
+        if is_async:
+            view = getattr(view, 'sync_view', None) or async_to_sync(view)
+
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+        except Exception as exc:
+            response = response_for_exception(request, exc)
+
+        if response.status_code >= 400:
+            log_response('%s: %s', response.reason_phrase, request.path, response=response, request=request)
+        return response
+
+    @staticmethod
+    async def get_response_async(request: HttpRequest, found: FAST_MATCH) -> HttpResponse:
+        """
+        Returns response of view of fast route, sync views run in thread
+        the same way Django handler runs them
+        :param request: django.http.HttpRequest
+        :param found: Tuple[Callable, bool, Tuple[Any, ...], Dict[str, Any]]
+        :return: django.http.HttpResponse
+        """
+
+        view, is_async, args, kwargs = found
+        try:
+            if is_async:
+                response = await view(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(view, thread_sensitive=True)(request, *args, **kwargs)
+            if hasattr(response, 'render') and callable(response.render):
+                response = await sync_to_async(response.render, thread_sensitive=True)()
+        except Exception as exc:
+            response = await sync_to_async(response_for_exception, thread_sensitive=False)(request, exc)
+
+        if response.status_code >= 400:
+            log_response('%s: %s', response.reason_phrase, request.path, response=response, request=request)
+        return response
+
+
+class FastLaneWSGI:
+    """
+    WSGI application which serves routes registered with "fast" option
+    without Django middleware, and passes every other request to Django.
+    Fast routes get plain WSGIRequest, which has no session, user
+    or other attributes set by middleware, and no resolver_match.
+    Signals request_started and request_finished are sent the same way,
+    so database connections are managed as usual.
+
+        application = FastLaneWSGI(get_wsgi_application())
+
+    Attributes:
+        application: Callable   := Django WSGI application
+        lane: FastLane          := Fast routes of root urlconf
+    """
+
+    def __init__(self, application: Callable) -> None:
+        """
+        Initial method for FastLaneWSGI.
+        :param application: Callable := Django WSGI application
+        """
+
+        self.application = application
+        self.lane = FastLane()
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Any:
+        found = self.lane.match(environ['REQUEST_METHOD'], get_path_info(environ))
+        if found is None:
+            return self.application(environ, start_response)
+
+        set_script_prefix(get_script_name(environ))
+        signals.request_started.send(sender=self.__class__, environ=environ)
+        request = WSGIRequest(environ)
+        response = self.lane.get_response(request, found)
+        response._handler_class = self.__class__
+
+        status = '%d %s' % (response.status_code, response.reason_phrase)
+        response_headers = [
+            *response.items(),
+            *(('Set-Cookie', c.output(header='')) for c in response.cookies.values()),
+        ]
+        start_response(status, response_headers)
+        if getattr(response, 'file_to_stream', None) is not None and environ.get('wsgi.file_wrapper'):
+            # the same as Django handler, server closes file wrapper instead of response
+            response.file_to_stream.close = response.close
+            response = environ['wsgi.file_wrapper'](response.file_to_stream, response.block_size)
+        return response
+
+
+class _FastLaneASGIHandler(ASGIHandler):
+    """
+    ASGIHandler without middleware, only its reading of body,
+    creating of requests and sending of responses are used.
+    """
+
+    def __init__(self) -> None:
+        pass # middleware is not loaded
+
+
+class FastLaneASGI:
+    """
+    ASGI application which serves routes registered with "fast" option
+    without Django middleware, and passes every other request to Django.
+    Fast routes get plain ASGIRequest, which has no session, user
+    or other attributes set by middleware, and no resolver_match.
+
+        application = FastLaneASGI(get_asgi_application())
+
+    Attributes:
+        application: Callable   := Django ASGI application
+        lane: FastLane          := Fast routes of root urlconf
+    """
+
+    def __init__(self, application: Callable) -> None:
+        """
+        Initial method for FastLaneASGI.
+        :param application: Callable := Django ASGI application
+        """
+
+        self.application = application
+        self.lane = FastLane()
+        self.handler = _FastLaneASGIHandler()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        found = None
+        if scope['type'] == 'http':
+            path = scope['path']
+            root_path = _get_script_prefix(scope)
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            found = self.lane.match(scope['method'], path)
+
+        if found is None:
+            await self.application(scope, receive, send)
+            return
+
+        # thread sensitive code of each request runs in its own thread, the same as in Django handler
+        async with ThreadSensitiveContext():
+            await self.__handle(scope, receive, send, found)
+
+    async def __handle(self, scope: Dict[str, Any], receive: Callable, send: Callable, found: FAST_MATCH) -> None:
+        """
+        Private method which sends response of fast route
+        :param scope: Dict[str, Any]
+        :param receive: Callable
+        :param send: Callable
+        :param found: Tuple[Callable, bool, Tuple[Any, ...], Dict[str, Any]]
+        :return: None
+        """
+
+        try:
+            body_file = await self.handler.read_body(receive)
+        except RequestAborted:
+            return
+
+        set_script_prefix(_get_script_prefix(scope))
+        await sync_to_async(signals.request_started.send, thread_sensitive=True)(
+            sender=self.__class__,
+            scope=scope,
+        )
+        request, response = self.handler.create_request(scope, body_file)
+        if request is not None:
+            response = await self.lane.get_response_async(request, found)
+            response._handler_class = self.__class__
+
+        try:
+            await self.handler.send_response(response, send)
+        finally:
+            await sync_to_async(response.close, thread_sensitive=True)()
+            body_file.close()
@@ -0,0 +1,103 @@
+import re
+
+from typing import Any, Dict, Pattern, Set
+
+from django.urls import URLPattern
+from django.urls.resolvers import RoutePattern
+
+from .dispatch import AliasPattern
+from .radix import PARAM_REGEX, SEGMENT_CONVERTERS
+
+
+class PathFilter:
+    """
+    Compact description of paths which router can match:
+    first path segments and counts of segments.
+    Paths outside of it are rejected before any URLPattern is tried.
+
+    Attributes:
+        first_segments: Set[str]    := First segments of routes without params in them
+        first_segment_regexes: Dict[str, Pattern]
+                                    := Converter regexes of routes which first segment is a param
+        any_first_segment: bool     := Some route starts with text mixed with param or untyped converter
+        segment_counts: Set[int]    := Counts of segments of routes
+        any_segment_count: bool     := Some route can match any count of segments
+    """
+
+    def __init__(self) -> None:
+        """
+        Initial method for PathFilter.
+        """
+
+        self.first_segments: Set[str] = set()
+        self.first_segment_regexes: Dict[str, Pattern] = {}
+        self.any_first_segment = False
+        self.segment_counts: Set[int] = set()
+        self.any_segment_count = False
+
+    def add(self, url_pattern: Any) -> None:
+        """
+        Extend filter with paths which url pattern can match
+        :param url_pattern: Union[django.urls.URLPattern, django.urls.URLResolver]
+        :return: None
+        """
+
+        if isinstance(url_pattern, AliasPattern):
+            return # never matches, used only for reversing
+
+        pattern = url_pattern.pattern
+        if (
+            not isinstance(url_pattern, URLPattern)
+            or not isinstance(pattern, RoutePattern)
+            or not isinstance(pattern._route, str)
+        ):
+            self.any_first_segment = True
+            self.any_segment_count = True
+            return
+
+        segments = pattern._route.split('/')
+
+        first_segment = segments[0]
+        if '<' not in first_segment:
+            self.first_segments.add(first_segment)
+        else:
+            match = PARAM_REGEX.match(first_segment)
+            converter = match and pattern.converters.get(match.group('parameter'))
+            if type(converter) in SEGMENT_CONVERTERS:
+                if converter.regex not in self.first_segment_regexes:
+                    self.first_segment_regexes[converter.regex] = re.compile(converter.regex)
+            else:
+                self.any_first_segment = True
+
+        if all(type(converter) in SEGMENT_CONVERTERS for converter in pattern.converters.values()):
+            self.segment_counts.add(len(segments))
+        else:
+            self.any_segment_count = True
+
+    def can_match(self, path: str) -> bool:
+        """
+        Is path possible to match by any route
+        :param path: str
+        :return: bool
+        """
+
+        if not self.any_segment_count and path.count('/') + 1 not in self.segment_counts:
+            return False
+        if self.any_first_segment:
+            return True
+
+        first_segment = path.partition('/')[0]
+        if first_segment in self.first_segments:
+            return True
+        for regex in self.first_segment_regexes.values():
+            if regex.fullmatch(first_segment):
+                return True
+        return False
+
+    def __repr__(self) -> str:
+        first_segments = '*' if self.any_first_segment else [
+            *sorted(self.first_segments),
+            *self.first_segment_regexes,
+        ]
+        segment_counts = '*' if self.any_segment_count else sorted(self.segment_counts)
+        return f'PathFilter(first_segments={first_segments}, segment_counts={segment_counts})'
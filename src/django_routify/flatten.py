@@ -0,0 +1,192 @@
+import django
+
+from django.urls import URLPattern, URLResolver
+from django.urls.resolvers import ResolverMatch, RoutePattern
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dispatch import AliasPattern
+from .filters import PathFilter
+
+RESOLVER_MATCH_EXTRA_KWARGS = django.VERSION >= (4, 1)
+'ResolverMatch accepts captured_kwargs and extra_kwargs since Django 4.1'
+
+
+class FlatPattern(URLPattern):
+    """
+    URLPattern of router included into another router with Router.include.
+    Prefixes of included routers are compiled into its route,
+    and it resolves with their namespaces as if they were nested resolvers.
+
+    Attributes:
+        app_names: List[str]    := Application names of included routers, from outer to inner
+        namespaces: List[str]   := Namespaces of included routers, from outer to inner
+    """
+
+    def __init__(
+        self,
+        pattern: RoutePattern,
+        callback: Any,
+        default_args: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        app_names: Optional[List[str]] = None,
+        namespaces: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initial method for FlatPattern.
+        :param pattern: django.urls.resolvers.RoutePattern
+        :param callback: Callable
+        :param default_args: Optional[Dict[str, Any]]
+        :param name: Optional[str]
+        :param app_names: Optional[List[str]]
+        :param namespaces: Optional[List[str]]
+        """
+
+        super().__init__(pattern, callback, default_args, name)
+        self.app_names = app_names or []
+        self.namespaces = namespaces or []
+
+    def resolve(self, path: str) -> Optional[ResolverMatch]:
+        match = self.pattern.match(path)
+        if not match:
+            return None
+
+        new_path, args, captured_kwargs = match
+        # Pass any default args as **kwargs.
+        kwargs = {**captured_kwargs, **self.default_args}
+
+        extra = {}
+        if RESOLVER_MATCH_EXTRA_KWARGS:
+            extra = {
+                'captured_kwargs': captured_kwargs,
+                'extra_kwargs': self.default_args,
+            }
+
+        return ResolverMatch(
+            self.callback,
+            args,
+            kwargs,
+            self.pattern.name,
+            self.app_names,
+            self.namespaces,
+            route=str(self.pattern),
+            **extra,
+        )
+
+
+def _flatten(
+    url_patterns: List[Any],
+    prefix: str,
+    app_names: List[str],
+    namespaces: List[str],
+    patterns: List[Any],
+) -> None:
+    """
+    Append leaf patterns of url patterns into patterns in the order Django tries them
+    :param url_patterns: List[Union[django.urls.URLPattern, django.urls.URLResolver]]
+    :param prefix: str := Routes of included routers
+    :param app_names: List[str]
+    :param namespaces: List[str]
+    :param patterns: List[Union[django.urls.URLPattern, django.urls.URLResolver]]
+    :return: None
+    """
+
+    for url_pattern in url_patterns:
+        if isinstance(url_pattern, URLResolver) and getattr(url_pattern, 'router', None) is not None:
+            _flatten(
+                url_pattern.url_patterns,
+                prefix + str(url_pattern.pattern),
+                app_names + [url_pattern.app_name],
+                namespaces + [url_pattern.namespace],
+                patterns,
+            )
+        elif not prefix and not app_names:
+            patterns.append(url_pattern) # pattern of router itself
+        elif isinstance(url_pattern, AliasPattern):
+            continue # used only for reversing, which uses nested resolvers
+        else:
+            patterns.append(FlatPattern(
+                RoutePattern(
+                    prefix + str(url_pattern.pattern),
+                    name=url_pattern.pattern.name,
+                    is_endpoint=True,
+                ),
+                url_pattern.callback,
+                url_pattern.default_args,
+                url_pattern.name,
+                app_names,
+                namespaces,
+            ))
+
+
+def _get_first_segment(url_pattern: Any) -> Optional[str]:
+    """
+    Returns first segment of url pattern if it is static text,
+    or None if pattern can match paths with different first segments
+    :param url_pattern: Union[django.urls.URLPattern, django.urls.URLResolver]
+    :return: Optional[str]
+    """
+
+    pattern = url_pattern.pattern
+    if (
+        not isinstance(url_pattern, URLPattern)
+        or not isinstance(pattern, RoutePattern)
+        or not isinstance(pattern._route, str)
+    ):
+        return None
+
+    first_segment = pattern._route.partition('/')[0]
+    if '<' in first_segment:
+        return None
+    return first_segment
+
+
+def index_by_first_segment(patterns: List[Any]) -> Dict[Optional[str], List[Any]]:
+    """
+    Returns patterns which can match paths by first segment of path,
+    patterns without static first segment are under None and in every other list.
+    Order of patterns in each list is the same as in patterns
+    :param patterns: List[Union[django.urls.URLPattern, django.urls.URLResolver]]
+    :return: Dict[Optional[str], List[Union[django.urls.URLPattern, django.urls.URLResolver]]]
+    """
+
+    index: Dict[Optional[str], List[Any]] = {None: []}
+    for pattern in patterns:
+        if isinstance(pattern, AliasPattern):
+            continue # never matches, used only for reversing
+
+        first_segment = _get_first_segment(pattern)
+        if first_segment is None:
+            for candidates in index.values():
+                candidates.append(pattern)
+            continue
+
+        if first_segment not in index:
+            index[first_segment] = list(index[None])
+        index[first_segment].append(pattern)
+
+    return index
+
+
+def flatten(router: Any) -> Tuple[List[Any], Dict[str, URLPattern], PathFilter]:
+    """
+    Returns leaf patterns of router and routers included into it,
+    with their index of static url paths and path filter
+    :param router: Router
+    :return: Tuple[List[django.urls.URLPattern], Dict[str, django.urls.URLPattern], django_routify.filters.PathFilter]
+    """
+
+    patterns = []
+    _flatten(router.urls, '', [], [], patterns)
+
+    static_urls = {}
+    path_filter = PathFilter()
+    for pattern in patterns:
+        path_filter.add(pattern)
+        if isinstance(pattern, AliasPattern) or not isinstance(pattern.pattern, RoutePattern):
+            continue
+        if not pattern.pattern.converters:
+            # the first one wins, the same as the linear scan
+            static_urls.setdefault(str(pattern.pattern), pattern)
+
+    return patterns, static_urls, path_filter
@@ -0,0 +1,267 @@
+import re
+
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse
+from django.http.request import split_domain_port
+from django.urls import URLResolver
+from django.urls.exceptions import Resolver404
+from django.urls.resolvers import ResolverMatch, RoutePattern
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func: Any) -> Any:
+        from asyncio.coroutines import _is_coroutine
+        func._is_coroutine = _is_coroutine
+        return func
+
+from .cache import LRUCache
+from .flatten import RESOLVER_MATCH_EXTRA_KWARGS
+from .validator import _validate_type
+
+HOST_PARAMETER_REGEX = re.compile(r'\{(?P<parameter>[A-Za-z_]\w*)\}')
+'Regular expression of host params, each of them is a whole label of host'
+
+_current_host: ContextVar[Optional[str]] = ContextVar('django_routify_host', default=None)
+'Host of request being handled, set by HostMiddleware'
+
+
+def get_current_host() -> Optional[str]:
+    """
+    Returns host of request being handled without port,
+    or None outside of HostMiddleware
+    :return: Optional[str]
+    """
+    return _current_host.get()
+
+
+class HostPattern:
+    """
+    Compiled host of router, e.g. "api.example.com" or "{tenant}.example.com".
+    Params match one label of host and are passed to views as kwargs.
+
+    Attributes:
+        host: str                   := Host the pattern was built from, lower cased
+        params: Tuple[str, ...]     := Names of params
+        suffix: str                 := Static labels after the last param, the whole host if there are no params
+        regex: Optional[Pattern]    := Compiled regex of host, None if there are no params
+    """
+
+    __slots__ = ('host', 'params', 'suffix', 'regex')
+
+    def __init__(self, host: str) -> None:
+        """
+        Initial method for HostPattern.
+        :param host: str
+        """
+
+        _validate_type('host', host, str)
+        self.host = host.strip().lower().rstrip('.')
+        if not self.host:
+            raise ValueError('Expected "host" to be not empty')
+
+        labels = self.host.split('.')
+        params = []
+        parts = []
+        last = -1
+        for i, label in enumerate(labels):
+            match = HOST_PARAMETER_REGEX.fullmatch(label)
+            if match is None:
+                if '{' in label or '}' in label:
+                    raise ValueError(f'Host param must be a whole label of host, instead got "{self.host}"')
+                parts.append(re.escape(label))
+                continue
+
+            parameter = match.group('parameter')
+            if parameter in params:
+                raise ValueError(f'Host param "{parameter}" is repeated in "{self.host}"')
+            params.append(parameter)
+            parts.append(f'(?P<{parameter}>[^.]+)')
+            last = i
+
+        self.params = tuple(params)
+        self.suffix = '.'.join(labels[last + 1:])
+        self.regex = re.compile(r'\.'.join(parts)) if params else None
+
+    def match(self, host: str) -> Optional[Dict[str, str]]:
+        """
+        Returns params of host or None if host does not match
+        :param host: str
+        :return: Optional[Dict[str, str]]
+        """
+
+        if self.regex is None:
+            return {} if host == self.host else None
+        match = self.regex.fullmatch(host)
+        return None if match is None else match.groupdict()
+
+    def __repr__(self) -> str:
+        return f'HostPattern({self.host!r})'
+
+
+class HostResolver(URLResolver):
+    """
+    URLResolver of routers included with django_routify.include_hosts.
+    Host of request is set by HostMiddleware, resolver of its router is found
+    with one dict lookup for static hosts, and by static suffix of host for host patterns,
+    so count of hosts does not matter. Found resolvers and params of hosts
+    are kept in LRU cache by host. Routers without host serve any other host.
+
+    Attributes:
+        hosts: Dict[str, URLResolver]   := Resolvers of routers with static host
+        host_patterns: Dict[str, List[Tuple[HostPattern, URLResolver]]] := Resolvers of host patterns by suffix
+        defaults: List[URLResolver]     := Resolvers of routers without host
+        cache: LRUCache                 := Resolvers and params of host patterns by host
+    """
+
+    def __init__(self, resolvers: List[URLResolver], cache_size: int = 1024) -> None:
+        """
+        Initial method for HostResolver.
+        :param resolvers: List[django.urls.URLResolver] := Resolvers of routers
+        :param cache_size: int := Max size of LRU cache of hosts matched by host patterns
+        """
+
+        super().__init__(RoutePattern('', is_endpoint=False), list(resolvers))
+        self.hosts: Dict[str, URLResolver] = {}
+        self.host_patterns: Dict[str, List[Tuple[HostPattern, URLResolver]]] = {}
+        self.defaults: List[URLResolver] = []
+        self.cache = LRUCache(cache_size)
+
+        for resolver in resolvers:
+            host = resolver.router.host
+            if host is None:
+                self.defaults.append(resolver)
+                continue
+
+            pattern = HostPattern(host)
+            if pattern.regex is None:
+                if pattern.host in self.hosts:
+                    raise ValueError(f'Host "{pattern.host}" is served by more than one router')
+                self.hosts[pattern.host] = resolver
+            else:
+                self.host_patterns.setdefault(pattern.suffix, []).append((pattern, resolver))
+
+    def _get_resolvers(self, host: Optional[str]) -> Tuple[List[URLResolver], Dict[str, str]]:
+        """
+        Returns resolvers for host and params of host
+        :param host: Optional[str]
+        :return: Tuple[List[django.urls.URLResolver], Dict[str, str]]
+        """
+
+        if host is None:
+            return self.defaults, {}
+
+        resolver = self.hosts.get(host)
+        if resolver is not None:
+            return [resolver], {}
+
+        found = self.cache.get(host)
+        if found is not None:
+            return found
+
+        found = self._match_host(host)
+        if found is None:
+            found = (self.defaults, {})
+        self.cache.set(host, found)
+        return found
+
+    def _match_host(self, host: str) -> Optional[Tuple[List[URLResolver], Dict[str, str]]]:
+        """
+        Returns resolver of the first host pattern matching host and params of host,
+        patterns with the longest static suffix are tried first,
+        e.g. "{id}.eu.example.com" before "{id}.example.com"
+        :param host: str
+        :return: Optional[Tuple[List[django.urls.URLResolver], Dict[str, str]]]
+        """
+
+        labels = host.split('.')
+        for i in range(1, len(labels) + 1):
+            for pattern, resolver in self.host_patterns.get('.'.join(labels[i:]), ()):
+                params = pattern.match(host)
+                if params is not None:
+                    return [resolver], params
+        return None
+
+    def resolve(self, path: str) -> ResolverMatch:
+        path = str(path) # path may be a reverse_lazy object
+        resolvers, params = self._get_resolvers(_current_host.get())
+
+        # resolvers of routers are tried the same way Django tries sub resolvers,
+        # the pattern of this resolver is empty
+        tried = []
+        for resolver in resolvers:
+            try:
+                match = resolver.resolve(path)
+            except Resolver404 as error:
+                self._extend_tried(tried, resolver, error.args[0].get('tried'))
+                continue
+
+            self._extend_tried(tried, resolver, match.tried)
+            extra = {}
+            if RESOLVER_MATCH_EXTRA_KWARGS:
+                extra = {
+                    'captured_kwargs': {**params, **match.captured_kwargs},
+                    'extra_kwargs': match.extra_kwargs,
+                }
+            return ResolverMatch(
+                match.func,
+                match.args,
+                {**params, **match.kwargs},
+                match.url_name,
+                match.app_names,
+                match.namespaces,
+                self._join_route(str(resolver.pattern), match.route),
+                tried,
+                **extra,
+            )
+
+        raise Resolver404({'tried': tried, 'path': path})
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} hosts={len(self.hosts)} host_patterns={len(self.host_patterns)}>'
+
+
+class HostMiddleware:
+    """
+    Middleware which sets host of request for django_routify.include_hosts
+    while request is being handled. Host is validated with ALLOWED_HOSTS
+    by request.get_host, the same as by CommonMiddleware.
+
+    Attributes:
+        get_response: Callable  := Next middleware or view
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Any) -> None:
+        """
+        Initial method for HostMiddleware.
+        :param get_response: Callable
+        """
+
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_async:
+            return self.__acall__(request)
+
+        token = _current_host.set(split_domain_port(request.get_host())[0])
+        try:
+            return self.get_response(request)
+        finally:
+            _current_host.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = _current_host.set(split_domain_port(request.get_host())[0])
+        try:
+            return await self.get_response(request)
+        finally:
+            _current_host.reset(token)
@@ -1,23 +1,90 @@
-from django.urls import path, include, URLResolver
+from typing import Optional
 
+from django.urls import include, URLResolver
+from django.urls.resolvers import RoutePattern
+
+from .hosts import HostResolver
 from .router import Router
+from .resolvers import ENGINES
+from .validator import _validate_type
 
 
-def include_router(router: Router) -> URLResolver:
+def include_router(
+    router: Router,
+    engine: str = 'django',
+    cache_size: Optional[int] = None,
+    flat: bool = False,
+) -> URLResolver:
     """
     Include router is a function that making include registered urls.
     Returning URLResolver which can be inserted into urlpatterns.
     :param router: Router
+    :param engine: str := Resolving engine, "django" (linear scan), "radix" (radix tree)
+        or "compiled" (generated module)
+    :param cache_size: Optional[int] := Max size of LRU cache of resolved paths, disabled if None
+    :param flat: bool := Resolve patterns of routers included with Router.include in one list
+        with their prefixes compiled in, instead of nested resolvers
     :return: django.urls.URLResolver
     """
 
     if not isinstance(router, Router):
         raise TypeError('Expected instance of django_routify.Router')
 
-    return path(
-        router.prefix,
-        include((
-            router.urls,
-            router.app_name,
-        ))
+    _validate_type('engine', engine, str)
+    _validate_type('cache_size', cache_size, (int, type(None)))
+    _validate_type('flat', flat, bool)
+    if engine not in ENGINES:
+        raise ValueError(
+            f'Engine "{engine}" is not in '
+            f'allowed engines {tuple(ENGINES)}'
+        )
+
+    urlconf_module, app_name, namespace = include((
+        router.urls,
+        router.app_name,
+    ))
+
+    resolver = ENGINES[engine](
+        RoutePattern(router.prefix, is_endpoint=False),
+        urlconf_module,
+        app_name=app_name,
+        namespace=namespace,
+        router=router,
+        cache_size=cache_size,
+        flat=flat,
+    )
+    # reverse dictionaries of resolver are reset when routes are changed at runtime
+    router.resolvers.add(resolver)
+    return resolver
+
+
+def include_hosts(
+    *routers: Router,
+    engine: str = 'django',
+    cache_size: Optional[int] = None,
+    flat: bool = False,
+    host_cache_size: int = 1024,
+) -> URLResolver:
+    """
+    Include hosts is a function that making include routers by their hosts.
+    Returning URLResolver which can be inserted into urlpatterns,
+    it resolves paths only with router of host of request,
+    set by django_routify.hosts.HostMiddleware.
+    Routers without host serve hosts no other router serves.
+    :param routers: Router
+    :param engine: str := Resolving engine of each router, see include_router
+    :param cache_size: Optional[int] := Max size of LRU cache of resolved paths of each router
+    :param flat: bool := Resolve routers included with Router.include in one list
+    :param host_cache_size: int := Max size of LRU cache of hosts matched by host patterns
+    :return: django_routify.hosts.HostResolver
+    """
+
+    _validate_type('host_cache_size', host_cache_size, int)
+
+    return HostResolver(
+        [
+            include_router(router, engine=engine, cache_size=cache_size, flat=flat)
+            for router in routers
+        ],
+        cache_size=host_cache_size,
     )
@@ -0,0 +1,132 @@
+from inspect import isclass
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Type
+
+from django.utils.module_loading import import_string
+from django.views import View
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func: Any) -> Any:
+        from asyncio.coroutines import _is_coroutine
+        func._is_coroutine = _is_coroutine
+        return func
+
+from .cbv import as_view
+from .validator import _validate_type
+
+
+class LazyView:
+    """
+    View registered by dotted import path.
+    Module of view is imported on the first call or on explicit load,
+    until then routing uses only declared metadata.
+
+    Attributes:
+        import_path: str                := Dotted import path of view
+        parameters: Dict[str, Type]     := Types of url params, used instead of view annotations
+        class_based: bool               := Is view a class based view, by default if its name is capitalized
+        is_async: bool = False          := Is view a coroutine function
+        csrf_exempt: bool = False       := Is view exempt from CSRF protection
+    """
+
+    def __init__(
+        self,
+        import_path: str,
+        parameters: Optional[Dict[str, Type]] = None,
+        class_based: Optional[bool] = None,
+        is_async: bool = False,
+        csrf_exempt: bool = False,
+    ) -> None:
+        """
+        Initial method for LazyView.
+        :param import_path: str
+        :param parameters: Optional[Dict[str, Type]]
+        :param class_based: Optional[bool]
+        :param is_async: bool
+        :param csrf_exempt: bool
+        """
+
+        _validate_type('import_path', import_path, str)
+        _validate_type('parameters', parameters, (dict, type(None)))
+        _validate_type('class_based', class_based, (bool, type(None)))
+        _validate_type('is_async', is_async, bool)
+        _validate_type('csrf_exempt', csrf_exempt, bool)
+
+        module, _, name = import_path.rpartition('.')
+        if not module or not name:
+            raise ValueError(f'Expected "import_path" to be dotted path, instead got "{import_path}"')
+
+        self.import_path = import_path
+        self.parameters = parameters or {}
+        self.class_based = name[0].isupper() if class_based is None else class_based
+        self.is_async = is_async
+        self.csrf_exempt = csrf_exempt
+
+        # same attributes as view, used for naming and ResolverMatch
+        self.__module__ = module
+        self.__name__ = name
+        self.__qualname__ = name
+
+        self.__view: Optional[Callable] = None
+        self.__lock = Lock()
+
+        if is_async:
+            markcoroutinefunction(self)
+
+    @property
+    def loaded(self) -> bool:
+        """
+        loaded getter\n
+        Is view already imported
+        :return: bool
+        """
+        return self.__view is not None
+
+    def load(self) -> Callable:
+        """
+        Import view, check it against declared metadata and returns it
+        :return: Callable
+        """
+
+        view = self.__view
+        if view is not None:
+            return view
+
+        with self.__lock:
+            if self.__view is not None:
+                return self.__view
+
+            view = import_string(self.import_path)
+
+            class_based = isclass(view) and issubclass(view, View)
+            if class_based != self.class_based:
+                raise TypeError(
+                    f'View "{self.import_path}" is declared with class_based={self.class_based}, '
+                    f'instead it is {"a class" if class_based else "not a class"} based view'
+                )
+            if class_based:
+                view = as_view(view)
+
+            if iscoroutinefunction(view) != self.is_async:
+                raise TypeError(
+                    f'View "{self.import_path}" is declared with is_async={self.is_async}, '
+                    f'instead it is {"a" if iscoroutinefunction(view) else "not a"} coroutine function'
+                )
+            if getattr(view, 'csrf_exempt', False) != self.csrf_exempt:
+                raise TypeError(
+                    f'View "{self.import_path}" is declared with csrf_exempt={self.csrf_exempt}, '
+                    f'instead it is {"not " if self.csrf_exempt else ""}exempt from CSRF protection'
+                )
+
+            self.__view = view
+            return view
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'LazyView({self.import_path!r}, loaded={self.loaded})'
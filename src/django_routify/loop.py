@@ -0,0 +1,122 @@
+import asyncio
+import os
+
+from concurrent.futures import Future
+from functools import update_wrapper
+from threading import Lock, Thread, get_ident
+from typing import Any, Awaitable, Callable, Optional
+
+from asgiref.sync import SyncToAsync, ThreadSensitiveContext
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from .lazy import LazyView
+
+
+class PersistentLoop:
+    """
+    Event loop running forever in daemon thread, one per worker process.
+    Coroutines of async views are submitted into it from WSGI threads,
+    so connections of async clients bound to event loop are reused between requests.
+    Event loop is started again in process forked after it was started.
+
+    Attributes:
+        loop: Optional[AbstractEventLoop] = None    := Running event loop, None until the first coroutine
+        thread: Optional[Thread] = None             := Thread of event loop
+        pid: Optional[int] = None                   := Process which started event loop
+    """
+
+    def __init__(self) -> None:
+        """
+        Initial method for PersistentLoop.
+        """
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[Thread] = None
+        self.pid: Optional[int] = None
+        self.__lock = Lock()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns running event loop of current process, starts it on the first call
+        :return: asyncio.AbstractEventLoop
+        """
+
+        loop = self.loop
+        if loop is not None and self.pid == os.getpid():
+            return loop
+
+        with self.__lock:
+            if self.loop is None or self.pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = Thread(target=loop.run_forever, name='django-routify-loop', daemon=True)
+                thread.start()
+                self.loop, self.thread, self.pid = loop, thread, os.getpid()
+            return self.loop
+
+    def submit(self, awaitable: Awaitable) -> Future:
+        """
+        Submit awaitable into event loop and returns its future without waiting for it.
+        Context variables of calling thread are copied into it,
+        sync code called with sync_to_async(thread_sensitive=True)
+        runs in one thread per call, the same as under Django ASGI handler.
+        Database connections opened in that thread are closed with it
+        :param awaitable: Awaitable
+        :return: concurrent.futures.Future
+        """
+
+        async def run() -> Any:
+            async with ThreadSensitiveContext() as context:
+                try:
+                    return await awaitable
+                finally:
+                    # thread is discarded with context, its connections would never be reused
+                    executor = SyncToAsync.context_to_thread_executor.get(context)
+                    if executor is not None:
+                        await asyncio.get_running_loop().run_in_executor(executor, connections.close_all)
+        return asyncio.run_coroutine_threadsafe(run(), self.get_loop())
+
+    def run(self, awaitable: Awaitable) -> Any:
+        """
+        Returns result of awaitable run in event loop, blocking calling thread
+        :param awaitable: Awaitable
+        :return: Any
+        """
+
+        self.get_loop()
+        if self.thread.ident == get_ident():
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close() # it would never be awaited
+            raise RuntimeError('Coroutine can not be run in persistent event loop from its own thread')
+        return self.submit(awaitable).result()
+
+    def __repr__(self) -> str:
+        return f'PersistentLoop(running={self.loop is not None and self.pid == os.getpid()})'
+
+
+persistent_loop = PersistentLoop()
+'Event loop of current process, shared by every router with "persistent_loop" option'
+
+
+def run_in_loop(view: Callable) -> Callable:
+    """
+    Returns sync view which runs async view in persistent event loop,
+    so dispatcher of url path stays sync and Django handler
+    does not create event loop for every request under WSGI
+    :param view: Callable := Coroutine function
+    :return: Callable
+    """
+
+    def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return persistent_loop.run(view(request, *args, **kwargs))
+
+    # state of not imported view is not copied, only its declared metadata
+    if isinstance(view, LazyView):
+        update_wrapper(wrapped, view, updated=())
+        wrapped.csrf_exempt = view.csrf_exempt
+    else:
+        update_wrapper(wrapped, view)
+        # marks of coroutine function are copied with state of view
+        wrapped.__dict__.pop('_is_coroutine', None)
+        wrapped.__dict__.pop('_is_coroutine_marker', None)
+    return wrapped
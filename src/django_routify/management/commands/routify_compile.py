@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from ...manifest import write_manifest
+from ...registry import get_routers
+
+
+class Command(BaseCommand):
+    help = (
+        'Write manifests of fully normalized routes for routers created with "manifest" option, '
+        'so they skip normalizing and naming of routes at startup.'
+    )
+
+    def handle(self, *args, **options) -> None:
+        # importing urlconf registers every router and its views
+        get_resolver().url_patterns
+
+        routers = [router for router in get_routers() if router.manifest is not None]
+        if not routers:
+            self.stdout.write('No routers with "manifest" option found.')
+            return
+
+        for router in routers:
+            file_path = write_manifest(router)
+            self.stdout.write(self.style.SUCCESS(
+                f'Router "{router.app_name}": {len(router.registrations)} routes written to {file_path}'
+            ))
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...warmup import warm_routes, warmup
+
+
+class Command(BaseCommand):
+    help = (
+        'Warm routers and send synthetic GET request through Django handler to every route '
+        'which needs no params or has "warm_kwargs" declared, reporting latency of each route.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=1,
+            help='Number of threads sending requests.',
+        )
+        parser.add_argument(
+            '--host',
+            default=None,
+            help='Host header of requests, the first of ALLOWED_HOSTS by default.',
+        )
+        parser.add_argument(
+            '--slow',
+            type=float,
+            default=500.0,
+            help='Milliseconds after which route is reported as slow.',
+        )
+
+    def handle(self, *args, **options) -> None:
+        warmup()
+        try:
+            results = warm_routes(threads=options['threads'], host=options['host'])
+        except (TypeError, ValueError) as error:
+            raise CommandError(error)
+
+        if not results:
+            self.stdout.write('No routes to warm found.')
+            return
+
+        failed = 0
+        for result in results:
+            line = f'{result.duration * 1000:9.1f}ms  {result.status}  {result.path}'
+            if result.name:
+                line += f'  ({result.name})'
+            if result.version is not None:
+                line += f'  version {result.version}'
+
+            if result.failed:
+                failed += 1
+                self.stdout.write(self.style.ERROR(line))
+            elif result.duration * 1000 >= options['slow']:
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+
+        slowest = max(results, key=lambda result: result.duration)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(results)} routes warmed in {sum(result.duration for result in results) * 1000:.1f}ms, '
+            f'slowest {slowest.path} {slowest.duration * 1000:.1f}ms'
+        ))
+        if failed:
+            raise CommandError(f'{failed} routes responded with server error or were not found')
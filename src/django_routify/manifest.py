@@ -0,0 +1,182 @@
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import warnings
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .codegen import _write
+from .lazy import LazyView
+
+MANIFEST_VERSION = 1
+'Version of manifest format, part of the source hash'
+
+
+def get_config(router: Any) -> List[Any]:
+    """
+    Returns options of router which normalized routes depend on,
+    it must be taken before the first registration normalizes prefix
+    :param router: Router
+    :return: List[Any]
+    """
+    return [
+        router.prefix,
+        router.app_name,
+        router.auto_naming,
+        router.auto_trailing_slash,
+        type(router.dynamic_pattern).__qualname__,
+    ]
+
+
+def get_key(
+    url_path: str,
+    view: Any,
+    name: Optional[str],
+    methods: Optional[List[str]],
+) -> str:
+    """
+    Returns key of registration made with these arguments
+    :param url_path: str
+    :param view: Union[FUNC_BASED_VIEW, View, LazyView]
+    :param name: Optional[str]
+    :param methods: Optional[List[str]]
+    :return: str
+    """
+
+    parameters = ''
+    if isinstance(view, LazyView):
+        # declared parameters replace annotations from source of view
+        parameters = ','.join(sorted(
+            f'{parameter}:{getattr(python_type, "__qualname__", python_type)}'
+            for parameter, python_type in view.parameters.items()
+        ))
+
+    # empty name and methods are the same as None for registration
+    return '\x1f'.join((
+        url_path,
+        view.__module__,
+        view.__qualname__,
+        view.__name__,
+        name or '',
+        ','.join(methods or ()),
+        parameters,
+    ))
+
+
+def _get_source_file(module_name: str) -> Optional[str]:
+    """
+    Returns source file of module without importing it
+    :param module_name: str
+    :return: Optional[str]
+    """
+
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return getattr(module, '__file__', None)
+
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    return spec and spec.origin
+
+
+def get_source_hash(config: List[Any], modules: List[str]) -> str:
+    """
+    Returns hash of router options and source files of modules with views
+    :param config: List[Any]
+    :param modules: List[str]
+    :return: str
+    """
+
+    digest = hashlib.sha256(json.dumps([MANIFEST_VERSION, config]).encode('utf-8'))
+    for module_name in modules:
+        digest.update(module_name.encode('utf-8'))
+
+        file_path = _get_source_file(module_name)
+        if file_path is None or not os.path.isfile(file_path):
+            digest.update(b'\0')
+            continue
+        with open(file_path, 'rb') as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+
+    return digest.hexdigest()
+
+
+def build_manifest(router: Any) -> Dict[str, Any]:
+    """
+    Returns manifest of fully normalized routes registered in router
+    :param router: Router
+    :return: Dict[str, Any]
+    """
+
+    modules = sorted({
+        view.__module__
+        for view, _, _ in router.registrations
+        if not isinstance(view, LazyView)
+    })
+
+    return {
+        'version': MANIFEST_VERSION,
+        'source_hash': get_source_hash(router.manifest_config, modules),
+        'modules': modules,
+        'prefix': router.prefix,
+        'routes': [
+            {
+                'key': key,
+                'url_path': url_path,
+                'name': name,
+                'view': f'{view.__module__}.{view.__qualname__}',
+            }
+            for view, key, (url_path, name) in router.registrations
+        ],
+    }
+
+
+def write_manifest(router: Any) -> str:
+    """
+    Write manifest of router into its manifest file and returns path of file
+    :param router: Router
+    :return: str
+    """
+
+    if router.manifest is None:
+        raise ValueError(f'Router "{router.app_name}" has no manifest file')
+
+    content = json.dumps(build_manifest(router), indent=1)
+    _write(router.manifest, content.encode('utf-8'))
+    return router.manifest
+
+
+def load_manifest(router: Any) -> Optional[Tuple[str, Dict[str, Tuple[str, Optional[str]]]]]:
+    """
+    Returns normalized prefix and (url path, name) by registration key from manifest file,
+    or None if there is no manifest or it does not match source of views
+    :param router: Router
+    :return: Optional[Tuple[str, Dict[str, Tuple[str, Optional[str]]]]]
+    """
+
+    if router.manifest is None or not os.path.isfile(router.manifest):
+        return None
+
+    with open(router.manifest, encoding='utf-8') as file:
+        manifest = json.load(file)
+
+    if (
+        manifest.get('version') != MANIFEST_VERSION
+        or manifest.get('source_hash') != get_source_hash(router.manifest_config, manifest['modules'])
+    ):
+        warnings.warn(
+            f'Manifest "{router.manifest}" is outdated, routes are registered from views. '
+            f'Run "manage.py routify_compile" to update it',
+            RuntimeWarning,
+        )
+        return None
+
+    routes = {
+        route['key']: (route['url_path'], route['name'])
+        for route in manifest['routes']
+    }
+    return manifest['prefix'], routes
@@ -0,0 +1,233 @@
+from functools import update_wrapper
+from typing import Any, Callable, List, Optional, Sequence
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+from .lazy import LazyView
+from .validator import _validate_type
+
+VIEW_ARGS_ATTRIBUTE = '_routify_view_args'
+'Attribute of request which keeps args and kwargs of view while middleware runs'
+
+
+def _get_middleware(middleware: Optional[Sequence[Any]]) -> List[Any]:
+    """
+    Returns middleware factories, dotted import paths are imported
+    :param middleware: Optional[Sequence[Union[str, Callable]]]
+    :return: List[Callable]
+    """
+
+    _validate_type('middleware', middleware, (list, tuple, type(None)))
+
+    factories = []
+    for factory in middleware or ():
+        if isinstance(factory, str):
+            factory = import_string(factory)
+        if not callable(factory):
+            raise TypeError(f'Expected middleware to be callable or dotted import path, instead got {factory!r}')
+        if not getattr(factory, 'sync_capable', True) and not getattr(factory, 'async_capable', False):
+            raise ValueError(
+                f'Middleware {get_middleware_name(factory)} must have at least one of '
+                f'sync_capable/async_capable set to True'
+            )
+        factories.append(factory)
+    return factories
+
+
+def get_middleware_name(factory: Any) -> str:
+    """
+    Returns dotted import path of middleware factory
+    :param factory: Callable
+    :return: str
+    """
+    return f'{factory.__module__}.{factory.__qualname__}'
+
+
+def _adapt(handler: Callable, handler_is_async: bool, is_async: bool) -> Callable:
+    """
+    Returns handler adapted into sync or async mode, the same way Django handler adapts it
+    :param handler: Callable
+    :param handler_is_async: bool
+    :param is_async: bool
+    :return: Callable
+    """
+
+    if is_async and not handler_is_async:
+        return sync_to_async(handler, thread_sensitive=True)
+    if not is_async and handler_is_async:
+        return async_to_sync(handler)
+    return handler
+
+
+def _adapt_hook(hook: Callable, is_async: bool) -> Callable:
+    """
+    Returns middleware hook adapted into mode of view, the same way Django handler adapts it
+    :param hook: Callable
+    :param is_async: bool
+    :return: Callable
+    """
+
+    return _adapt(hook, iscoroutinefunction(hook), is_async)
+
+
+def compose(view: Callable, middleware: List[Any]) -> Callable:
+    """
+    Returns view wrapped into middleware, the first one is the outermost.
+    Middleware are Django middleware factories, called once here with the next handler,
+    each of them runs in its own mode by sync_capable and async_capable,
+    adapting handlers only where modes differ, so async views stay async
+    behind async capable middleware. Hooks process_view, process_exception
+    and process_template_response run around the view in the same order
+    as Django handler runs hooks of MIDDLEWARE setting, after them template
+    response is rendered, so middleware gets response with content.
+    Exceptions are converted into responses by each middleware layer,
+    so middleware gets error response instead of exception, the same as in Django handler
+    :param view: Callable
+    :param middleware: List[Callable]
+    :return: Callable
+    """
+
+    view_is_async = iscoroutinefunction(view)
+    view_hooks = []
+    exception_hooks = []
+    template_hooks = []
+
+    if view_is_async:
+        async def process_exception(request: HttpRequest, exception: Exception) -> Optional[HttpResponse]:
+            for hook in exception_hooks:
+                response = await hook(request, exception)
+                if response is not None:
+                    return response
+            return None
+
+        async def handler(request: HttpRequest) -> HttpResponse:
+            args, kwargs = getattr(request, VIEW_ARGS_ATTRIBUTE)
+            response = None
+            for hook in view_hooks:
+                response = await hook(request, view, args, kwargs)
+                if response is not None:
+                    break
+
+            if response is None:
+                try:
+                    response = await view(request, *args, **kwargs)
+                except Exception as exception:
+                    response = await process_exception(request, exception)
+                    if response is None:
+                        raise
+
+            if hasattr(response, 'render') and callable(response.render):
+                for name, hook in template_hooks:
+                    response = await hook(request, response)
+                    if response is None:
+                        raise ValueError(
+                            f'{name}.process_template_response didn\'t return an HttpResponse object. '
+                            f'It returned None instead.'
+                        )
+                try:
+                    response = await sync_to_async(response.render, thread_sensitive=True)()
+                except Exception as exception:
+                    response = await process_exception(request, exception)
+                    if response is None:
+                        raise
+            return response
+    else:
+        def process_exception(request: HttpRequest, exception: Exception) -> Optional[HttpResponse]:
+            for hook in exception_hooks:
+                response = hook(request, exception)
+                if response is not None:
+                    return response
+            return None
+
+        def handler(request: HttpRequest) -> HttpResponse:
+            args, kwargs = getattr(request, VIEW_ARGS_ATTRIBUTE)
+            response = None
+            for hook in view_hooks:
+                response = hook(request, view, args, kwargs)
+                if response is not None:
+                    break
+
+            if response is None:
+                try:
+                    response = view(request, *args, **kwargs)
+                except Exception as exception:
+                    response = process_exception(request, exception)
+                    if response is None:
+                        raise
+
+            if hasattr(response, 'render') and callable(response.render):
+                for name, hook in template_hooks:
+                    response = hook(request, response)
+                    if response is None:
+                        raise ValueError(
+                            f'{name}.process_template_response didn\'t return an HttpResponse object. '
+                            f'It returned None instead.'
+                        )
+                try:
+                    response = response.render()
+                except Exception as exception:
+                    response = process_exception(request, exception)
+                    if response is None:
+                        raise
+            return response
+
+    # exceptions are converted into responses by each layer, the same as in Django handler
+    handler = convert_exception_to_response(handler)
+    handler_is_async = view_is_async
+    used = []
+    for factory in reversed(middleware):
+        if not handler_is_async and getattr(factory, 'sync_capable', True):
+            is_async = False
+        else:
+            is_async = getattr(factory, 'async_capable', False)
+
+        adapted = _adapt(handler, handler_is_async, is_async)
+        try:
+            instance = factory(adapted)
+        except MiddlewareNotUsed:
+            continue
+        if instance is None:
+            raise TypeError(f'Middleware factory {get_middleware_name(factory)} returned None')
+
+        # hooks run in mode of view, process_view from the outermost, the others from the innermost
+        if hasattr(instance, 'process_view'):
+            view_hooks.insert(0, _adapt_hook(instance.process_view, view_is_async))
+        if hasattr(instance, 'process_template_response'):
+            template_hooks.append(
+                (get_middleware_name(factory), _adapt_hook(instance.process_template_response, view_is_async))
+            )
+        if hasattr(instance, 'process_exception'):
+            exception_hooks.append(_adapt_hook(instance.process_exception, view_is_async))
+
+        handler = convert_exception_to_response(instance)
+        handler_is_async = is_async
+        used.append(factory)
+
+    # the chain keeps mode of view, so dispatcher of url path keeps its mode too
+    chain = _adapt(handler, handler_is_async, view_is_async)
+    if view_is_async:
+        async def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            setattr(request, VIEW_ARGS_ATTRIBUTE, (args, kwargs))
+            return await chain(request)
+    else:
+        def wrapped(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            setattr(request, VIEW_ARGS_ATTRIBUTE, (args, kwargs))
+            return chain(request)
+
+    # state of not imported view is not copied, only its declared metadata
+    if isinstance(view, LazyView):
+        update_wrapper(wrapped, view, updated=())
+        wrapped.csrf_exempt = view.csrf_exempt
+    else:
+        update_wrapper(wrapped, view)
+    wrapped.middleware = tuple(reversed(used))
+    return wrapped
@@ -1,13 +1,70 @@
 import re
 import uuid
 
-from typing import Any, Dict, List, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern as TypingPattern, Tuple, Type, Union
 from ._abstraction import BasePattern
+from .lazy import LazyView
+
+MEMO_SIZE = 4096
+'Max count of memoized tokens and normalized urls, least recently used are evicted'
+
+TOKENS = Tuple[Union[str, Tuple[str, str]], ...]
+'Text and (param name, param in url) pairs of url'
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _tokenize(tokenizer: Optional[TypingPattern], custom_url: str) -> TOKENS:
+    """
+    Split url in a single pass into text and dynamic params with tokenizer of pattern class,
+    the first group of tokenizer is Django param, the second one is name of param
+    :param tokenizer: Optional[Pattern]
+    :param custom_url: str
+    :return: Tuple[Union[str, Tuple[str, str]], ...]
+    """
+
+    tokens = []
+    position = 0
+    if tokenizer is not None:
+        for match in tokenizer.finditer(custom_url):
+            if match.group(1) is not None:
+                continue # Django param stays a part of text
+
+            if match.start() > position:
+                tokens.append(custom_url[position:match.start()])
+            tokens.append((match.group(2), match.group(0)))
+            position = match.end()
+    if position < len(custom_url):
+        tokens.append(custom_url[position:])
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _join(tokens: TOKENS, django_types: Tuple[str, ...]) -> str:
+    """
+    Returns Django url of tokens with Django types of params in order
+    :param tokens: Tuple[Union[str, Tuple[str, str]], ...]
+    :param django_types: Tuple[str, ...]
+    :return: str
+    """
+
+    parts = []
+    django_types_iter = iter(django_types)
+    for token in tokens:
+        if type(token) is tuple:
+            parts.append(f'<{next(django_types_iter)}:{token[0]}>')
+        else:
+            parts.append(token)
+    return ''.join(parts)
 
 
 class Pattern(BasePattern):
     r"""
-    Pattern class is a default Pattern class
+    Pattern class is a default Pattern class.
+    Every subclass compiles its REGEX once into a tokenizer,
+    which splits url in a single pass into text and dynamic params.
+    REGEX must have exactly one capturing group, the name of param.
+    Tokens of urls and normalized urls are memoized in bounded LRU caches.
 
     Attributes:
         REGEX: str = ''
@@ -17,56 +74,71 @@ class Pattern(BasePattern):
     REGEX = ''
     DJANGO_REGEX = r'<[a-zA-Z]+:([a-zA-Z]+)>'
 
+    _TOKENIZER: Optional[TypingPattern] = None
+    'Compiled Django params and REGEX, Django params are matched first and kept as text'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile()
+
+    @classmethod
+    def _compile(cls) -> None:
+        """
+        Compile tokenizer of class, memoized tokens are kept by tokenizer
+        :return: None
+        """
+
+        cls._TOKENIZER = None
+        if cls.REGEX:
+            groups = re.compile(cls.REGEX).groups
+            if groups != 1:
+                raise ValueError(
+                    f'Expected REGEX of "{cls.__name__}" to have one capturing group for name of param, '
+                    f'instead got {groups}, use (?:...) for other groups'
+                )
+            cls._TOKENIZER = re.compile(rf'(<\w+:\w+>)|{cls.REGEX}')
+
+    def tokenize(self, custom_url: str) -> TOKENS:
+        """
+        Split url in a single pass into text and dynamic params.
+        Text is a str, dynamic param is a (param name, param in url) pair
+        :param custom_url: str
+        :return: Tuple[Union[str, Tuple[str, str]], ...]
+        """
+        return _tokenize(self._TOKENIZER, custom_url)
+
     def normalize(
         self,
         custom_url: str,
         view: Any,
         class_based: bool,
     ) -> str:
-        django_url = custom_url
-        if self.REGEX == '' or not self.is_custom(custom_url):
-            return django_url
+        tokens = self.tokenize(custom_url)
+        params = [token[0] for token in tokens if type(token) is tuple]
+        if not params:
+            return custom_url
 
         annotations = self._get_annotations(
             view=view, class_based=class_based,
         )
+        django_types = tuple(
+            self._get_django_type(annotations.get(url_param))
+            for url_param in params
+        )
 
-        url_params = self._get_url_params(custom_url)
-        dynamic_params = self._get_dynamic_params(custom_url)
-
-        for url_param, dynamic_param in zip(url_params, dynamic_params):
-            python_type = annotations.get(url_param)
-            django_type = self._get_django_type(python_type)
-
-            django_url = django_url.replace(
-                dynamic_param,
-                f'<{django_type}:{url_param}>',
-            )
-
-        return django_url
+        return _join(tokens, django_types)
 
     def _get_url_params(self, custom_url: str) -> List[str]:
-        return re.findall(self.REGEX, custom_url)
+        return [token[0] for token in self.tokenize(custom_url) if type(token) is tuple]
 
     def _get_dynamic_params(self, custom_url: str) -> List[str]:
-        return re.findall(
-            self.REGEX.replace('(', '').replace(')', ''),
-            custom_url,
-        )
+        return [token[1] for token in self.tokenize(custom_url) if type(token) is tuple]
 
     def is_custom(self, url_: str) -> bool:
-        is_custom = False
-
-        params = re.findall(self.DJANGO_REGEX, url_)
-        custom_params = self._get_url_params(url_)
-
-        for custom_param in custom_params:
-            if custom_param not in params:
-                is_custom = True
-                break
-
-        return is_custom
-
+        for token in self.tokenize(url_):
+            if type(token) is tuple:
+                return True
+        return False
 
     @staticmethod
     def _get_annotations(
@@ -75,7 +147,10 @@ class Pattern(BasePattern):
     ) -> Dict[str, Type]:
         annotations = {}
 
-        if class_based:
+        if isinstance(view, LazyView):
+            # view is not imported yet, using declared parameters
+            annotations = view.parameters
+        elif class_based:
             if hasattr(view, 'parameters'):
                 # getting annotations from attribute
                 annotations =  view.parameters
@@ -161,3 +236,6 @@ class AnglePattern(Pattern):
     """
 
     REGEX = r'<(\w+)>'
+
+
+Pattern._compile()
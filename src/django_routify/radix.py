@@ -0,0 +1,172 @@
+import re
+
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from django.urls import URLPattern
+from django.urls.converters import (
+    IntConverter,
+    SlugConverter,
+    StringConverter,
+    UUIDConverter,
+)
+from django.urls.resolvers import RoutePattern
+
+from .dispatch import AliasPattern
+
+SEGMENT_CONVERTERS = (
+    IntConverter,
+    SlugConverter,
+    StringConverter,
+    UUIDConverter,
+)
+'Converters which can never match "/" and can be stored as typed tree nodes'
+
+PARAM_REGEX = re.compile(r'^<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>$')
+'Regular expression for a segment which consists of exactly one parameter'
+
+
+class RadixNode:
+    """
+    Node of the RadixTree.
+    Do not use it in your project!
+
+    Attributes:
+        static: Dict[str, RadixNode]                    := Children for static segments
+        dynamic: Dict[str, Tuple[Pattern, RadixNode]]   := Children for typed converter segments
+        routes: List[int]                               := Indexes of the routes ending in this node
+    """
+
+    __slots__ = ('static', 'dynamic', 'routes')
+
+    def __init__(self) -> None:
+        self.static: Dict[str, RadixNode] = {}
+        self.dynamic: Dict[str, Tuple[Pattern, RadixNode]] = {}
+        self.routes: List[int] = []
+
+
+class RadixTree:
+    """
+    Segment-level radix tree of URLPatterns.
+    Lookup returns candidates in registration order,
+    so the first candidate that resolves is the same one
+    that Django's linear scan would have picked.
+
+    Attributes:
+        root: RadixNode             := Root node of the tree
+        fallback: List[int]         := Indexes of patterns which can not be split by segments
+        patterns: List[URLPattern]  := Patterns the tree was built from
+        segments: List[Optional[List[Tuple[str, Optional[Pattern], Optional[str]]]]]
+                                    := Segments of every pattern, None for fallback patterns
+    """
+
+    def __init__(self, patterns: List[URLPattern]) -> None:
+        """
+        Initial method for RadixTree.
+        :param patterns: List[django.urls.URLPattern]
+        """
+
+        self.root = RadixNode()
+        self.fallback: List[int] = []
+        self.patterns = list(patterns)
+        self.segments = [self._split(url_pattern) for url_pattern in self.patterns]
+
+        for index, segments in enumerate(self.segments):
+            if isinstance(self.patterns[index], AliasPattern):
+                continue # never matches, used only for reversing
+            if segments is None:
+                self.fallback.append(index)
+            else:
+                self._insert(segments, index)
+
+    @staticmethod
+    def _split(url_pattern: URLPattern) -> Optional[List[Tuple[str, Optional[Pattern], Optional[str]]]]:
+        """
+        Split pattern route into segments of (static text or converter regex,
+        compiled converter regex, parameter name).
+        Returns None if pattern can not be stored in tree
+        :param url_pattern: django.urls.URLPattern
+        :return: Optional[List[Tuple[str, Optional[re.Pattern], Optional[str]]]]
+        """
+
+        if not isinstance(url_pattern, URLPattern):
+            return None
+        if not isinstance(url_pattern.pattern, RoutePattern):
+            return None
+
+        route = url_pattern.pattern._route
+        if not isinstance(route, str):
+            return None # lazily translated routes depend on active language
+
+        converters = url_pattern.pattern.converters
+        segments = []
+        for segment in route.split('/'):
+            if '<' not in segment and '>' not in segment:
+                segments.append((segment, None, None))
+                continue
+
+            match = PARAM_REGEX.match(segment)
+            if not match:
+                return None # static text mixed with parameters
+
+            parameter = match.group('parameter')
+            converter = converters.get(parameter)
+            if type(converter) not in SEGMENT_CONVERTERS:
+                return None # converter can match across segments
+
+            segments.append((converter.regex, re.compile(converter.regex), parameter))
+
+        return segments
+
+    def _insert(
+        self,
+        segments: List[Tuple[str, Optional[Pattern], Optional[str]]],
+        index: int,
+    ) -> None:
+        """
+        Insert route segments into tree
+        :param segments: List[Tuple[str, Optional[re.Pattern], Optional[str]]]
+        :param index: int
+        :return: None
+        """
+
+        node = self.root
+        for segment, regex, _ in segments:
+            if regex is None:
+                node = node.static.setdefault(segment, RadixNode())
+            else:
+                if segment not in node.dynamic:
+                    node.dynamic[segment] = (regex, RadixNode())
+                node = node.dynamic[segment][1]
+
+        node.routes.append(index)
+
+    def lookup(self, path: str) -> List[URLPattern]:
+        """
+        Returns patterns that can match path in registration order
+        :param path: str
+        :return: List[django.urls.URLPattern]
+        """
+
+        segments = path.split('/')
+        depth = len(segments)
+
+        found = list(self.fallback)
+        stack = [(self.root, 0)]
+        while stack:
+            node, level = stack.pop()
+            if level == depth:
+                found.extend(node.routes)
+                continue
+
+            segment = segments[level]
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, level + 1))
+
+            if segment:
+                for regex, child in node.dynamic.values():
+                    if regex.fullmatch(segment):
+                        stack.append((child, level + 1))
+
+        found.sort()
+        return [self.patterns[index] for index in found]
@@ -0,0 +1,46 @@
+from itertools import count
+from typing import Any, List
+from weakref import WeakValueDictionary
+
+_routers: WeakValueDictionary = WeakValueDictionary()
+'Every alive Router by order of creation'
+_counter = count()
+_changes = count(1)
+_version = 0
+'Counter of created routers and changes of their urls'
+
+
+def register_router(router: Any) -> None:
+    """
+    Remember router, routers are kept only while they are alive
+    :param router: Router
+    :return: None
+    """
+    _routers[next(_counter)] = router
+    routers_changed()
+
+
+def get_routers() -> List[Any]:
+    """
+    Returns every alive router by order of creation
+    :return: List[Router]
+    """
+    return list(_routers.values())
+
+
+def routers_changed() -> None:
+    """
+    Count change of urls of any router, so caches built from every router are rebuilt
+    :return: None
+    """
+    global _version
+    _version = next(_changes)
+
+
+def get_version() -> int:
+    """
+    Returns counter of created routers and changes of their urls,
+    it changes with version of any router
+    :return: int
+    """
+    return _version
@@ -0,0 +1,524 @@
+from django.urls import URLPattern, URLResolver
+from django.urls.exceptions import Resolver404
+from django.urls.resolvers import ResolverMatch
+
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import LRUCache
+from .codegen import CompiledRoutes, compile_routes, release_routes
+from .filters import PathFilter
+from .flatten import RESOLVER_MATCH_EXTRA_KWARGS, flatten, index_by_first_segment
+from .radix import RadixTree
+from .table import RouteTable
+
+
+class RouterResolver(URLResolver):
+    """
+    URLResolver for routers included with django_routify.include_router.
+    Resolves the same way as Django's URLResolver,
+    but asks _get_candidates for the patterns to try,
+    so engines can skip patterns that can not match.
+
+    Paths without dynamic params are looked up in router.static_urls
+    with a single dict lookup before any pattern is tried.
+    Paths which no route can match by first segment or count of segments
+    are rejected before any pattern is tried.
+    Optional LRU cache keeps matches of recently resolved paths,
+    matches are shared between requests and invalidated by router.version.
+
+    In flat mode routers included with Router.include are not resolved
+    by nested resolvers, their patterns with compiled prefixes are tried
+    in one list with patterns of router, grouped by their first segment,
+    see django_routify.flatten.
+
+    Attributes:
+        router: Router                  := Router which urls are resolved
+        flat: bool = False              := Resolve patterns of included routers in one list
+        cache: Optional[LRUCache]       := Cache of matches by path, None if disabled
+        static_hits: int = 0            := Count of paths resolved with router.static_urls
+        static_misses: int = 0          := Count of paths which fell back to pattern matching
+        rejected: int = 0               := Count of paths rejected by router.path_filter
+    """
+
+    def __init__(
+        self,
+        *args,
+        router: Any,
+        cache_size: Optional[int] = None,
+        flat: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Initial method for RouterResolver.
+        :param args: Any
+        :param router: Router
+        :param cache_size: Optional[int]
+        :param flat: bool
+        :param kwargs: Any
+        """
+
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.flat = flat
+        self.__flat: Optional[RouteTable] = None
+        self.__flat_index = None
+
+        self.cache = None
+        if cache_size is not None:
+            self.cache = LRUCache(cache_size)
+        self.__cache_version = router.version
+
+        self.static_hits = 0
+        self.static_misses = 0
+        self.rejected = 0
+        # snapshot and url path -> True if static url is shadowed by dynamic url registered before
+        self.__static_shadowed: Tuple[Optional[RouteTable], Dict[str, bool]] = (None, {})
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        stats getter\n
+        Counters of resolving
+        :return: Dict[str, int]
+        """
+        stats = {
+            'static_hits': self.static_hits,
+            'static_misses': self.static_misses,
+            'rejected': self.rejected,
+        }
+        if self.cache is not None:
+            stats.update({
+                'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses,
+                'cache_evictions': self.cache.evictions,
+            })
+        return stats
+
+    def __get_flat(self) -> RouteTable:
+        """
+        Private method which returns snapshot of flattened patterns, static urls and path filter,
+        flattened again when routes of any router in the tree were changed
+        :return: django_routify.table.RouteTable
+        """
+
+        table = self.__flat
+        version = self.router.version
+        if table is None or table.version != version:
+            patterns, static_urls, path_filter = flatten(self.router)
+            table = self.__flat = RouteTable(version, tuple(patterns), static_urls, path_filter)
+        return table
+
+    @property
+    def table(self) -> RouteTable:
+        """
+        table getter\n
+        Snapshot of routes which paths are resolved with,
+        flattened in flat mode
+        :return: django_routify.table.RouteTable
+        """
+        if self.flat:
+            return self.__get_flat()
+        return self.router.table
+
+    @property
+    def url_patterns(self) -> Tuple[Any, ...]:
+        """
+        url_patterns getter\n
+        Patterns of router for reversing, the same as routes of router in any mode
+        :return: Tuple[Union[django.urls.URLPattern, django.urls.URLResolver], ...]
+        """
+        return self.router.table.urls
+
+    @property
+    def routes(self) -> Tuple[Any, ...]:
+        """
+        routes getter\n
+        Patterns which are tried for paths in order
+        :return: Tuple[Union[django.urls.URLPattern, django.urls.URLResolver], ...]
+        """
+        return self.table.urls
+
+    @property
+    def static_urls(self) -> Dict[str, URLPattern]:
+        """
+        static_urls getter\n
+        Patterns without dynamic params by url path
+        :return: Dict[str, django.urls.URLPattern]
+        """
+        return self.table.static_urls
+
+    @property
+    def path_filter(self) -> PathFilter:
+        """
+        path_filter getter\n
+        First segments and segment counts of routes
+        :return: django_routify.filters.PathFilter
+        """
+        return self.table.path_filter
+
+    def reset(self) -> None:
+        """
+        Forget reverse dictionaries populated by Django,
+        they are populated again from the current routes on the next reverse
+        :return: None
+        """
+
+        self._reverse_dict = {}
+        self._namespace_dict = {}
+        self._app_dict = {}
+        self._callback_strs = set()
+        self._populated = False
+
+    def warmup(self) -> None:
+        """
+        Build everything resolving and reversing need before the first path:
+        snapshot of routes, regexes of patterns and reverse dictionaries
+        :return: None
+        """
+
+        table = self.table
+        self.pattern.regex
+        for url_pattern in table.urls:
+            url_pattern.pattern.regex
+        self._get_candidates('', table)
+
+        # static urls shadowed by dynamic urls registered before,
+        # otherwise the first request of each static url checks it with every pattern
+        tree = RadixTree(table.urls)
+        static_shadowed = {}
+        for url_path, static_pattern in table.static_urls.items():
+            for pattern in tree.lookup(url_path):
+                if self._resolve_pattern(pattern, url_path, []):
+                    static_shadowed[url_path] = pattern is not static_pattern
+                    break
+        self.__static_shadowed = (table, static_shadowed)
+
+        self.reverse_dict
+        self.namespace_dict
+        self.app_dict
+
+    def _get_candidates(self, path: str, table: RouteTable) -> Tuple[Any, ...]:
+        """
+        Returns patterns of snapshot which should be tried for path in order,
+        in flat mode only patterns which can match first segment of path
+        :param path: str
+        :param table: django_routify.table.RouteTable
+        :return: Tuple[Union[django.urls.URLPattern, django.urls.URLResolver], ...]
+        """
+
+        if not self.flat:
+            return table.urls
+
+        entry = self.__flat_index
+        if entry is None or entry[0] is not table:
+            entry = self.__flat_index = (table, index_by_first_segment(table.urls))
+        index = entry[1]
+        candidates = index.get(path.partition('/')[0])
+        if candidates is None:
+            return index[None]
+        return candidates
+
+    def resolve(self, path: str) -> ResolverMatch:
+        path = str(path) # path may be a reverse_lazy object
+
+        # one snapshot for the whole path, routes may be swapped meanwhile
+        table = self.table
+
+        cache = self.cache
+        if cache is None:
+            return self._resolve_path(path, table)
+
+        version = table.version
+        if version != self.__cache_version:
+            # urls were changed, cached matches are outdated
+            cache.clear()
+            self.__cache_version = version
+
+        entry = cache.get(path)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        resolver_match = self._resolve_path(path, table)
+        cache.set(path, (version, resolver_match))
+        return resolver_match
+
+    def _resolve_path(self, path: str, table: RouteTable) -> ResolverMatch:
+        """
+        Resolve path with snapshot of routes without cache
+        :param path: str
+        :param table: django_routify.table.RouteTable
+        :return: django.urls.ResolverMatch
+        """
+
+        tried = []
+        match = self.pattern.match(path)
+        if not match:
+            raise Resolver404({'path': path})
+
+        new_path, args, kwargs = match
+
+        shadowed_table, static_shadowed = self.__static_shadowed
+        if shadowed_table is not table:
+            static_shadowed = {}
+            self.__static_shadowed = (table, static_shadowed)
+
+        static_pattern = table.static_urls.get(new_path)
+        if static_pattern is not None and static_shadowed.get(new_path) is False:
+            self.static_hits += 1
+            return self._build_match(
+                static_pattern,
+                static_pattern.resolve(new_path),
+                args,
+                kwargs,
+                tried,
+            )
+        self.static_misses += 1
+
+        if not table.path_filter.can_match(new_path):
+            # no route has such first segment or count of segments
+            self.rejected += 1
+            raise Resolver404({'tried': tried, 'path': new_path})
+
+        pattern, sub_match = self._resolve_candidates(new_path, tried, table)
+        if pattern is None:
+            raise Resolver404({'tried': tried, 'path': new_path})
+
+        if static_pattern is not None:
+            # static url can be used only if nothing before matches its path,
+            # checked once by the first pattern matching
+            static_shadowed[new_path] = pattern is not static_pattern
+
+        return self._build_match(pattern, sub_match, args, kwargs, tried)
+
+    def _resolve_candidates(
+        self,
+        path: str,
+        tried: List[Any],
+        table: RouteTable,
+    ) -> Tuple[Any, Optional[ResolverMatch]]:
+        """
+        Resolve path with the first matching candidate of snapshot.
+        Returns pattern and its match, or (None, None) if nothing matches
+        :param path: str
+        :param tried: List[Any]
+        :param table: django_routify.table.RouteTable
+        :return: Tuple[Union[django.urls.URLPattern, django.urls.URLResolver, None], Optional[django.urls.ResolverMatch]]
+        """
+
+        for pattern in self._get_candidates(path, table):
+            sub_match = self._resolve_pattern(pattern, path, tried)
+            if sub_match:
+                return pattern, sub_match
+
+        return None, None
+
+    def _resolve_pattern(
+        self,
+        pattern: Any,
+        path: str,
+        tried: List[Any],
+    ) -> Optional[ResolverMatch]:
+        """
+        Resolve path with one pattern, recording it in tried if it does not match
+        :param pattern: Union[django.urls.URLPattern, django.urls.URLResolver]
+        :param path: str
+        :param tried: List[Any]
+        :return: Optional[django.urls.ResolverMatch]
+        """
+
+        try:
+            sub_match = pattern.resolve(path)
+        except Resolver404 as e:
+            self._extend_tried(tried, pattern, e.args[0].get('tried'))
+            return None
+
+        if not sub_match:
+            tried.append([pattern])
+        return sub_match
+
+    def _build_match(
+        self,
+        pattern: Any,
+        sub_match: ResolverMatch,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        tried: List[Any],
+    ) -> ResolverMatch:
+        """
+        Merge sub match of pattern with arguments captured by prefix
+        the same way Django's URLResolver does
+        :param pattern: Union[django.urls.URLPattern, django.urls.URLResolver]
+        :param sub_match: django.urls.ResolverMatch
+        :param args: tuple
+        :param kwargs: Dict[str, Any]
+        :param tried: List[Any]
+        :return: django.urls.ResolverMatch
+        """
+
+        sub_match_dict = {**kwargs, **self.default_kwargs}
+        sub_match_dict.update(sub_match.kwargs)
+
+        # If there are any named groups, ignore all non-named groups.
+        sub_match_args = sub_match.args
+        if not sub_match_dict:
+            sub_match_args = args + sub_match.args
+
+        current_route = ''
+        if not isinstance(pattern, URLPattern):
+            current_route = str(pattern.pattern)
+
+        self._extend_tried(tried, pattern, sub_match.tried)
+
+        extra = {}
+        if RESOLVER_MATCH_EXTRA_KWARGS:
+            extra = {
+                'captured_kwargs': sub_match.captured_kwargs,
+                'extra_kwargs': {
+                    **self.default_kwargs,
+                    **sub_match.extra_kwargs,
+                },
+            }
+
+        return ResolverMatch(
+            sub_match.func,
+            sub_match_args,
+            sub_match_dict,
+            sub_match.url_name,
+            [self.app_name] + sub_match.app_names,
+            [self.namespace] + sub_match.namespaces,
+            self._join_route(current_route, sub_match.route),
+            tried,
+            **extra,
+        )
+
+
+class RadixResolver(RouterResolver):
+    """
+    RouterResolver which looks up candidates in a segment-level radix tree,
+    so resolving takes time proportional to the path depth
+    instead of the number of routes.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__tree: Optional[Tuple[RouteTable, RadixTree]] = None
+
+    def __get_tree(self, table: RouteTable) -> RadixTree:
+        """
+        Private method which returns radix tree built from routes of snapshot
+        :param table: django_routify.table.RouteTable
+        :return: django_routify.radix.RadixTree
+        """
+
+        entry = self.__tree
+        if entry is None or entry[0] is not table:
+            entry = self.__tree = (table, RadixTree(table.urls))
+        return entry[1]
+
+    @property
+    def tree(self) -> RadixTree:
+        """
+        tree getter\n
+        Radix tree built from routes,
+        rebuilt when routes were changed after include
+        :return: django_routify.radix.RadixTree
+        """
+        return self.__get_tree(self.table)
+
+    def _get_candidates(self, path: str, table: RouteTable) -> List[Any]:
+        return self.__get_tree(table).lookup(path)
+
+
+class CompiledResolver(RouterResolver):
+    """
+    RouterResolver which dispatches paths with a module generated from routes,
+    cached on disk in ROUTIFY_CACHE_DIR and keyed by hash of the route table.
+    Generated code converts dynamic params itself,
+    so URLPattern regexes are not compiled or matched for resolving.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__compiled: Optional[Tuple[RouteTable, CompiledRoutes]] = None
+        self.__lock = Lock()
+
+    def __get_compiled(self, table: RouteTable) -> CompiledRoutes:
+        """
+        Private method which returns routes of snapshot compiled into module
+        :param table: django_routify.table.RouteTable
+        :return: django_routify.codegen.CompiledRoutes
+        """
+
+        entry = self.__compiled
+        if entry is not None and entry[0] is table:
+            return entry[1]
+
+        with self.__lock:
+            previous = self.__compiled
+            if previous is not None and previous[0] is table:
+                return previous[1]
+            entry = self.__compiled = (table, compile_routes(self.router.prefix, table.urls))
+        # module of swapped routes is not imported anymore, unless other resolvers use it
+        if previous is not None:
+            release_routes(previous[1])
+        return entry[1]
+
+    @property
+    def compiled(self) -> CompiledRoutes:
+        """
+        compiled getter\n
+        Routes compiled from routes,
+        recompiled when routes were changed after include
+        :return: django_routify.codegen.CompiledRoutes
+        """
+        return self.__get_compiled(self.table)
+
+    def warmup(self) -> None:
+        super().warmup()
+        self.compiled
+
+    def _resolve_candidates(
+        self,
+        path: str,
+        tried: List[Any],
+        table: RouteTable,
+    ) -> Tuple[Any, Optional[ResolverMatch]]:
+        compiled = self.__get_compiled(table)
+
+        for index, captured_kwargs in compiled.dispatch(path):
+            pattern = compiled.patterns[index]
+            if captured_kwargs is None:
+                sub_match = self._resolve_pattern(pattern, path, tried)
+                if sub_match:
+                    return pattern, sub_match
+                continue
+
+            # same as URLPattern.resolve with already converted kwargs
+            extra = {}
+            if RESOLVER_MATCH_EXTRA_KWARGS:
+                extra = {
+                    'captured_kwargs': captured_kwargs,
+                    'extra_kwargs': pattern.default_args,
+                }
+
+            return pattern, ResolverMatch(
+                pattern.callback,
+                (),
+                {**captured_kwargs, **pattern.default_args},
+                pattern.pattern.name,
+                getattr(pattern, 'app_names', None),
+                getattr(pattern, 'namespaces', None),
+                route=str(pattern.pattern),
+                **extra,
+            )
+
+        return None, None
+
+
+ENGINES = {
+    'django': RouterResolver,
+    'radix': RadixResolver,
+    'compiled': CompiledResolver,
+}
+'Resolver classes available for include_router'
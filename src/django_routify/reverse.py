@@ -0,0 +1,132 @@
+import re
+
+from typing import Any, Dict, Optional, Tuple
+
+from django.urls import URLResolver
+from django.urls.converters import get_converters
+
+PARAMETER_REGEX = re.compile(r'<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>')
+'Regular expression of Django path params, same as Django uses'
+
+
+class UrlTemplate:
+    """
+    Precompiled string template of one named url path.
+    Formatting it calls only converters to_url and one string formatting.
+    Route is parsed on the first formatting, so registration does not pay for it.
+
+    Attributes:
+        route: str                  := Django route the template was built from
+        format: Optional[str]       := Printf style template with a placeholder per param, None until parsed
+        converters: Dict[str, Any]  := Converters by param name
+        regexes: Dict[str, Pattern] := Compiled converter regexes by param name
+        params: frozenset           := Names of params
+    """
+
+    __slots__ = ('route', 'format', 'converters', 'regexes', 'params')
+
+    def __init__(self, route: str) -> None:
+        """
+        Initial method for UrlTemplate.
+        :param route: str
+        """
+
+        self.route = route
+        self.format: Optional[str] = None
+
+    def _parse(self) -> None:
+        """
+        Parse route into template, converters and their regexes
+        :return: None
+        """
+
+        route = self.route
+        converters: Dict[str, Any] = {}
+        regexes = {}
+
+        parts = []
+        position = 0
+        for match in PARAMETER_REGEX.finditer(route):
+            parameter = match.group('parameter')
+            converter = get_converters()[match.group('converter') or 'str']
+
+            parts.append(route[position:match.start()].replace('%', '%%'))
+            parts.append(f'%({parameter})s')
+            position = match.end()
+
+            converters[parameter] = converter
+            regexes[parameter] = re.compile(converter.regex)
+        parts.append(route[position:].replace('%', '%%'))
+
+        self.converters = converters
+        self.regexes = regexes
+        self.params = frozenset(converters)
+        self.format = ''.join(parts) # the last one, it marks template as parsed
+
+    def expand(self, kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns url path with converted kwargs
+        or None if kwargs do not fit the template
+        :param kwargs: Dict[str, Any]
+        :return: Optional[str]
+        """
+
+        if self.format is None:
+            self._parse()
+
+        if self.params.symmetric_difference(kwargs):
+            return None
+        if not self.params:
+            return self.format % ()
+
+        values = {}
+        for parameter, converter in self.converters.items():
+            try:
+                value = str(converter.to_url(kwargs[parameter]))
+            except ValueError:
+                return None
+            if not self.regexes[parameter].fullmatch(value):
+                return None
+            values[parameter] = value
+        return self.format % values
+
+    def __repr__(self) -> str:
+        return f'UrlTemplate({self.route!r})'
+
+
+def find_mount(router: Any, resolver: URLResolver) -> Optional[str]:
+    """
+    Returns static path where router is included into urlconf of resolver
+    under its own namespace at top level, so reversing "app_name:name" finds it.
+    Returns None if router is not included this way
+    :param router: Router
+    :param resolver: django.urls.URLResolver
+    :return: Optional[str]
+    """
+
+    if not router.app_name:
+        return None
+
+    app_list = resolver.app_dict.get(router.app_name)
+    if not app_list:
+        return None
+
+    # Django picks namespace equal to app_name or the first instance
+    namespace = router.app_name if router.app_name in app_list else app_list[0]
+    found: Optional[Tuple[str, URLResolver]] = resolver.namespace_dict.get(namespace)
+    if found is None:
+        return None
+
+    extra, instance = found
+    if getattr(instance, 'router', None) is not router:
+        return None
+
+    # prefix of router itself is a part of templates, outer prefixes must be static
+    regex = instance.pattern.regex.pattern.lstrip('^')
+    if not extra.endswith(regex):
+        return None
+    mount_regex = extra[:len(extra) - len(regex)]
+    mount = re.sub(r'\\(.)', r'\1', mount_regex)
+    if re.escape(mount) != mount_regex:
+        return None
+    return mount
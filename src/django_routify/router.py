@@ -1,14 +1,31 @@
-from django.utils.decorators import method_decorator
-from django.views.decorators.http import require_http_methods
-
-from django.urls import path
+from django.urls import URLResolver, clear_url_caches, get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
 from django.views import View
 
+from collections import abc
 from inspect import isclass
-from typing import List, Optional, Union, Literal
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Literal
+from urllib.parse import quote
 import re
 
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
 from ._abstraction import BaseRouter, FUNC_BASED_VIEW
+from .bulk import RouteSpecError, _get_spec
+from .caching import CachePolicy, ResponseCache, cache_view
+from .cbv import as_view as _as_view, stateless_view
+from .dispatch import MethodDispatcher, RouteRecord, ViewRecord
+from .executors import run_in_executor
+from .filters import PathFilter
+from .lazy import LazyView
+from .loop import run_in_loop
+from .manifest import get_key
+from .middleware import _get_middleware, compose
+from .registry import routers_changed
+from .reverse import UrlTemplate, find_mount
 from .validator import _validate_type
 
 
@@ -19,8 +36,34 @@ class Router(BaseRouter):
     Attributes:
         ALLOWED_METHODS: str                := ALLOWED_METHODS is a valid HTTP methods
         __app_name: Optional[str]           := Application name same as app_name in urls.py
+        __host: Optional[str] = None        := Host or host pattern served by router with include_hosts
         __prefix: str                       := Prefix for each url paths
+        __prefix_normalized: bool = False   := Is prefix already normalized with dynamic pattern
         __urls: List[URLPattern]            := List of URLPatterns that can be included in urlpatterns
+        __records: List[Any]                := Route records and URLResolvers waiting for creating URLPatterns
+        __materialized: bool = False        := Were urls accessed, after that URLPatterns are created at once
+        __static_urls: Dict[str, URLPattern] := Index of URLPatterns without dynamic params by url path
+        __dispatchers: Dict[str, MethodDispatcher] := Method dispatchers by url path
+        __version: int = 0                  := Counter of changes of urls
+        __children: List[BaseRouter]        := Routers included with include
+        __parents: List[BaseRouter]         := Routers this router is included into
+        __path_filter: PathFilter           := First segments and segment counts of urls
+        __reverse_table: Dict[str, List[UrlTemplate]] := Url templates by name, last registered first
+        __mounts: WeakKeyDictionary         := Static paths where router is included by root URLResolver
+        __lazy_views: List[LazyView]        := Views registered by dotted import path
+        __warm_kwargs: Dict[str, Dict[str, Any]] := Sample kwargs of GET routes for synthetic warm up requests by url path
+        __manifest: Optional[str] = None    := File of precompiled routes
+        __manifest_config: Optional[List[Any]] := Options of router which manifest depends on
+        __manifest_routes: Optional[tuple]  := Normalized prefix and routes loaded from manifest
+        __registrations: List[tuple]        := Registered views with their keys, url paths and names
+        __routes: List[Any]                 := View records and URLResolvers of included routers in order
+        __table: Optional[RouteTable]       := Snapshot of routes used by resolvers
+        __lock: RLock                       := Lock of changing routes at runtime
+        __resolvers: WeakSet                := URLResolvers made by include_router for router
+        __versioning: Optional[Versioning]  := Selecting API version of request for versioned views
+        __middleware: List[Any]             := Middleware factories wrapping every view of router
+        __persistent_loop: bool = False     := Run async views in persistent event loop under WSGI
+        __executor: Optional[str] = None    := Route executor running sync views under ASGI
         __auto_naming: bool = True          := Auto naming for every view
         __auto_trailing_slash: bool = False := Auto trailing slash for every view path
         __dynamic_pattern: Pattern          := Dynamic pattern for parsing and normalizing custom urls
@@ -40,20 +83,241 @@ class Router(BaseRouter):
         :return: Union[FUNC_BASED_VIEW, View]
         """
 
+        record, prefix = self.__prepare(
+            view,
+            url_path,
+            kwargs.get('name', None),
+            kwargs.get('methods', None),
+            kwargs.get('version', None),
+            kwargs.get('fast', False),
+            kwargs.get('middleware', None),
+            kwargs.get('executor', None),
+            kwargs.get('stateless', False),
+            kwargs.get('cache', None),
+        )
+
+        warm_kwargs = kwargs.get('warm_kwargs', None)
+        _validate_type('warm_kwargs', warm_kwargs, (dict, type(None)))
+        if warm_kwargs is not None:
+            self.warm_kwargs[record.url_path] = warm_kwargs
+
+        dispatcher = self.__add(self.__build(record, prefix))
+        if self.materialized:
+            dispatcher.rebuild()
+            self._BaseRouter__materialize()
+        self.__changed()
+        return view
+
+    def __prepare(
+        self,
+        view: Union[FUNC_BASED_VIEW, View],
+        url_path: str,
+        name: Optional[str],
+        methods: Optional[List[str]],
+        version: Optional[str] = None,
+        fast: bool = False,
+        middleware: Optional[List[Any]] = None,
+        executor: Optional[str] = None,
+        stateless: bool = False,
+        cache: Optional[CachePolicy] = None,
+    ) -> Tuple[ViewRecord, str]:
+        """
+        Private method which validate and normalize registration of view without changing Router,
+        returns its record without view called by dispatcher, and normalized prefix of Router
+        :param view: Union[FUNC_BASED_VIEW, View]
+        :param url_path: str
+        :param name: Optional[str]
+        :param methods: Optional[List[str]]
+        :param version: Optional[str]
+        :param fast: bool
+        :param middleware: Optional[List[Union[str, Callable]]]
+        :param executor: Optional[str]
+        :param stateless: bool
+        :param cache: Optional[CachePolicy]
+        :return: Tuple[django_routify.dispatch.ViewRecord, str]
+        """
+
         class_based = False
-        if isclass(view) and issubclass(view, View):
+        if isinstance(view, LazyView):
+            class_based = view.class_based
+        elif isclass(view) and issubclass(view, View):
             class_based = True
 
-        name: Optional[str] = kwargs.get('name', None)
-        methods: Optional[List[str]] = kwargs.get('methods', None)
-
         _validate_type('url_path', url_path, str)
         _validate_type('name', name, (str, type(None)))
         _validate_type('methods', methods, (list, type(None)))
+        _validate_type('version', version, (str, type(None)))
+        _validate_type('fast', fast, bool)
+        if version is not None and self.versioning is None:
+            raise ValueError(f'Router "{self.app_name}" needs "versioning" option for versioned views')
+        middleware = _get_middleware(middleware)
+        _validate_type('executor', executor, (str, type(None)))
+        if executor is not None and self.persistent_loop:
+            raise ValueError('Options "persistent_loop" and "executor" can not be used together')
+        _validate_type('stateless', stateless, bool)
+        if stateless and (not class_based or isinstance(view, LazyView)):
+            raise TypeError(f'Option "stateless" needs class based view, instead got {view!r}')
+        _validate_type('cache', cache, (CachePolicy, type(None)))
+        cache = None if cache is None else ResponseCache(cache)
+
+        key = None
+        route = None
+        if self.manifest is not None:
+            key = get_key(url_path, view, name, methods)
+            if self._BaseRouter__manifest_routes is not None:
+                prefix, routes = self._BaseRouter__manifest_routes
+                route = routes.get(key)
+
+        if route is not None:
+            # normalized by "manage.py routify_compile" already
+            url_path, name = route
+        else:
+            prefix, url_path, name = self.__normalize(view, url_path, name, class_based)
+
+        if methods:
+            for i in range(len(methods)):
+                methods[i] = methods[i].upper()
+                if methods[i] not in self.ALLOWED_METHODS:
+                    raise ValueError(
+                        f'Method "{methods[i]}" is not in '
+                        f'allowed methods {self.ALLOWED_METHODS}'
+                    )
+
+        record = ViewRecord(view, None, url_path, name, methods, key, version, fast, middleware, executor, stateless, cache)
+        return record, prefix
+
+    def __build(self, record: ViewRecord, prefix: str) -> ViewRecord:
+        """
+        Private method which set normalized prefix, unless the first view set it already,
+        and returns valid record with view called by dispatcher
+        :param record: django_routify.dispatch.ViewRecord := Record returned by __prepare
+        :param prefix: str := Prefix normalized by __prepare
+        :return: django_routify.dispatch.ViewRecord
+        """
+
+        if not self._BaseRouter__prefix_normalized:
+            self._BaseRouter__prefix = prefix
+            self._BaseRouter__prefix_normalized = True
+
+        as_view = self.__get_as_view(record.view, record.middleware, record.executor, record.stateless, record.cache)
+        return record._replace(as_view=as_view)
+
+    def __get_as_view(
+        self,
+        view: Union[FUNC_BASED_VIEW, View],
+        middleware: List[Any],
+        executor: Optional[str] = None,
+        stateless: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ) -> Union[FUNC_BASED_VIEW, LazyView]:
+        """
+        Private method which returns view which is called by dispatcher,
+        wrapped into middleware of router and route once,
+        async view is run in persistent event loop with "persistent_loop" option
+        and sync view in route executor with "executor" option
+        :param view: Union[FUNC_BASED_VIEW, View]
+        :param middleware: List[Callable] := Middleware of route
+        :param executor: Optional[str] := Route executor of route
+        :param stateless: bool := Is class based view dispatched by one instance
+        :param cache: Optional[ResponseCache] := Response cache of route, inside middleware
+        :return: Union[FUNC_BASED_VIEW, LazyView]
+        """
+
+        as_view = view
+        if stateless:
+            as_view = stateless_view(view)
+        elif isclass(view) and issubclass(view, View):
+            # async handlers are detected here, so dispatcher stays a coroutine function
+            as_view = _as_view(view)
+        # LazyView is imported and converted by as_view() on first call
+
+        if cache is not None:
+            as_view = cache_view(as_view, cache)
+        if self.middleware or middleware:
+            as_view = compose(as_view, [*self.middleware, *middleware])
+        if self.persistent_loop and iscoroutinefunction(as_view):
+            as_view = run_in_loop(as_view)
+
+        executor = executor or self.executor
+        if executor is not None and not iscoroutinefunction(as_view):
+            as_view = run_in_executor(as_view, executor)
+        return as_view
+
+    def __add(self, record: ViewRecord) -> MethodDispatcher:
+        """
+        Private method which add built record into route records of Router
+        and returns dispatcher of its url path, which must be rebuilt after
+        if urls are already materialized
+        :param record: django_routify.dispatch.ViewRecord := Record returned by __build
+        :return: django_routify.dispatch.MethodDispatcher
+        """
+
+        view, as_view, url_path, name, methods = record.view, record.as_view, record.url_path, record.name, record.methods
+        key, version, fast = record.key, record.version, record.fast
+        self._BaseRouter__routes.append(record)
+
+        if isinstance(view, LazyView):
+            self._BaseRouter__lazy_views.append(view)
+
+        if key is not None:
+            self._BaseRouter__registrations.append((view, key, (url_path, name)))
+
+        # views registered on the same url path share one URLPattern,
+        # which dispatches request by method
+        dispatcher = self.dispatchers.get(url_path)
+        if dispatcher is not None:
+            dispatcher.add(as_view, methods, rebuild=False, version=version)
+            dispatcher.warm_kwargs = self.warm_kwargs.get(url_path)
+            if fast:
+                dispatcher.fast.update(methods or (None,))
+
+            if name and name not in dispatcher.names:
+                # keep additional name for reversing
+                dispatcher.names.append(name)
+                self._BaseRouter__records.append(RouteRecord(url_path, name, dispatcher, alias=True))
+                self.__add_template(name, url_path)
+
+            return dispatcher
+
+        dispatcher = MethodDispatcher(self.versioning)
+        dispatcher.add(as_view, methods, rebuild=False, version=version)
+        dispatcher.warm_kwargs = self.warm_kwargs.get(url_path)
+        if fast:
+            dispatcher.fast.update(methods or (None,))
+        if name:
+            dispatcher.names.append(name)
+
+        # URLPattern is created when urls are accessed
+        self._BaseRouter__dispatchers[url_path] = dispatcher
+        self._BaseRouter__records.append(RouteRecord(url_path, name, dispatcher))
+
+        if name:
+            self.__add_template(name, url_path)
+
+        return dispatcher
+
+    def __normalize(
+        self,
+        view: Union[FUNC_BASED_VIEW, View],
+        url_path: str,
+        name: Optional[str],
+        class_based: bool,
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Private method which normalize prefix and url path with dynamic pattern
+        and returns prefix, url path and name of view, Router is not changed
+        :param view: Union[FUNC_BASED_VIEW, View]
+        :param url_path: str
+        :param name: Optional[str]
+        :param class_based: bool
+        :return: Tuple[str, str, Optional[str]]
+        """
 
-        if self.dynamic_pattern.is_custom(self.prefix):
-            self._BaseRouter__prefix = self.dynamic_pattern.normalize(
-                custom_url=self.prefix,
+        # prefix is normalized once, with annotations of the first view
+        prefix = self.prefix
+        if not self._BaseRouter__prefix_normalized and self.dynamic_pattern.is_custom(prefix):
+            prefix = self.dynamic_pattern.normalize(
+                custom_url=prefix,
                 view=view,
                 class_based=class_based,
             )
@@ -63,7 +327,7 @@ class Router(BaseRouter):
             if url_path != '':
                 url_path += '/'
 
-        if url_path == '/' and self.prefix[-1:] == '/':
+        if url_path == '/' and prefix[-1:] == '/':
             url_path = ''
 
         if self.dynamic_pattern.is_custom(url_path):
@@ -89,41 +353,20 @@ class Router(BaseRouter):
 
             name = name.lower()
 
-        if methods:
-            for i in range(len(methods)):
-                methods[i] = methods[i].upper()
-                if methods[i] not in self.ALLOWED_METHODS:
-                    raise ValueError(
-                        f'Method "{methods[i]}" is not in '
-                        f'allowed methods {self.ALLOWED_METHODS}'
-                    )
-
-            require_http_methods_decorator = require_http_methods(methods)
-
-            if class_based:
-                # wrap Class-Based-View into decorator with require methods
-                # using method_decorator
-                view = method_decorator(
-                    decorator=require_http_methods_decorator,
-                    name='dispatch',
-                )(view)
-            else:
-                # wrap Function-Based-View into decorator with require methods
-                view = require_http_methods_decorator(view)
+        return prefix, url_path, name
 
-        as_view = view
-        if class_based:
-            as_view = view.as_view()
-
-        self._BaseRouter__urls.append(
-            path(
-                url_path,
-                as_view,
-                name=name,
-            )
-        )
+    def __add_template(self, name: str, url_path: str) -> None:
+        """
+        Private method which add url template of url path into reverse table
+        :param name: str
+        :param url_path: str
+        :return: None
+        """
 
-        return view
+        # Django tries patterns with the same name from the last registered one,
+        # list is copied so url_for running at the same time sees the old or the new one
+        templates = self.reverse_table.get(name, [])
+        self.reverse_table[name] = [UrlTemplate(self.prefix + url_path), *templates]
 
     def __register_with_single_method(
         self,
@@ -149,9 +392,45 @@ class Router(BaseRouter):
             url_path,
             methods=[method],
             name=name,
+            version=kwargs.get('version'),
+            fast=kwargs.get('fast', False),
+            middleware=kwargs.get('middleware'),
+            executor=kwargs.get('executor'),
+            stateless=kwargs.get('stateless', False),
+            cache=kwargs.get('cache'),
+            warm_kwargs=kwargs.get('warm_kwargs'),
         )
 
+    @staticmethod
+    def __get_lazy_view(kwargs: dict) -> Optional[LazyView]:
+        """
+        Private method which pops "view" and its metadata from kwargs
+        and returns LazyView, or None if view is not given
+        :param kwargs: Dict[str, Any]
+        :return: Optional[django_routify.lazy.LazyView]
+        """
+
+        view = kwargs.pop('view', None)
+        metadata = {
+            key: kwargs.pop(key)
+            for key in ('parameters', 'class_based', 'is_async', 'csrf_exempt')
+            if key in kwargs
+        }
+        if view is None:
+            return None
+
+        _validate_type('view', view, (str, LazyView))
+        if isinstance(view, LazyView):
+            if metadata:
+                raise TypeError(f'Metadata {tuple(metadata)} must be given to LazyView itself')
+            return view
+        return LazyView(view, **metadata)
+
     def route(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register(lazy_view, url_path, **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -163,6 +442,10 @@ class Router(BaseRouter):
         return register
 
     def get(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register_with_single_method(lazy_view, url_path, method='GET', **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -175,6 +458,10 @@ class Router(BaseRouter):
         return register
 
     def post(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register_with_single_method(lazy_view, url_path, method='POST', **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -187,6 +474,10 @@ class Router(BaseRouter):
         return register
 
     def put(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register_with_single_method(lazy_view, url_path, method='PUT', **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -199,6 +490,10 @@ class Router(BaseRouter):
         return register
 
     def patch(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register_with_single_method(lazy_view, url_path, method='PATCH', **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -211,6 +506,10 @@ class Router(BaseRouter):
         return register
 
     def delete(self, url_path: str, **kwargs):
+        lazy_view = self.__get_lazy_view(kwargs)
+        if lazy_view is not None:
+            return self.__register_with_single_method(lazy_view, url_path, method='DELETE', **kwargs)
+
         def register(view: Union[FUNC_BASED_VIEW, View]) -> Union[FUNC_BASED_VIEW, View]:
             nonlocal url_path, kwargs
 
@@ -222,6 +521,295 @@ class Router(BaseRouter):
             )
         return register
 
+    def add_routes(self, specs: Iterable[Any]) -> List[Any]:
+        _validate_type('specs', specs, abc.Iterable)
+
+        records = []
+        errors = []
+        seen = set()
+        # copies of dispatchers tables, to check methods of every spec before registering
+        tables: Dict[str, MethodDispatcher] = {}
+
+        # validation pass, nothing is changed in router before every spec is valid
+        for index, spec in enumerate(specs):
+            try:
+                url_path, view, methods, name = _get_spec(spec)
+                dotted_path = view
+                if isinstance(view, str):
+                    view = LazyView(view)
+                elif not callable(view):
+                    raise TypeError(f'Expected "view" to be callable or dotted import path, instead got {view!r}')
+                if isinstance(methods, (list, tuple)):
+                    methods = list(methods) # upper cased in place by __prepare
+
+                record, prefix = self.__prepare(view, url_path, name, methods)
+
+                identity = (record.url_path, dotted_path, tuple(record.methods or ()), record.name)
+                if identity in seen:
+                    continue # the same route is given twice
+
+                table = tables.get(record.url_path)
+                if table is None:
+                    table = tables[record.url_path] = MethodDispatcher()
+                    dispatcher = self.dispatchers.get(record.url_path)
+                    if dispatcher is not None:
+                        table.views = dict(dispatcher.views)
+                        table.default = dispatcher.default
+                table.add(view, record.methods, rebuild=False)
+            except (TypeError, ValueError) as error:
+                errors.append((index, error))
+                continue
+
+            seen.add(identity)
+            records.append((record, prefix))
+
+        if errors:
+            raise RouteSpecError(errors)
+
+        # every record is valid, views are wrapped and patterns are built in one pass
+        dispatchers = {}
+        for record, prefix in records:
+            dispatcher = self.__add(self.__build(record, prefix))
+            dispatchers[id(dispatcher)] = dispatcher
+        if self.materialized:
+            for dispatcher in dispatchers.values():
+                dispatcher.rebuild()
+            self._BaseRouter__materialize()
+
+        if records:
+            self.__changed()
+        return [record.view for record, _ in records]
+
+    def add(
+        self,
+        url_path: str,
+        view: Any,
+        methods: Optional[List[str]] = None,
+        name: Optional[str] = None,
+    ) -> Any:
+        with self._BaseRouter__lock:
+            try:
+                views = self.add_routes([(url_path, view, methods, name)])
+            except RouteSpecError as error:
+                raise error.errors[0][1] from None
+            self.__swap()
+        return views[0] if views else view
+
+    def remove(self, name: str) -> int:
+        _validate_type('name', name, str)
+
+        with self._BaseRouter__lock:
+            routes = [
+                route for route in self._BaseRouter__routes
+                if not isinstance(route, ViewRecord) or route.name != name
+            ]
+            removed = len(self._BaseRouter__routes) - len(routes)
+            if not removed:
+                raise ValueError(f'Router "{self.app_name}" has no views named "{name}"')
+
+            self.__rebuild(routes)
+            self.__swap()
+        return removed
+
+    def replace(self, name: str, view: Any) -> Any:
+        _validate_type('name', name, str)
+
+        lazy_view = view
+        if isinstance(view, str):
+            lazy_view = LazyView(view)
+        elif not callable(view):
+            raise TypeError(f'Expected "view" to be callable or dotted import path, instead got {view!r}')
+
+        with self._BaseRouter__lock:
+            routes = []
+            replaced = False
+            for route in self._BaseRouter__routes:
+                if isinstance(route, ViewRecord) and route.name == name:
+                    # the same url path, name and methods, manifest key is not valid anymore
+                    cache = route.cache
+                    if cache is not None:
+                        cache = ResponseCache(cache.policy) # responses of replaced view are dropped
+                    as_view = self.__get_as_view(lazy_view, route.middleware, route.executor, route.stateless, cache)
+                    route = route._replace(view=lazy_view, as_view=as_view, key=None, cache=cache)
+                    replaced = True
+                routes.append(route)
+            if not replaced:
+                raise ValueError(f'Router "{self.app_name}" has no views named "{name}"')
+
+            self.__rebuild(routes)
+            self.__swap()
+        return lazy_view
+
+    def get_middleware(self, name: str) -> List[Any]:
+        _validate_type('name', name, str)
+
+        for route in self._BaseRouter__routes:
+            if isinstance(route, ViewRecord) and route.name == name:
+                if not self.middleware and not route.middleware:
+                    return []
+                # factories raising MiddlewareNotUsed are left out by compose
+                return list(route.as_view.middleware)
+        raise ValueError(f'Router "{self.app_name}" has no views named "{name}"')
+
+    def get_cache(self, name: str) -> Optional[ResponseCache]:
+        _validate_type('name', name, str)
+
+        for route in self._BaseRouter__routes:
+            if isinstance(route, ViewRecord) and route.name == name:
+                return route.cache
+        raise ValueError(f'Router "{self.app_name}" has no views named "{name}"')
+
+    def __rebuild(self, routes: List[Any]) -> None:
+        """
+        Private method which register routes again into new containers,
+        so snapshots taken before keep old ones. The urls list is updated in place,
+        so urlpatterns which include it see new urls too
+        :param routes: List[Any] := Records of __build and URLResolvers of included routers
+        :return: None
+        """
+
+        materialized = self.materialized
+        urls = self._BaseRouter__urls
+
+        self._BaseRouter__urls = []
+        self._BaseRouter__records = []
+        self._BaseRouter__materialized = False
+        self._BaseRouter__static_urls = {}
+        self._BaseRouter__dispatchers = {}
+        self._BaseRouter__path_filter = PathFilter()
+        self._BaseRouter__reverse_table = {}
+        self._BaseRouter__lazy_views = []
+        self._BaseRouter__registrations = []
+        self._BaseRouter__routes = []
+
+        for route in routes:
+            if isinstance(route, ViewRecord):
+                self.__add(route)
+            else:
+                self._BaseRouter__routes.append(route)
+                self._BaseRouter__records.append(route)
+
+        # sample kwargs of removed url paths are dropped with them
+        self._BaseRouter__warm_kwargs = {
+            url_path: warm_kwargs
+            for url_path, warm_kwargs in self.warm_kwargs.items()
+            if url_path in self._BaseRouter__dispatchers
+        }
+
+        if materialized:
+            self._BaseRouter__materialize()
+            urls[:] = self._BaseRouter__urls
+            self._BaseRouter__urls = urls
+
+    def __swap(self) -> None:
+        """
+        Private method which count change of routes, take new snapshot of routes
+        and clear reverse caches of resolvers of router and routers it is included into
+        :return: None
+        """
+
+        self.__changed()
+        if self.materialized:
+            self.table # resolvers get the new snapshot at once
+
+        for router in self.__get_lineage():
+            for resolver in list(router.resolvers):
+                resolver.reset()
+        clear_url_caches()
+
+    def include(self, router: 'Router', **kwargs) -> 'Router':
+        from .include import include_router
+
+        if router is self or self in router.walk():
+            raise ValueError(f'Router "{router.app_name}" can not be included into itself')
+
+        resolver = include_router(router, **kwargs)
+        self._BaseRouter__children.append(router)
+        router.parents.append(self)
+        self._BaseRouter__routes.append(resolver)
+        self._BaseRouter__records.append(resolver)
+        if self.materialized:
+            self._BaseRouter__materialize()
+        self.__changed()
+        return router
+
+    def __get_lineage(self) -> List['Router']:
+        """
+        Private method which returns router and every router it is included into
+        :return: List[Router]
+        """
+
+        lineage = []
+        routers = [self]
+        seen = set()
+        while routers:
+            router = routers.pop()
+            if id(router) in seen:
+                continue
+            seen.add(id(router))
+            lineage.append(router)
+            routers.extend(router.parents)
+        return lineage
+
+    def __changed(self) -> None:
+        """
+        Count change of urls in router and every router it is included into,
+        so resolvers of outer routers check only their own router version
+        :return: None
+        """
+
+        for router in self.__get_lineage():
+            router._BaseRouter__version += 1
+        routers_changed()
+
+    def walk(self) -> List['Router']:
+        routers = [self]
+        for child in self.children:
+            routers.extend(child.walk())
+        return routers
+
+    def warmup(self, resolver: Optional[URLResolver] = None) -> None:
+        _validate_type('resolver', resolver, (URLResolver, type(None)))
+
+        for router in self.walk():
+            for lazy_view in router.lazy_views:
+                lazy_view.load()
+
+            for url_pattern in router.table.urls:
+                url_pattern.pattern.regex
+            for templates in router.reverse_table.values():
+                for template in templates:
+                    if template.format is None:
+                        template._parse()
+
+            for router_resolver in list(router.resolvers):
+                router_resolver.warmup()
+            if resolver is not None and resolver not in router._BaseRouter__mounts:
+                router._BaseRouter__mounts[resolver] = find_mount(router, resolver)
+
+    def url_for(self, name: str, **kwargs) -> str:
+        _validate_type('name', name, str)
+
+        resolver = get_resolver(get_urlconf())
+        try:
+            mount = self._BaseRouter__mounts[resolver]
+        except KeyError:
+            mount = self._BaseRouter__mounts[resolver] = find_mount(self, resolver)
+
+        if mount is not None:
+            for template in self.reverse_table.get(name, ()):
+                url_path = template.expand(kwargs)
+                if url_path is not None:
+                    url = quote(
+                        get_script_prefix() + mount + url_path,
+                        safe=RFC3986_SUBDELIMS + '/~:@',
+                    )
+                    return escape_leading_slashes(url)
+
+        # router is not included by root urlconf under its namespace or nothing fits,
+        # let Django reverse it or raise NoReverseMatch
+        return reverse(f'{self.app_name}:{name}' if self.app_name else name, kwargs=kwargs)
+
     def __str__(self) -> str:
         return f'Router(\n' \
                f'\tapp_name:\t"{self.app_name}"\n' \
@@ -0,0 +1,44 @@
+from typing import Any, Dict, Tuple
+
+from django.urls import URLPattern
+
+from .filters import PathFilter
+
+
+class RouteTable:
+    """
+    Immutable snapshot of routes of router.
+    Resolvers take one snapshot per path, so routes added, removed or replaced
+    while path is being resolved are seen only by the next paths.
+
+    Attributes:
+        version: int                        := Version of router the snapshot was taken at
+        urls: Tuple[Any, ...]               := URLPatterns and URLResolvers in order of resolving
+        static_urls: Dict[str, URLPattern]  := URLPatterns without dynamic params by url path
+        path_filter: PathFilter             := First segments and segment counts of urls
+    """
+
+    __slots__ = ('version', 'urls', 'static_urls', 'path_filter')
+
+    def __init__(
+        self,
+        version: int,
+        urls: Tuple[Any, ...],
+        static_urls: Dict[str, URLPattern],
+        path_filter: PathFilter,
+    ) -> None:
+        """
+        Initial method for RouteTable.
+        :param version: int
+        :param urls: Tuple[Union[django.urls.URLPattern, django.urls.URLResolver], ...]
+        :param static_urls: Dict[str, django.urls.URLPattern]
+        :param path_filter: django_routify.filters.PathFilter
+        """
+
+        self.version = version
+        self.urls = urls
+        self.static_urls = static_urls
+        self.path_filter = path_filter
+
+    def __repr__(self) -> str:
+        return f'RouteTable(version={self.version}, urls={len(self.urls)})'
@@ -0,0 +1,151 @@
+from typing import Any, Dict, Optional, Tuple
+from weakref import ref
+
+from django import template
+from django.template.base import FilterExpression, Parser, Token
+from django.urls import NoReverseMatch, get_resolver, get_urlconf, reverse
+from django.utils.html import conditional_escape
+
+from ..registry import get_routers, get_version
+from ..reverse import find_mount
+
+register = template.Library()
+
+_lookup: Dict[Tuple[str, str], Optional[ref]] = {}
+'Weak references to routers by (app_name, name), None for names reversed by Django'
+_lookup_key: Tuple[Any, int] = (None, -1)
+'Root resolver and version of routers the lookup was built for'
+
+
+def _find_router(resolver: Any, app_name: str, name: str) -> Any:
+    """
+    Returns router which reverses "app_name:name", the first of them
+    included by resolver if there are many, or None
+    :param resolver: django.urls.URLResolver
+    :param app_name: str
+    :param name: str
+    :return: Optional[Router]
+    """
+
+    routers = [
+        router for router in get_routers()
+        if router.app_name == app_name and name in router.reverse_table
+    ]
+    if len(routers) > 1:
+        routers = [
+            router for router in routers
+            if find_mount(router, resolver) is not None
+        ]
+    return routers[0] if routers else None
+
+
+def url_for(viewname: str, **kwargs) -> str:
+    """
+    Returns url of "app_name:name" with reverse table of router,
+    which is included under app_name, or with reverse() for other urls.
+    Routers of names are looked up once, until root urlconf or any router is changed
+    :param viewname: str
+    :param kwargs: Dict[str, Any]
+    :return: str
+    """
+
+    global _lookup, _lookup_key
+
+    app_name, _, name = viewname.rpartition(':')
+    if app_name and ':' not in app_name:
+        resolver = get_resolver(get_urlconf())
+        key = (resolver, get_version())
+        if _lookup_key[0] is not key[0] or _lookup_key[1] != key[1]:
+            _lookup, _lookup_key = {}, key
+
+        reference = _lookup.get((app_name, name), False)
+        router = reference() if reference else None
+        if reference is False or (reference is not None and router is None):
+            # not looked up yet or router was collected
+            router = _find_router(resolver, app_name, name)
+            _lookup[(app_name, name)] = ref(router) if router is not None else None
+
+        if router is not None:
+            return router.url_for(name, **kwargs)
+
+    return reverse(viewname, kwargs=kwargs)
+
+
+class UrlForNode(template.Node):
+    """
+    Node of url_for tag.
+
+    Attributes:
+        viewname: FilterExpression          := Expression of "app_name:name"
+        kwargs: Dict[str, FilterExpression] := Expressions of url params
+        asvar: Optional[str]                := Name of context variable for url
+    """
+
+    def __init__(
+        self,
+        viewname: FilterExpression,
+        kwargs: Dict[str, FilterExpression],
+        asvar: Optional[str],
+    ) -> None:
+        """
+        Initial method for UrlForNode.
+        :param viewname: django.template.base.FilterExpression
+        :param kwargs: Dict[str, django.template.base.FilterExpression]
+        :param asvar: Optional[str]
+        """
+
+        self.viewname = viewname
+        self.kwargs = kwargs
+        self.asvar = asvar
+
+    def render(self, context: Any) -> str:
+        viewname = self.viewname.resolve(context)
+        kwargs = {key: value.resolve(context) for key, value in self.kwargs.items()}
+
+        url = ''
+        try:
+            url = url_for(viewname, **kwargs)
+        except NoReverseMatch:
+            # same as url tag, missing url is allowed only when it is saved into variable
+            if self.asvar is None:
+                raise
+
+        if self.asvar:
+            context[self.asvar] = url
+            return ''
+        if context.autoescape:
+            url = conditional_escape(url)
+        return url
+
+
+@register.tag(name='url_for')
+def url_for_tag(parser: Parser, token: Token) -> UrlForNode:
+    """
+    Returns url same as url tag, with keyword arguments only:
+    {% url_for "app_name:name" param=value ... [as var] %}
+    :param parser: django.template.base.Parser
+    :param token: django.template.base.Token
+    :return: django_routify.templatetags.routify.UrlForNode
+    """
+
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            f'"{bits[0]}" takes at least one argument, the name of url'
+        )
+
+    asvar = None
+    if len(bits) >= 4 and bits[-2] == 'as':
+        asvar = bits[-1]
+        bits = bits[:-2]
+
+    kwargs = {}
+    for bit in bits[2:]:
+        key, separator, value = bit.partition('=')
+        if not separator or not key:
+            raise template.TemplateSyntaxError(
+                f'"{bits[0]}" takes only keyword arguments, instead got "{bit}"'
+            )
+        kwargs[key] = parser.compile_filter(value)
+
+    return UrlForNode(parser.compile_filter(bits[1]), kwargs, asvar)
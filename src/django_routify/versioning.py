@@ -0,0 +1,120 @@
+import re
+
+from typing import Any, Callable, Dict, Optional
+
+from django.http import HttpRequest
+
+from .validator import _validate_type
+
+VERSIONING_PARAMS: Dict[str, str] = {
+    'accept': 'version',
+    'header': 'X-API-Version',
+    'query': 'version',
+}
+'Default param of each versioning mode'
+
+
+class Versioning:
+    """
+    Way of selecting API version of request for views registered with "version".
+    Version is taken from parameter of media type in Accept header,
+    e.g. "application/json; version=2", from custom header or from query parameter.
+    Requests without version get default version.
+
+    Attributes:
+        mode: str                       := "accept", "header" or "query"
+        param: str                      := Media type parameter, header or query parameter
+        default: Optional[str] = None   := Version of requests without version
+        vary: Optional[str]             := Header which responses vary on, None for query
+        get_version: Callable           := Returns version of request, precompiled for mode
+    """
+
+    __slots__ = ('mode', 'param', 'default', 'vary', 'get_version')
+
+    def __init__(self, mode: str, param: Optional[str] = None, default: Optional[str] = None) -> None:
+        """
+        Initial method for Versioning.
+        :param mode: str
+        :param param: Optional[str]
+        :param default: Optional[str]
+        """
+
+        _validate_type('versioning', mode, str)
+        _validate_type('version_param', param, (str, type(None)))
+        _validate_type('default_version', default, (str, type(None)))
+        if mode not in VERSIONING_PARAMS:
+            raise ValueError(
+                f'Versioning "{mode}" is not in '
+                f'allowed versioning modes {tuple(VERSIONING_PARAMS)}'
+            )
+
+        self.mode = mode
+        self.param = param or VERSIONING_PARAMS[mode]
+        self.default = default
+        self.vary = None
+        self.get_version = getattr(self, f'_compile_{mode}')()
+
+    def _compile_accept(self) -> Callable[[HttpRequest], Optional[str]]:
+        """
+        Returns function which takes version from media type parameter of Accept header
+        :return: Callable[[HttpRequest], Optional[str]]
+        """
+
+        param = self.param
+        default = self.default
+        regex = re.compile(rf';\s*{re.escape(param)}\s*=\s*"?([^",;\s]+)', re.IGNORECASE)
+        self.vary = 'Accept'
+
+        def get_version(request: HttpRequest) -> Optional[str]:
+            accept = request.META.get('HTTP_ACCEPT')
+            if not accept or '=' not in accept:
+                return default
+            match = regex.search(accept)
+            return default if match is None else match.group(1)
+        return get_version
+
+    def _compile_header(self) -> Callable[[HttpRequest], Optional[str]]:
+        """
+        Returns function which takes version from header
+        :return: Callable[[HttpRequest], Optional[str]]
+        """
+
+        key = 'HTTP_' + self.param.upper().replace('-', '_')
+        default = self.default
+        self.vary = self.param
+
+        def get_version(request: HttpRequest) -> Optional[str]:
+            return request.META.get(key) or default
+        return get_version
+
+    def _compile_query(self) -> Callable[[HttpRequest], Optional[str]]:
+        """
+        Returns function which takes version from query parameter
+        :return: Callable[[HttpRequest], Optional[str]]
+        """
+
+        param = self.param
+        default = self.default
+
+        def get_version(request: HttpRequest) -> Optional[str]:
+            return request.GET.get(param) or default
+        return get_version
+
+    def __repr__(self) -> str:
+        return f'Versioning({self.mode!r}, param={self.param!r}, default={self.default!r})'
+
+
+def _get_versioning(kwargs: Dict[str, Any]) -> Optional[Versioning]:
+    """
+    Returns Versioning of router options or None if router is not versioned
+    :param kwargs: Dict[str, Any] := Options of Router
+    :return: Optional[Versioning]
+    """
+
+    mode = kwargs.get('versioning', None)
+    if mode is None:
+        for option in ('version_param', 'default_version'):
+            if kwargs.get(option) is not None:
+                raise ValueError(f'Option "{option}" needs "versioning" option')
+        return None
+    return Versioning(mode, kwargs.get('version_param', None), kwargs.get('default_version', None))
@@ -0,0 +1,276 @@
+import gc
+import io
+import time
+import warnings
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.urls import URLPattern, URLResolver, get_resolver, get_urlconf
+from django.urls.resolvers import LocalePrefixPattern, RoutePattern, get_ns_resolver
+
+from .dispatch import AliasPattern
+from .hosts import HostPattern, HostResolver
+from .registry import get_routers
+from .reverse import UrlTemplate
+from .validator import _validate_type
+from .versioning import Versioning
+
+
+class WarmResult(NamedTuple):
+    """
+    Result of one synthetic warm up request.
+
+    Attributes:
+        path: str               := Requested path
+        name: Optional[str]     := Name of url path
+        status: int             := Status code of response
+        duration: float         := Seconds from calling handler to closing response
+        host: str               := Host header of request
+        version: Optional[str]  := API version of request, None for unversioned request
+    """
+
+    path: str
+    name: Optional[str]
+    status: int
+    duration: float
+    host: str
+    version: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """
+        failed getter
+        Registered route is failed when it responds with server error or is not found
+        :return: bool
+        """
+
+        return self.status >= 500 or self.status == 404
+
+
+def _populate_namespaces(
+    resolver: URLResolver,
+    ns_pattern: str = '',
+    ns_converters: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Populate resolvers which reverse() builds for namespaces under resolver,
+    the same way reverse() walks them
+    :param resolver: django.urls.URLResolver
+    :param ns_pattern: str := Regex of prefixes of outer namespaces
+    :param ns_converters: Optional[Dict[str, Any]] := Converters of prefixes of outer namespaces
+    :return: None
+    """
+
+    for extra, sub_resolver in resolver.namespace_dict.values():
+        pattern = ns_pattern + extra
+        converters = {**(ns_converters or {}), **sub_resolver.pattern.converters}
+        get_ns_resolver(pattern, sub_resolver, tuple(converters.items())).reverse_dict
+        _populate_namespaces(sub_resolver, pattern, converters)
+
+
+def warmup(freeze: bool = False) -> Dict[str, int]:
+    """
+    Warm every router before worker processes are forked, e.g. under gunicorn --preload.
+    Imports root urlconf, so routers registered in urls.py exist,
+    then warms every router tree and populates reverse dictionaries of root URLResolver
+    and of resolvers reverse() builds for namespaces.
+    With freeze moves every object into permanent generation of garbage collector,
+    so collections in forked workers do not write to pages shared with master.
+    Returns counts of warmed routers, URLPatterns and views imported by dotted import path
+    :param freeze: bool
+    :return: Dict[str, int]
+    """
+
+    resolver = None
+    if get_urlconf() is not None or getattr(settings, 'ROOT_URLCONF', None):
+        resolver = get_resolver(get_urlconf())
+        resolver.url_patterns # imports urlconf with its routers
+
+    routers = get_routers()
+    for router in routers:
+        if not router.parents:
+            router.warmup(resolver)
+
+    if resolver is not None:
+        resolver.reverse_dict
+        resolver.app_dict
+        _populate_namespaces(resolver)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return {
+        'routers': len(routers),
+        'url_patterns': sum(len(router.urls) for router in routers),
+        'lazy_views': sum(len(router.lazy_views) for router in routers),
+    }
+
+
+def _get_version_environ(versioning: Versioning, version: str) -> Dict[str, str]:
+    """
+    Returns WSGI environ of request for version, the way versioning takes it
+    :param versioning: django_routify.versioning.Versioning
+    :param version: str
+    :return: Dict[str, str]
+    """
+
+    if versioning.mode == 'accept':
+        return {'HTTP_ACCEPT': f'*/*; {versioning.param}={version}'}
+    if versioning.mode == 'header':
+        return {'HTTP_' + versioning.param.upper().replace('-', '_'): version}
+    return {'QUERY_STRING': urlencode({versioning.param: version})}
+
+
+def _get_targets(
+    url_patterns: List[Any],
+    prefix: str,
+    targets: List[tuple],
+    seen: set,
+    host: Optional[str] = None,
+) -> None:
+    """
+    Append (path, name, host, version, environ) of router routes which answer GET
+    and need no params or have sample kwargs, one path per dispatcher and per version
+    of its GET views, in the order Django tries them.
+    Routes of routers with static host are requested with their host, routes of
+    host patterns are skipped with warning, since params of host can not be guessed
+    :param url_patterns: List[Union[django.urls.URLPattern, django.urls.URLResolver]]
+    :param prefix: str := Routes of outer resolvers
+    :param targets: List[Tuple[str, Optional[str], Optional[str], Optional[str], Dict[str, str]]]
+    :param seen: Set[int] := Ids of dispatchers which have path already
+    :param host: Optional[str] := Host of routes, None for host of warm_routes
+    :return: None
+    """
+
+    for url_pattern in url_patterns:
+        pattern = url_pattern.pattern
+        if isinstance(pattern, LocalePrefixPattern):
+            route = pattern.language_prefix
+        elif isinstance(pattern, RoutePattern) and isinstance(pattern._route, str):
+            route = str(pattern)
+        else:
+            continue # regex routes can not be expanded with kwargs
+
+        if isinstance(url_pattern, HostResolver):
+            for resolver in url_pattern.url_patterns:
+                router_host = resolver.router.host
+                if router_host is None:
+                    _get_targets([resolver], prefix + route, targets, seen, host)
+                    continue
+
+                host_pattern = HostPattern(router_host)
+                if host_pattern.regex is not None:
+                    warnings.warn(
+                        f'Routes of host "{router_host}" are not warmed, since host has params',
+                        RuntimeWarning,
+                    )
+                    continue
+                _get_targets([resolver], prefix + route, targets, seen, host_pattern.host)
+            continue
+        if isinstance(url_pattern, URLResolver):
+            _get_targets(url_pattern.url_patterns, prefix + route, targets, seen, host)
+            continue
+        if not isinstance(url_pattern, URLPattern) or isinstance(url_pattern, AliasPattern):
+            continue
+
+        dispatcher = getattr(url_pattern.callback, 'dispatcher', None)
+        if dispatcher is None or id(dispatcher) in seen:
+            continue
+
+        has_view = 'GET' in dispatcher.views or dispatcher.default is not None
+        versions = sorted({
+            version
+            for method, version in dispatcher.versions
+            if method in ('GET', None)
+        })
+        if has_view and dispatcher.versioning is not None:
+            # request without version already gets view of default version
+            versions = [version for version in versions if version != dispatcher.versioning.default]
+        if not has_view and not versions:
+            continue
+
+        path = UrlTemplate(prefix + route).expand(dispatcher.warm_kwargs or {})
+        if path is None:
+            continue # params are not declared with "warm_kwargs"
+        seen.add(id(dispatcher))
+        if has_view:
+            targets.append(('/' + path, url_pattern.name, host, None, {}))
+        for version in versions:
+            environ = _get_version_environ(dispatcher.versioning, version)
+            targets.append(('/' + path, url_pattern.name, host, version, environ))
+
+
+def _get_host() -> str:
+    """
+    Returns host allowed by ALLOWED_HOSTS for synthetic requests
+    :return: str
+    """
+
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*':
+            return host.lstrip('.')
+    return 'localhost'
+
+
+def warm_routes(threads: int = 1, host: Optional[str] = None) -> List[WarmResult]:
+    """
+    Send synthetic GET request through Django handler with its middleware
+    to every router route which needs no params or has sample kwargs declared
+    with "warm_kwargs" option, so templates, ORM metadata and caches of views
+    are loaded before worker gets real requests.
+    Versioned GET views get request for each version, routes of routers with
+    static host are requested with their host, which needs HostMiddleware.
+    Requests are sent in-process, with threads in thread pool if more than one.
+    Returns results in the order of routes
+    :param threads: int
+    :param host: Optional[str] := Host header of routes without host, the first of ALLOWED_HOSTS by default
+    :return: List[WarmResult]
+    """
+
+    _validate_type('threads', threads, int)
+    _validate_type('host', host, (str, type(None)))
+    if threads < 1:
+        raise ValueError(f'Expected "threads" to be positive, instead got {threads}')
+
+    targets = []
+    _get_targets(get_resolver(get_urlconf()).url_patterns, '', targets, set())
+
+    handler = WSGIHandler()
+    default_host = host or _get_host()
+
+    def request(target: tuple) -> WarmResult:
+        path, name, host, version, extra = target
+        host = host or default_host
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'SCRIPT_NAME': '',
+            'PATH_INFO': path.encode().decode('iso-8859-1'), # WSGI str of bytes
+            'QUERY_STRING': '',
+            'SERVER_NAME': host,
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': host,
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(),
+            'wsgi.errors': io.StringIO(),
+            **extra,
+        }
+
+        start = time.perf_counter()
+        response = handler(environ, lambda status, headers, exc_info=None: None)
+        try:
+            for _ in response:
+                pass # streaming responses are rendered while iterating
+        finally:
+            response.close()
+        return WarmResult(path, name, response.status_code, time.perf_counter() - start, host, version)
+
+    if threads == 1:
+        return [request(target) for target in targets]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(request, targets))
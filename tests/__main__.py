@@ -1,4 +1,63 @@
+import asyncio
+import builtins
+import io
+import marshal
+import json
+import os
+import sys
+import tempfile
+import threading
 import unittest
+import uuid
+import warnings
+
+from unittest import mock
+
+import django
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command, CommandError
+from django.http import JsonResponse
+from django.template import Context, Engine
+from django.test import RequestFactory, override_settings
+from django.urls import (
+    clear_script_prefix,
+    get_resolver,
+    reverse,
+    set_script_prefix,
+    NoReverseMatch,
+    Resolver404,
+)
+
+settings.configure()
+django.setup()
+
+from django_routify import (
+    Router,
+    RouteSpec,
+    RouteSpecError,
+    CachePolicy,
+    register_executor,
+    executor_metrics,
+    include_router,
+    warmup,
+    warm_routes,
+    ColonPattern,
+    CurlyPattern,
+    AnglePattern,
+)
+from django_routify.caching import RefreshRequest
+from django_routify.dispatch import AliasPattern
+from django_routify.fastlane import FastLaneWSGI, FastLaneASGI
+from django_routify.flatten import FlatPattern
+from django_routify.hosts import HostMiddleware, HostPattern, _current_host
+from django_routify.lazy import LazyView
+from django_routify.loop import persistent_loop
+from django_routify.management.commands.routify_compile import Command as CompileCommand
+from django_routify.management.commands.routify_warm import Command as WarmCommand
+from django_routify.manifest import write_manifest
+from django_routify.reverse import find_mount
 
 from . import utils
 
@@ -22,6 +81,48 @@ from .single_method_decorators_tests.urls import (
     routify_urlpatterns,
 )
 
+from .method_dispatch_tests.views import router as items_router
+from .method_dispatch_tests.urls import urlpatterns as items_urlpatterns
+
+from .reverse_tests.views import router as shop_router, unnamed_router
+
+from .lazy_views_tests.urls import router as lazy_router
+
+from .manifest_tests.views import build_router as build_orders_router
+
+from .flat_include_tests.views import (
+    router as api_router,
+    users_router,
+)
+from .flat_include_tests.urls import (
+    nested_urlpatterns,
+    flat_urlpatterns,
+    radix_urlpatterns as flat_radix_urlpatterns,
+    compiled_urlpatterns as flat_compiled_urlpatterns,
+)
+
+from .hot_swap_tests import views as hot_swap_views
+from .hot_swap_tests.views import router as plugins_router
+from .hot_swap_tests.urls import urlpatterns as hot_swap_urlpatterns
+
+from .radix_engine_tests.views import router as radix_router
+from .warm_routes_tests import views as warm_views
+from .hosts_tests.urls import urlpatterns as hosts_urlpatterns
+from .versioning_tests.views import accept_router, header_router, query_router
+from .async_guards_tests.views import router as async_router, LegacyView
+from .executor_tests import views as executor_views
+from .fast_lane_tests.views import router as fast_router
+from .response_cache_tests import views as cache_views
+from .stateless_tests.views import router as stateless_router
+from .persistent_loop_tests import views as loop_views
+from .router_middleware_tests import middleware as scoped_middleware
+from .router_middleware_tests.views import router as scoped_router, plain_router, hooks_router
+from .radix_engine_tests.urls import (
+    django_urlpatterns,
+    radix_urlpatterns,
+    compiled_urlpatterns,
+)
+
 
 class TrailingSlashTests(unittest.TestCase):
     def test_urls_with_trailing_slash(self):
@@ -125,6 +226,2042 @@ class SingleMethodDecoratorsTests(unittest.TestCase):
                     routify_allowed_methods,
                 )
 
+class RadixEngineTests(unittest.TestCase):
+    PATHS = [
+        'radix/',
+        'radix/books/',
+        'radix/config/',
+        'radix/users/42/',
+        'radix/users/4c6fdd6c-7d4c-4c8b-9a3e-1f0a3b0ad6f2/',
+        'radix/users/42/posts/hello-world/',
+        'radix/items/some item/',
+        'radix/files/docs/readme.md/',
+        'radix/report-2024/',
+    ]
+    NOT_FOUND_PATHS = [
+        'radix',
+        'radix/books',
+        'radix/users/not-an-id/posts/hello/',
+        'radix/users/42/posts/',
+        'other/books/',
+    ]
+
+    def test_same_matches_as_django_engine(self):
+        # If radix engine resolves urls differently from Django engine test will be failed.
+        django_resolver = django_urlpatterns[0]
+        radix_resolver = radix_urlpatterns[0]
+
+        for path in self.PATHS:
+            django_match = django_resolver.resolve(path)
+            radix_match = radix_resolver.resolve(path)
+
+            self.assertEqual(django_match.func, radix_match.func)
+            self.assertEqual(django_match.args, radix_match.args)
+            self.assertEqual(django_match.kwargs, radix_match.kwargs)
+            self.assertEqual(django_match.url_name, radix_match.url_name)
+            self.assertEqual(django_match.namespaces, radix_match.namespaces)
+            self.assertEqual(django_match.route, radix_match.route)
+
+    def test_not_found(self):
+        for path in self.NOT_FOUND_PATHS:
+            with self.assertRaises(Resolver404):
+                django_urlpatterns[0].resolve(path)
+            with self.assertRaises(Resolver404):
+                radix_urlpatterns[0].resolve(path)
+
+    def test_reverse(self):
+        urlconf = 'tests.radix_engine_tests.urls'
+
+        self.assertEqual(
+            reverse('radix:user_post', kwargs={'user_id': 42, 'post': 'hello'}, urlconf=urlconf),
+            '/radix/users/42/posts/hello/',
+        )
+        self.assertEqual(
+            reverse('radix:report', args=(2024,), urlconf=urlconf),
+            '/radix/report-2024/',
+        )
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            include_router(radix_router, engine='unknown')
+
+
+class CompiledEngineTests(unittest.TestCase):
+    def test_same_matches_as_django_engine(self):
+        # If compiled engine resolves urls differently from Django engine test will be failed.
+        django_resolver = django_urlpatterns[0]
+        compiled_resolver = compiled_urlpatterns[0]
+
+        for path in RadixEngineTests.PATHS:
+            django_match = django_resolver.resolve(path)
+            compiled_match = compiled_resolver.resolve(path)
+
+            self.assertEqual(django_match.func, compiled_match.func)
+            self.assertEqual(django_match.args, compiled_match.args)
+            self.assertEqual(django_match.kwargs, compiled_match.kwargs)
+            self.assertEqual(django_match.url_name, compiled_match.url_name)
+            self.assertEqual(django_match.namespaces, compiled_match.namespaces)
+            self.assertEqual(django_match.route, compiled_match.route)
+
+    def test_not_found(self):
+        for path in RadixEngineTests.NOT_FOUND_PATHS:
+            with self.assertRaises(Resolver404):
+                compiled_urlpatterns[0].resolve(path)
+
+    def test_cached_module(self):
+        compiled = compiled_urlpatterns[0].compiled
+
+        self.assertTrue(os.path.exists(compiled.path))
+        # same route table is compiled into the same module
+        self.assertIs(include_router(radix_router, engine='compiled').compiled.module, compiled.module)
+
+    def test_tampered_artifacts(self):
+        from django_routify.codegen import compile_router
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.chmod(cache_dir, 0o700)
+            compiled = compile_router(radix_router, cache_dir)
+            sys.modules.pop(compiled.module.__name__)
+
+            # planted code without valid signature is never executed
+            planted = compile('import builtins; builtins.routify_planted = True', 'planted', 'exec')
+            for file_name in os.listdir(cache_dir):
+                with open(os.path.join(cache_dir, file_name), 'wb') as file:
+                    file.write(marshal.dumps(planted) if file_name.endswith('.code') else b'raise SystemExit')
+
+            compiled = compile_router(radix_router, cache_dir)
+            self.assertFalse(hasattr(builtins, 'routify_planted'))
+            self.assertTrue(compiled.dispatch('books/'))
+            sys.modules.pop(compiled.module.__name__)
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'POSIX permissions')
+    def test_shared_cache_dir(self):
+        from django_routify.codegen import compile_router
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.chmod(cache_dir, 0o777)
+            with self.assertRaises(ImproperlyConfigured):
+                compile_router(unnamed_router, cache_dir)
+
+            os.chmod(cache_dir, 0o700)
+            with mock.patch('os.getuid', return_value=os.getuid() + 1):
+                with self.assertRaises(ImproperlyConfigured):
+                    compile_router(unnamed_router, cache_dir)
+
+
+class StaticFastPathTests(unittest.TestCase):
+    def test_static_urls_index(self):
+        self.assertIn('books/', radix_router.static_urls)
+        self.assertIn('config/', radix_router.static_urls)
+        self.assertNotIn('<slug:slug>/', radix_router.static_urls)
+
+    def test_static_hits(self):
+        resolver = include_router(radix_router)
+
+        for _ in range(3):
+            self.assertEqual(resolver.resolve('radix/books/').url_name, 'books')
+
+        # first lookup checks that static url is not shadowed
+        self.assertEqual(resolver.static_hits, 2)
+        self.assertEqual(resolver.static_misses, 1)
+
+    def test_shadowed_static_url(self):
+        resolver = include_router(radix_router)
+
+        for _ in range(3):
+            # <slug:slug>/ is registered before config/ and matches it first
+            self.assertEqual(resolver.resolve('radix/config/').url_name, 'page')
+
+        self.assertEqual(resolver.static_hits, 0)
+        self.assertEqual(resolver.static_misses, 3)
+
+
+class MethodDispatchTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.resolver = items_urlpatterns[0]
+
+    def test_one_pattern_per_path(self):
+        routes = [
+            str(url_pattern.pattern)
+            for url_pattern in items_router.urls
+            if not isinstance(url_pattern, AliasPattern)
+        ]
+        self.assertEqual(routes, ['', '<int:pk>/', 'async/', 'hooks/'])
+
+    def test_dispatch_by_method(self):
+        callback = self.resolver.resolve('items/').func
+
+        response = callback(self.factory.get('/items/'))
+        self.assertEqual(response.content, b'List items')
+
+        response = callback(self.factory.post('/items/'))
+        self.assertEqual(response.content, b'Create item')
+
+        response = callback(self.factory.put('/items/'))
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response['Allow'], 'GET, POST')
+
+    def test_async_dispatch(self):
+        # sync view on the same path keeps dispatcher sync, async view is adapted
+        match = self.resolver.resolve('items/1/')
+        self.assertFalse(iscoroutinefunction(match.func))
+
+        response = match.func(self.factory.get('/items/1/'), **match.kwargs)
+        self.assertEqual(response.content, b'Item #1')
+
+        response = match.func(self.factory.delete('/items/1/'), **match.kwargs)
+        self.assertEqual(response.content, b'Delete item #1')
+
+        # only async views make dispatcher a coroutine function
+        callback = self.resolver.resolve('items/async/').func
+        self.assertTrue(iscoroutinefunction(callback))
+
+        response = asyncio.run(callback(self.factory.post('/items/async/')))
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response['Allow'], 'PUT, PATCH')
+
+    def test_mixed_csrf_exempt(self):
+        from django.middleware.csrf import CsrfViewMiddleware
+
+        callback = self.resolver.resolve('items/hooks/').func
+        middleware = CsrfViewMiddleware(callback)
+        # dispatcher is exempt, protected views of the url path check CSRF by themselves
+        self.assertTrue(callback.csrf_exempt)
+
+        def call(request):
+            response = middleware.process_request(request) or middleware.process_view(request, callback, (), {})
+            return response or callback(request)
+
+        with override_settings(MIDDLEWARE=['django.middleware.csrf.CsrfViewMiddleware']):
+            self.assertEqual(call(self.factory.post('/items/hooks/')).content, b'Hook received')
+            self.assertEqual(call(self.factory.get('/items/hooks/')).content, b'List hooks')
+            with self.assertLogs('django.security.csrf', 'WARNING'):
+                self.assertEqual(call(self.factory.put('/items/hooks/')).status_code, 403)
+
+        # without CSRF middleware views are not protected, the same as on url paths of their own
+        with override_settings(MIDDLEWARE=[]):
+            self.assertEqual(callback(self.factory.put('/items/hooks/')).status_code, 200)
+
+    def test_reverse_every_name(self):
+        urlconf = 'tests.method_dispatch_tests.urls'
+
+        self.assertEqual(reverse('items:list', urlconf=urlconf), '/items/')
+        self.assertEqual(reverse('items:create', urlconf=urlconf), '/items/')
+
+    def test_duplicate_method(self):
+        with self.assertRaises(ValueError):
+            @items_router.get('/')
+            def duplicate(request):
+                pass
+
+
+class ResolveCacheTests(unittest.TestCase):
+    def test_cache(self):
+        resolver = include_router(radix_router, cache_size=2)
+
+        first = resolver.resolve('radix/users/1/')
+        self.assertIs(resolver.resolve('radix/users/1/'), first)
+
+        resolver.resolve('radix/users/2/')
+        resolver.resolve('radix/users/3/') # evicts radix/users/1/
+
+        self.assertIsNot(resolver.resolve('radix/users/1/'), first)
+        self.assertEqual(resolver.cache.stats, {
+            'size': 2,
+            'max_size': 2,
+            'hits': 1,
+            'misses': 4,
+            'evictions': 2,
+        })
+
+    def test_not_found_is_not_cached(self):
+        resolver = include_router(radix_router, cache_size=2)
+
+        with self.assertRaises(Resolver404):
+            resolver.resolve('radix/users/1/posts/')
+        self.assertEqual(len(resolver.cache), 0)
+
+    def test_invalidation(self):
+        router = Router('/cache', 'cache', auto_trailing_slash=True)
+
+        @router.get('/item')
+        def get_item(request):
+            pass
+
+        resolver = include_router(router, cache_size=10)
+        first = resolver.resolve('cache/item/')
+        self.assertIs(resolver.resolve('cache/item/'), first)
+
+        @router.post('/item')
+        def post_item(request):
+            pass
+
+        # callback of cache/item/ was rebuilt, cached match is outdated
+        match = resolver.resolve('cache/item/')
+        self.assertIsNot(match, first)
+        self.assertEqual(match.func.dispatcher.methods, ['GET', 'POST'])
+        self.assertEqual(resolver.cache.stats['hits'], 1)
+
+
+class PathFilterTests(unittest.TestCase):
+    def test_filter(self):
+        path_filter = items_router.path_filter
+
+        self.assertEqual(path_filter.first_segments, {'', 'async', 'hooks'})
+        self.assertEqual(list(path_filter.first_segment_regexes), ['[0-9]+']) # <int:pk>/
+        self.assertFalse(path_filter.any_first_segment)
+        self.assertEqual(path_filter.segment_counts, {1, 2})
+
+    def test_rejected(self):
+        resolver = include_router(radix_router)
+
+        for path in ('radix/wp-admin/setup-config.php', 'radix/.env', 'radix/users/1/posts/2/edit/'):
+            with self.assertRaises(Resolver404):
+                resolver.resolve(path)
+
+        # path converter of files/<path:file_path>/ can match any count of segments
+        self.assertEqual(resolver.rejected, 0)
+
+        resolver = include_router(items_router)
+
+        for path in ('items/wp-admin/setup-config.php', 'items/.env', 'items/1/2/'):
+            with self.assertRaises(Resolver404):
+                resolver.resolve(path)
+
+        self.assertEqual(resolver.rejected, 3)
+        self.assertEqual(resolver.resolve('items/1/').url_name, 'item')
+
+
+class ReverseTableTests(unittest.TestCase):
+    KWARGS = [
+        ('index', {'shop': 'main'}),
+        ('product', {'shop': 'main', 'pk': 42}),
+        ('product', {'shop': 'main', 'pk': '5c6b8cf4-3d1c-4b1d-a1b5-3e8a2f5f4b1c'}),
+        ('update_product', {'shop': 'main', 'pk': 7}),
+        ('search', {'shop': 'main', 'query': 'red shoes & hats?'}),
+        ('search', {'shop': 'main', 'query': 'привіт'}),
+        ('files', {'shop': 'main', 'file_path': 'docs/read me.md'}),
+        ('files', {'shop': 'main', 'file_path': '/etc/passwd'}),
+    ]
+    NOT_FOUND_KWARGS = [
+        ('index', {}),
+        ('index', {'shop': 'not a slug'}),
+        ('product', {'shop': 'main', 'pk': 'abc'}),
+        ('product', {'shop': 'main', 'pk': 42, 'extra': 1}),
+        ('search', {'shop': 'main', 'query': 'a/b'}),
+        ('unknown', {'shop': 'main'}),
+    ]
+
+    def setUp(self):
+        self.urlconf = override_settings(ROOT_URLCONF='tests.reverse_tests.urls')
+        self.urlconf.enable()
+
+    def tearDown(self):
+        self.urlconf.disable()
+        clear_script_prefix()
+
+    def test_same_urls_as_reverse(self):
+        for prefix in ('/', '/mounted/'):
+            set_script_prefix(prefix)
+            for name, kwargs in self.KWARGS:
+                with self.subTest(prefix=prefix, name=name, kwargs=kwargs):
+                    self.assertEqual(
+                        shop_router.url_for(name, **kwargs),
+                        reverse(f'shop:{name}', kwargs=kwargs),
+                    )
+
+    def test_not_found(self):
+        for name, kwargs in self.NOT_FOUND_KWARGS:
+            with self.subTest(name=name, kwargs=kwargs):
+                with self.assertRaises(NoReverseMatch):
+                    shop_router.url_for(name, **kwargs)
+
+    def test_reverse_table(self):
+        self.assertEqual(
+            [template.route for template in shop_router.reverse_table['product']],
+            ['shop/<slug:shop>/products/<uuid:pk>/', 'shop/<slug:shop>/products/<int:pk>/'],
+        )
+        self.assertEqual(shop_router.url_for('product', shop='main', pk=1), '/api/shop/main/products/1/')
+
+        # formatted by router itself, outer include adds static "api/"
+        self.assertEqual(find_mount(shop_router, get_resolver()), 'api/')
+        self.assertIsNone(find_mount(unnamed_router, get_resolver()))
+
+    def test_router_without_app_name(self):
+        # reversed by Django, because name is not namespaced
+        self.assertEqual(unnamed_router.url_for('about'), reverse('about'))
+
+    def test_template_tag(self):
+        engine = Engine(libraries={'routify': 'django_routify.templatetags.routify'})
+        template = engine.from_string(
+            '{% load routify %}'
+            '{% url_for "shop:search" shop=shop query="a&b" %}|'
+            '{% url_for "about" %}|'
+            '{% url_for "shop:unknown" as missing %}{{ missing }}|'
+            '{% url_for "shop:product" shop=shop pk=1 as url %}{{ url }}'
+        )
+
+        self.assertEqual(
+            template.render(Context({'shop': 'main'})),
+            '/api/shop/main/search/a&amp;b/|/unnamed/about/||/api/shop/main/products/1/',
+        )
+
+    def test_template_tag_lookup(self):
+        from django_routify.templatetags import routify
+
+        with mock.patch.object(routify, '_find_router', wraps=routify._find_router) as find_router:
+            routify.url_for('shop:index', shop='main')
+            self.assertEqual(routify.url_for('shop:index', shop='main'), '/api/shop/main/')
+            self.assertEqual(find_router.call_count, 1)
+
+            # router with the same app_name is not included, the included one is found again
+            other = Router('/other', 'shop')
+            other.get('/', name='index')(lambda request: None)
+            self.assertEqual(routify.url_for('shop:index', shop='main'), '/api/shop/main/')
+            self.assertEqual(find_router.call_count, 2)
+
+
+
+class LazyViewTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.resolver = include_router(lazy_router)
+
+    def test_routes_from_metadata(self):
+        self.assertEqual(
+            [(str(url_pattern.pattern), url_pattern.name) for url_pattern in lazy_router.urls],
+            [
+                ('reports/', 'list_reports'),
+                ('reports/<int:pk>/', 'report'),
+                ('reports/<int:pk>/export/', 'export_report'),
+                ('webhook/', 'webhook'),
+                ('details/<int:id>/', 'detail'),
+            ],
+        )
+
+        match = self.resolver.resolve('lazy/webhook/')
+        self.assertTrue(match.func.csrf_exempt)
+        self.assertEqual(match._func_path, 'tests.lazy_views_tests.views.webhook')
+
+        match = self.resolver.resolve('lazy/reports/1/export/')
+        self.assertTrue(iscoroutinefunction(match.func))
+
+    def test_import_on_first_call(self):
+        module = 'tests.lazy_views_tests.reports'
+        self.assertNotIn(module, sys.modules)
+
+        match = self.resolver.resolve('lazy/details/7/')
+        self.assertNotIn(module, sys.modules)
+
+        response = match.func(self.factory.get('/lazy/details/7/'), **match.kwargs)
+        self.assertEqual(response.content, b'Report detail #7')
+        self.assertIn(module, sys.modules)
+
+    def test_class_based_and_async(self):
+        match = self.resolver.resolve('lazy/reports/3/')
+        response = match.func(self.factory.get('/lazy/reports/3/'), **match.kwargs)
+        self.assertEqual(response.content, b'Report #3')
+
+        match = self.resolver.resolve('lazy/reports/3/export/')
+        response = asyncio.run(match.func(self.factory.get('/lazy/reports/3/export/'), **match.kwargs))
+        self.assertEqual(response.content, b'Export report #3')
+
+    def test_warmup(self):
+        router = Router('/warmup', 'warmup')
+        lazy_view = router.get('list', view='tests.lazy_views_tests.views.list_reports')
+
+        self.assertIsInstance(lazy_view, LazyView)
+        self.assertFalse(lazy_view.loaded)
+
+        router.warmup()
+        self.assertTrue(lazy_view.loaded)
+
+    def test_wrong_metadata(self):
+        router = Router('/wrong', 'wrong')
+        router.get('export', view='tests.lazy_views_tests.views.export_report') # not declared async
+        router.get('report', view='tests.lazy_views_tests.views.ReportView', class_based=False)
+
+        for lazy_view in router.lazy_views:
+            with self.assertRaises(TypeError):
+                lazy_view.load()
+
+        with self.assertRaises(ValueError):
+            router.get('view', view='view')
+
+
+
+class ManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manifest = os.path.join(self.directory.name, 'orders.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @staticmethod
+    def routes(router):
+        return [(str(url_pattern.pattern), url_pattern.name) for url_pattern in router.urls]
+
+    def test_load_routes_from_manifest(self):
+        router = build_orders_router(self.manifest)
+        write_manifest(router)
+
+        with mock.patch.object(ColonPattern, 'normalize', side_effect=AssertionError):
+            loaded_router = build_orders_router(self.manifest)
+
+        self.assertEqual(loaded_router.prefix, '<slug:shop>/orders/')
+        self.assertEqual(self.routes(loaded_router), self.routes(router))
+        self.assertEqual(self.routes(loaded_router), [
+            ('', 'list_orders'),
+            ('<int:pk>/', 'get_order'),
+            ('<int:pk>/', 'update_order'),
+            ('<int:pk>/items/<uuid:item>/', 'order_item'),
+            ('reports/', 'list_reports'),
+        ])
+
+    def test_outdated_manifest(self):
+        write_manifest(build_orders_router(self.manifest))
+
+        with open(self.manifest, encoding='utf-8') as file:
+            manifest = json.load(file)
+        manifest['source_hash'] = 'outdated'
+        with open(self.manifest, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+
+        with self.assertWarns(RuntimeWarning):
+            router = build_orders_router(self.manifest)
+        self.assertEqual(str(router.urls[-2].pattern), '<int:pk>/items/<uuid:item>/')
+
+    def test_other_options(self):
+        write_manifest(build_orders_router(self.manifest))
+
+        # options of router are a part of source hash
+        with self.assertWarns(RuntimeWarning):
+            build_orders_router(self.manifest, auto_naming=False)
+
+    def test_missing_manifest(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            router = build_orders_router(self.manifest)
+
+        self.assertEqual(len(router.registrations), 5)
+        self.assertFalse(os.path.exists(self.manifest))
+
+    def test_command(self):
+        router = build_orders_router(self.manifest)
+        stdout = io.StringIO()
+
+        with override_settings(ROOT_URLCONF='tests.method_dispatch_tests.urls'):
+            call_command(CompileCommand(), stdout=stdout)
+
+        self.assertIn(f'Router "orders": 5 routes written to {self.manifest}', stdout.getvalue())
+        self.assertTrue(os.path.exists(self.manifest))
+
+
+
+class PatternTokenizerTests(unittest.TestCase):
+    @staticmethod
+    def view(request, user_id: int, post: str, uid: uuid.UUID):
+        pass
+
+    def test_tokenize(self):
+        self.assertEqual(
+            ColonPattern().tokenize('users/:user_id/<int:pk>/:post'),
+            ('users/', ('user_id', ':user_id'), '/<int:pk>/', ('post', ':post')),
+        )
+        self.assertEqual(CurlyPattern().tokenize('users/{uid}/'), ('users/', ('uid', '{uid}'), '/'))
+        self.assertEqual(AnglePattern().tokenize('users/<int:pk>/'), ('users/<int:pk>/',))
+
+    def test_normalize(self):
+        for pattern, url in (
+            (ColonPattern(), 'users/:user_id/posts/:post/:uid/'),
+            (CurlyPattern(), 'users/{user_id}/posts/{post}/{uid}/'),
+            (AnglePattern(), 'users/<user_id>/posts/<post>/<uid>/'),
+        ):
+            with self.subTest(pattern=pattern):
+                self.assertTrue(pattern.is_custom(url))
+                self.assertEqual(
+                    pattern.normalize(url, self.view, False),
+                    'users/<int:user_id>/posts/<slug:post>/<uuid:uid>/',
+                )
+
+    def test_params_with_same_beginning(self):
+        def view(request, id: int, id2: uuid.UUID):
+            pass
+
+        # str.replace of ":id" used to rewrite ":id2" too
+        self.assertEqual(
+            ColonPattern().normalize(':id/:id2/<int:pk>/', view, False),
+            '<int:id>/<uuid:id2>/<int:pk>/',
+        )
+
+    def test_not_custom(self):
+        self.assertFalse(ColonPattern().is_custom('users/<int:pk>/'))
+        self.assertEqual(ColonPattern().normalize('users/<int:pk>/', self.view, False), 'users/<int:pk>/')
+
+    def test_bounded_memo(self):
+        from django_routify.patterns import MEMO_SIZE, _join, _tokenize
+
+        for url in (f'generated/:id{number}/' for number in range(MEMO_SIZE + 10)):
+            ColonPattern().normalize(url, self.view, False)
+        self.assertEqual(_tokenize.cache_info().currsize, MEMO_SIZE)
+        self.assertLessEqual(_join.cache_info().currsize, MEMO_SIZE)
+
+    def test_regex_groups(self):
+        class DollarPattern(ColonPattern):
+            REGEX = r'\$(?:param_)?(\w+)'
+
+        self.assertEqual(DollarPattern().tokenize('users/$param_pk/'), ('users/', ('pk', '$param_pk'), '/'))
+
+        for regex in (r'\$\w+', r'\$(param_)?(\w+)'):
+            with self.subTest(regex=regex), self.assertRaises(ValueError):
+                type('BrokenPattern', (ColonPattern,), {'REGEX': regex})
+
+
+
+class FlatIncludeTests(unittest.TestCase):
+    PATHS = [
+        'api/',
+        'api/about/',
+        'api/users/',
+        'api/users/7/',
+        'api/users/me/',
+        'api/users/7/posts/',
+        'api/users/7/posts/hello-world/',
+        'api/health/',
+    ]
+    NOT_FOUND_PATHS = [
+        'api/users/me/posts/',
+        'api/users/7/posts/hello/world/',
+        'api/health/check/',
+    ]
+
+    @staticmethod
+    def describe(match):
+        return (
+            match.func,
+            match.args,
+            match.kwargs,
+            match.url_name,
+            match.app_names,
+            match.namespaces,
+            match.route,
+        )
+
+    def test_same_matches_as_nested(self):
+        nested = nested_urlpatterns[0]
+
+        for urlpatterns in (flat_urlpatterns, flat_radix_urlpatterns, flat_compiled_urlpatterns):
+            resolver = urlpatterns[0]
+            for path in self.PATHS:
+                with self.subTest(engine=type(resolver).__name__, path=path):
+                    self.assertEqual(
+                        self.describe(resolver.resolve(path)),
+                        self.describe(nested.resolve(path)),
+                    )
+            for path in self.NOT_FOUND_PATHS:
+                with self.subTest(engine=type(resolver).__name__, path=path):
+                    with self.assertRaises(Resolver404):
+                        resolver.resolve(path)
+
+    def test_one_level(self):
+        resolver = flat_urlpatterns[0]
+
+        self.assertEqual(
+            [str(pattern.pattern) for pattern in resolver.routes if not isinstance(pattern, AliasPattern)],
+            [
+                '',
+                'users/',
+                'users/<int:pk>/',
+                'users/me/',
+                'users/<int:user_id>/posts/',
+                'users/<int:user_id>/posts/<slug:slug>/',
+                'health/',
+                'about/',
+            ],
+        )
+        self.assertIsInstance(resolver.routes[1], FlatPattern)
+        self.assertIn('users/me/', resolver.static_urls)
+
+    def test_reverse(self):
+        urlconf = 'tests.flat_include_tests.urls'
+
+        self.assertEqual(reverse('api:about', urlconf=urlconf), '/api/about/')
+        self.assertEqual(reverse('api:users:me', urlconf=urlconf), '/api/users/me/')
+        self.assertEqual(
+            reverse('api:users:posts:get_post', kwargs={'user_id': 7, 'slug': 'hi'}, urlconf=urlconf),
+            '/api/users/7/posts/hi/',
+        )
+
+    def test_invalidation(self):
+        router = Router('/shop', 'shop', auto_trailing_slash=True)
+        child_router = router.include(Router('/products', 'products', auto_trailing_slash=True))
+
+        resolver = include_router(router, flat=True, cache_size=10)
+        with self.assertRaises(Resolver404):
+            resolver.resolve('shop/products/search/')
+
+        # registered into included router after include
+        @child_router.get('/search')
+        def search_products(request):
+            pass
+
+        self.assertEqual(resolver.resolve('shop/products/search/').url_name, 'search_products')
+
+    def test_dynamic_first_segment_order(self):
+        router = Router('', 'tags', auto_trailing_slash=True)
+
+        @router.get('/<str:tag>/latest')
+        def latest_by_tag(request, tag):
+            pass
+
+        child_router = router.include(Router('/news', 'news', auto_trailing_slash=True))
+
+        @child_router.get('/latest')
+        def latest_news(request):
+            pass
+
+        resolver = include_router(router, flat=True)
+        # dynamic route registered before included router still wins
+        self.assertEqual(resolver.resolve('news/latest/').url_name, 'latest_by_tag')
+        self.assertEqual(resolver.resolve('sport/latest/').url_name, 'latest_by_tag')
+
+    def test_recursive_include(self):
+        with self.assertRaises(ValueError):
+            users_router.include(api_router)
+
+
+class BulkRegistrationTests(unittest.TestCase):
+    @staticmethod
+    def build_specs():
+        def list_users(request):
+            pass
+
+        def create_user(request):
+            pass
+
+        def get_user(request, user_id: int):
+            pass
+
+        return [
+            ('/users', list_users, ['get']),
+            ('/users', create_user, ['post'], 'create_user'),
+            RouteSpec('/users/:user_id', get_user, ['GET']),
+            ('/reports/<int:id>', 'tests.lazy_views_tests.reports.detail', None, 'report'),
+        ]
+
+    def test_add_routes(self):
+        router = Router('/api', 'api', auto_trailing_slash=True, dynamic_pattern=ColonPattern)
+        views = router.add_routes(self.build_specs())
+
+        self.assertEqual(len(views), 4)
+        self.assertIsInstance(views[3], LazyView)
+        self.assertEqual(router.lazy_views, [views[3]])
+        self.assertEqual(
+            [str(url_pattern.pattern) for url_pattern in router.urls],
+            ['users/', 'users/', 'users/<int:user_id>/', 'reports/<int:id>/'],
+        )
+        self.assertIsInstance(router.urls[1], AliasPattern)
+
+        resolver = include_router(router)
+        factory = RequestFactory()
+        match = resolver.resolve('api/users/')
+        self.assertEqual(match.url_name, 'list_users')
+        self.assertEqual(match.func.__name__, 'list_users')
+        self.assertEqual(match.func(factory.patch('/api/users/')).status_code, 405)
+        self.assertEqual(resolver.resolve('api/users/7/').kwargs, {'user_id': 7})
+
+    def test_same_urls_as_decorators(self):
+        bulk_router = Router('/api', 'api', auto_trailing_slash=True, dynamic_pattern=ColonPattern)
+        bulk_router.add_routes(self.build_specs())
+
+        router = Router('/api', 'api', auto_trailing_slash=True, dynamic_pattern=ColonPattern)
+        for url_path, view, *rest in self.build_specs():
+            methods = rest[0] if rest else None
+            name = rest[1] if len(rest) > 1 else None
+            if isinstance(view, str):
+                router.route(url_path, view=view, methods=methods, name=name)
+            else:
+                router.route(url_path, methods=methods, name=name)(view)
+
+        self.assertEqual(
+            [(str(url_pattern.pattern), url_pattern.name) for url_pattern in bulk_router.urls],
+            [(str(url_pattern.pattern), url_pattern.name) for url_pattern in router.urls],
+        )
+        self.assertEqual(bulk_router.reverse_table.keys(), router.reverse_table.keys())
+
+    def test_duplicates(self):
+        def index(request):
+            pass
+
+        router = Router('/app', 'app')
+        views = router.add_routes([('/', index, ['GET']), ('/', index, ('get',))])
+
+        self.assertEqual(views, [index])
+        self.assertEqual(len(router.urls), 1)
+
+    def test_errors(self):
+        def index(request):
+            pass
+
+        router = Router('/app', 'app')
+        router.get('/')(index)
+        version = router.version
+
+        with self.assertRaises(RouteSpecError) as context:
+            router.add_routes([
+                ('/about', index),
+                ('/', index, ['GET']),
+                (1, index),
+                ('/contacts', None),
+                ('/search', index, ['SEARCH']),
+                'not a spec',
+            ])
+
+        self.assertEqual([index for index, _ in context.exception.errors], [1, 2, 3, 4, 5])
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertIn('5 route specs are invalid', str(context.exception))
+        # nothing is registered if any spec is invalid
+        self.assertEqual(len(router.urls), 1)
+        self.assertEqual(router.version, version)
+
+    def test_no_side_effects(self):
+        def get_user(request, user_id: int):
+            pass
+
+        created = []
+
+        def middleware(get_response):
+            created.append(get_response)
+            return get_response
+
+        router = Router('/teams/:team_id', 'teams', dynamic_pattern=ColonPattern, middleware=[middleware])
+        with self.assertRaises(RouteSpecError):
+            router.add_routes([('/users/:user_id', get_user), ('/users', None)])
+
+        # prefix is not normalized and middleware is not built for failed batch
+        self.assertEqual(router.prefix, 'teams/:team_id')
+        self.assertEqual(created, [])
+
+        router.add_routes([('/users/:user_id', get_user)])
+        self.assertEqual(router.prefix, 'teams/<slug:team_id>')
+        self.assertEqual(len(created), 1)
+
+
+class DeferredUrlsTests(unittest.TestCase):
+    @staticmethod
+    def build_router():
+        router = Router('/blog', 'blog', auto_trailing_slash=True)
+
+        @router.get('/posts')
+        def list_posts(request):
+            pass
+
+        @router.post('/posts', name='create_post')
+        def create_post(request):
+            pass
+
+        @router.get('/posts/<int:pk>')
+        def get_post(request, pk):
+            pass
+
+        return router
+
+    def test_records_until_accessed(self):
+        router = self.build_router()
+
+        self.assertFalse(router.materialized)
+        self.assertIsNone(router.dispatchers['posts/'].view)
+        self.assertEqual(router.dispatchers['posts/'].url_patterns, [])
+        # reverse table does not need URLPatterns
+        self.assertEqual([template.route for template in router.reverse_table['get_post']], ['blog/posts/<int:pk>/'])
+
+        self.assertEqual(
+            [(str(url_pattern.pattern), url_pattern.name) for url_pattern in router.urls],
+            [('posts/', 'list_posts'), ('posts/', 'create_post'), ('posts/<int:pk>/', 'get_post')],
+        )
+        self.assertTrue(router.materialized)
+        self.assertIsInstance(router.urls[1], AliasPattern)
+        self.assertIs(router.urls[0].callback, router.dispatchers['posts/'].view)
+        self.assertIn('posts/', router.static_urls)
+
+    def test_registered_after_access(self):
+        router = self.build_router()
+        urlpatterns = router.urls
+
+        @router.get('/about')
+        def about(request):
+            pass
+
+        @router.delete('/posts/<int:pk>')
+        def delete_post(request, pk):
+            pass
+
+        # the same list object, so plain django.urls.include sees new urls
+        self.assertIs(router.urls, urlpatterns)
+        self.assertEqual(
+            [(str(url_pattern.pattern), url_pattern.name) for url_pattern in urlpatterns[3:]],
+            [('about/', 'about'), ('posts/<int:pk>/', 'delete_post')],
+        )
+        dispatcher = router.dispatchers['posts/<int:pk>/']
+        self.assertEqual(dispatcher.methods, ['GET', 'DELETE'])
+        self.assertIs(urlpatterns[2].callback, dispatcher.view)
+
+    def test_include_keeps_order(self):
+        router = self.build_router()
+        router.include(Router('/tags', 'tags'))
+
+        @router.get('/feed')
+        def feed(request):
+            pass
+
+        self.assertFalse(router.materialized)
+        self.assertEqual(
+            [str(url_pattern.pattern) for url_pattern in router.urls],
+            ['posts/', 'posts/', 'posts/<int:pk>/', 'tags', 'feed/'],
+        )
+
+
+class HotSwapTests(unittest.TestCase):
+    URLCONF = 'tests.hot_swap_tests.urls'
+
+    def setUp(self):
+        self.resolver = get_resolver(self.URLCONF)
+
+    def tearDown(self):
+        for name in ('sales_report', 'export_report'):
+            if name in plugins_router.reverse_table:
+                plugins_router.remove(name)
+
+    def test_add(self):
+        with self.assertRaises(NoReverseMatch):
+            reverse('plugins:sales_report', urlconf=self.URLCONF)
+        # static url is shadowed by slug url registered before
+        self.assertEqual(self.resolver.resolve('/plugins/reports/').url_name, 'get_plugin')
+
+        plugins_router.add('/reports/sales', hot_swap_views.sales_report, ['GET'])
+
+        resolver = get_resolver(self.URLCONF)
+        self.assertEqual(resolver.resolve('/plugins/reports/sales/').func.__name__, 'sales_report')
+        self.assertEqual(reverse('plugins:sales_report', urlconf=self.URLCONF), '/plugins/reports/sales/')
+        with override_settings(ROOT_URLCONF=self.URLCONF):
+            self.assertEqual(plugins_router.url_for('sales_report'), '/plugins/reports/sales/')
+        # plain include of router urls sees it too
+        self.assertEqual(resolver.resolve('/legacy/reports/sales/').url_name, 'sales_report')
+
+    def test_remove(self):
+        plugins_router.add('/reports/sales', hot_swap_views.sales_report, ['GET'])
+        plugins_router.add('/reports/sales', hot_swap_views.export_report, ['POST'])
+        reverse('plugins:sales_report', urlconf=self.URLCONF)
+
+        self.assertEqual(plugins_router.remove('sales_report'), 1)
+
+        resolver = get_resolver(self.URLCONF)
+        with self.assertRaises(NoReverseMatch):
+            reverse('plugins:sales_report', urlconf=self.URLCONF)
+        match = resolver.resolve('/plugins/reports/sales/')
+        self.assertEqual(match.url_name, 'export_report')
+        self.assertEqual(match.func(RequestFactory().get('/plugins/reports/sales/')).status_code, 405)
+
+        with self.assertRaises(ValueError):
+            plugins_router.remove('sales_report')
+
+    def test_warm_kwargs_pruned(self):
+        router = Router('/swap', 'swap', auto_trailing_slash=True)
+        router.get('/items/<int:pk>', name='item', warm_kwargs={'pk': 1})(hot_swap_views.sales_report)
+        router.get('/tags/<slug:tag>', name='tag', warm_kwargs={'tag': 'new'})(hot_swap_views.sales_report)
+        router.urls
+
+        router.replace('tag', hot_swap_views.sales_report_v2)
+        self.assertEqual(router.warm_kwargs, {'items/<int:pk>/': {'pk': 1}, 'tags/<slug:tag>/': {'tag': 'new'}})
+
+        router.remove('item')
+        self.assertEqual(router.warm_kwargs, {'tags/<slug:tag>/': {'tag': 'new'}})
+
+    def test_compiled_modules_released(self):
+        router = Router('/swap', 'swap', auto_trailing_slash=True)
+        router.get('/items/<int:pk>', name='item')(hot_swap_views.sales_report)
+        resolver = include_router(router, engine='compiled')
+
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(ROUTIFY_CACHE_DIR=cache_dir), \
+                mock.patch('django_routify.codegen.MAX_CACHED_MODULES', 2):
+            os.chmod(cache_dir, 0o700)
+            names = []
+            for index in range(5):
+                router.add(f'/tags-{index}/<slug:tag>', hot_swap_views.sales_report_v2, ['GET'], f'tag_{index}')
+                self.assertEqual(resolver.resolve(f'swap/tags-{index}/new/').url_name, f'tag_{index}')
+                names.append(resolver.compiled.module.__name__)
+
+            # only module of current routes is imported, and only the newest ones are cached on disk
+            self.assertEqual([name in sys.modules for name in names], [False] * 4 + [True])
+            cached = {file_name.split('.', 1)[0] for file_name in os.listdir(cache_dir)}
+            self.assertEqual(len(cached), 2)
+            self.assertIn(names[-1], cached)
+
+    def test_replace(self):
+        plugins_router.add('/reports/sales', hot_swap_views.sales_report, ['GET'])
+        self.assertIs(plugins_router.replace('sales_report', hot_swap_views.sales_report_v2), hot_swap_views.sales_report_v2)
+
+        match = get_resolver(self.URLCONF).resolve('/plugins/reports/sales/')
+        self.assertEqual(match.url_name, 'sales_report')
+        response = match.func(RequestFactory().get('/plugins/reports/sales/'))
+        self.assertEqual(response.content, b'Sales report v2')
+        self.assertEqual(match.func(RequestFactory().post('/plugins/reports/sales/')).status_code, 405)
+
+    def test_snapshot(self):
+        resolver = hot_swap_urlpatterns[0]
+        table = resolver.table
+
+        plugins_router.add('/reports/sales', hot_swap_views.sales_report, ['GET'])
+
+        # snapshot taken before is not changed
+        self.assertEqual(len(table.urls), 2)
+        self.assertIsNot(resolver.table, table)
+        self.assertEqual(len(resolver.table.urls), 3)
+
+    def test_concurrent_resolving(self):
+        import threading
+
+        resolver = hot_swap_urlpatterns[0]
+        errors = []
+        done = threading.Event()
+
+        def resolve():
+            while not done.is_set():
+                try:
+                    match = resolver.resolve('plugins/reports/sales/')
+                    self.assertEqual(match.url_name, 'sales_report')
+                except Resolver404:
+                    pass
+                except Exception as error:
+                    errors.append(error)
+
+        threads = [threading.Thread(target=resolve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(50):
+            plugins_router.add('/reports/sales', hot_swap_views.sales_report, ['GET'])
+            plugins_router.remove('sales_report')
+        done.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+class WarmupTests(unittest.TestCase):
+    URLCONF = 'tests.lazy_views_tests.urls'
+
+    def test_warmup(self):
+        with override_settings(ROOT_URLCONF=self.URLCONF):
+            counts = warmup()
+
+            # leaving override_settings clears url caches
+            resolver = get_resolver(self.URLCONF)
+            self.assertTrue(resolver._populated)
+            self.assertTrue(resolver.url_patterns[0]._populated)
+            self.assertEqual(lazy_router._BaseRouter__mounts.get(resolver), '')
+
+        self.assertTrue(all(lazy_view.loaded for lazy_view in lazy_router.lazy_views))
+        self.assertGreaterEqual(counts['routers'], 1)
+        self.assertGreaterEqual(counts['lazy_views'], len(lazy_router.lazy_views))
+
+    def test_freeze(self):
+        with mock.patch('gc.freeze') as freeze, override_settings(ROOT_URLCONF=self.URLCONF):
+            warmup()
+            freeze.assert_not_called()
+            warmup(freeze=True)
+            freeze.assert_called_once_with()
+
+
+class WarmRoutesTests(unittest.TestCase):
+    URLCONF = 'tests.warm_routes_tests.urls'
+
+    def setUp(self):
+        self.settings = override_settings(ROOT_URLCONF=self.URLCONF, ALLOWED_HOSTS=['.example.com'])
+        self.settings.enable()
+        warm_views.calls.clear()
+
+    def tearDown(self):
+        self.settings.disable()
+
+    def test_warm_routes(self):
+        with self.assertLogs('django.request', 'ERROR'):
+            results = warm_routes()
+
+        self.assertEqual(
+            [(result.path, result.name, result.status) for result in results],
+            [
+                ('/warm/', 'index', 200),
+                ('/warm/reports/1/', 'report', 200),
+                ('/warm/broken/', 'broken', 500),
+            ],
+        )
+        self.assertTrue(all(result.duration > 0 for result in results))
+        # routes with undeclared params and without GET are skipped
+        self.assertEqual(warm_views.calls, ['/warm/', '/warm/reports/1/'])
+
+    def test_threads(self):
+        with self.assertLogs('django.request', 'ERROR'):
+            results = warm_routes(threads=4, host='api.example.com')
+
+        self.assertEqual([result.path for result in results], ['/warm/', '/warm/reports/1/', '/warm/broken/'])
+        self.assertEqual(sorted(warm_views.calls), ['/warm/', '/warm/reports/1/'])
+
+        with self.assertRaises(ValueError):
+            warm_routes(threads=0)
+
+    def test_command(self):
+        stdout = io.StringIO()
+        with self.assertLogs('django.request', 'ERROR'), self.assertRaisesRegex(CommandError, '1 routes'):
+            call_command(WarmCommand(), '--threads', '2', stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn('/warm/reports/1/  (report)', output)
+        self.assertIn('3 routes warmed', output)
+
+    def test_hosts_and_versions(self):
+        with override_settings(
+            ROOT_URLCONF='tests.warm_routes_tests.hosts_urls',
+            MIDDLEWARE=['django_routify.hosts.HostMiddleware'],
+        ):
+            with self.assertWarnsRegex(RuntimeWarning, 'tenant'), self.assertLogs('django.request', 'WARNING'):
+                results = warm_routes(host='www.example.com')
+
+        self.assertEqual(
+            [(result.path, result.host, result.version, result.status) for result in results],
+            [
+                ('/api/items/', 'www.example.com', '1', 200),
+                ('/api/items/', 'www.example.com', '2', 200),
+                ('/api/gone/', 'www.example.com', None, 404),
+                ('/admin/', 'admin.example.com', None, 200),
+            ],
+        )
+        # registered route which is not found fails warm up
+        self.assertEqual([result.failed for result in results], [False, False, True, False])
+        self.assertEqual(warm_views.calls, ['/api/items/', '/api/items/ v2', 'admin.example.com/admin/'])
+
+
+class HostRoutingTests(unittest.TestCase):
+    URLCONF = 'tests.hosts_tests.urls'
+
+    def setUp(self):
+        self.settings = override_settings(ROOT_URLCONF=self.URLCONF, ALLOWED_HOSTS=['.example.com'])
+        self.settings.enable()
+        self.factory = RequestFactory()
+        self.resolver = hosts_urlpatterns[0]
+
+    def tearDown(self):
+        self.settings.disable()
+
+    def get(self, host, path):
+        def get_response(request):
+            match = get_resolver().resolve(request.path_info)
+            return match.func(request, *match.args, **match.kwargs)
+
+        return HostMiddleware(get_response)(self.factory.get(path, HTTP_HOST=host))
+
+    def test_static_host(self):
+        response = self.get('api.example.com:8000', '/v1/status/')
+        self.assertEqual(response.content, b'API status on api.example.com')
+
+        with self.assertRaises(Resolver404):
+            self.get('api.example.com', '/dashboard/')
+        with self.assertRaises(Resolver404):
+            self.get('www.example.com', '/v1/status/')
+
+    def test_host_pattern(self):
+        self.assertEqual(self.get('acme.example.com', '/dashboard/').content, b'Dashboard of acme')
+        self.assertEqual(self.get('acme.de.eu.example.com', '/dashboard/').content, b'Dashboard of acme in de')
+        self.assertIsNotNone(self.resolver.cache.get('acme.example.com'))
+
+        token = _current_host.set('globex.example.com')
+        try:
+            match = get_resolver().resolve('/dashboard/')
+        finally:
+            _current_host.reset(token)
+        self.assertEqual(match.kwargs, {'tenant': 'globex'})
+        self.assertEqual(match.namespace, 'tenant')
+        self.assertEqual(match.route, 'dashboard/')
+
+    def test_default_router(self):
+        self.assertEqual(self.get('example.com', '/').content, b'Home')
+        self.assertEqual(get_resolver().resolve('/').url_name, 'home')
+
+        with self.assertRaises(Resolver404):
+            self.get('acme.example.com', '/')
+
+    def test_reverse(self):
+        self.assertEqual(reverse('api:status'), '/v1/status/')
+        self.assertEqual(reverse('site:home'), '/')
+
+    def test_async_middleware(self):
+        async def get_response(request):
+            return get_resolver().resolve(request.path_info).kwargs
+
+        middleware = HostMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        kwargs = asyncio.run(middleware(self.factory.get('/dashboard/', HTTP_HOST='acme.example.com')))
+        self.assertEqual(kwargs, {'tenant': 'acme'})
+        self.assertIsNone(_current_host.get())
+
+    def test_host_pattern_validation(self):
+        self.assertEqual(HostPattern('{tenant}.Example.com.').suffix, 'example.com')
+        with self.assertRaises(ValueError):
+            HostPattern('app-{tenant}.example.com')
+        with self.assertRaises(ValueError):
+            Router('/', 'wrong', host='{id}.{id}.example.com')
+        with self.assertRaises(TypeError):
+            Router('/', 'wrong', host=1)
+
+
+class VersionDispatchTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def call(self, router, request):
+        match = include_router(router).resolve(request.path_info.lstrip('/'))
+        response = match.func(request, **match.kwargs)
+        if asyncio.iscoroutine(response):
+            response = asyncio.run(response)
+        return response
+
+    def test_accept(self):
+        # other names are kept only for reversing
+        self.assertEqual(len([url for url in accept_router.urls if not isinstance(url, AliasPattern)]), 1)
+
+        response = self.call(accept_router, self.factory.get('/api/items/', HTTP_ACCEPT='application/json; version=2'))
+        self.assertEqual(response.content, b'Items v2')
+        self.assertEqual(response['Vary'], 'Accept')
+
+        # default version
+        response = self.call(accept_router, self.factory.get('/api/items/', HTTP_ACCEPT='application/json'))
+        self.assertEqual(response.content, b'Items v1')
+
+        response = self.call(accept_router, self.factory.post('/api/items/', HTTP_ACCEPT='application/json;version="2"'))
+        self.assertEqual(response.status_code, 201)
+
+        # POST exists only in version 2
+        with self.assertLogs('django.request', 'WARNING'):
+            response = self.call(accept_router, self.factory.post('/api/items/'))
+        self.assertEqual(response.status_code, 406)
+        with self.assertLogs('django.request', 'WARNING'):
+            response = self.call(accept_router, self.factory.delete('/api/items/'))
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response['Allow'], 'GET, POST')
+
+    def test_header(self):
+        response = self.call(header_router, self.factory.put('/reports/sales/', HTTP_X_VERSION='2'))
+        self.assertEqual(response.content, b'Sales v2 PUT')
+        self.assertEqual(response['Vary'], 'X-Version')
+
+        # views without version serve other versions
+        response = self.call(header_router, self.factory.get('/reports/sales/', HTTP_X_VERSION='3'))
+        self.assertEqual(response.content, b'Sales')
+        response = self.call(header_router, self.factory.get('/reports/sales/'))
+        self.assertEqual(response.content, b'Sales')
+
+    def test_query(self):
+        response = self.call(query_router, self.factory.get('/search/', {'version': '1'}))
+        self.assertEqual(response.content, b'Search v1')
+        response = self.call(query_router, self.factory.get('/search/', {'version': '2'}))
+        self.assertEqual(response.content, b'Search v2')
+        self.assertFalse(response.has_header('Vary'))
+        # sync view of the url path keeps dispatcher sync
+        self.assertFalse(iscoroutinefunction(query_router.dispatchers[''].view))
+
+        with self.assertLogs('django.request', 'WARNING'):
+            response = self.call(query_router, self.factory.get('/search/'))
+        self.assertEqual(response.status_code, 406)
+
+    def test_hot_swap(self):
+        router = Router('/swap', 'swap', auto_trailing_slash=True, versioning='header')
+        router.get('items', version='1')(hot_swap_views.sales_report)
+        router.get('items', version='2', name='items_v2')(hot_swap_views.sales_report_v2)
+        router.urls
+
+        router.remove('items_v2')
+        response = self.call(router, self.factory.get('/swap/items/', HTTP_X_API_VERSION='1'))
+        self.assertEqual(response.content, b'Sales report')
+        with self.assertLogs('django.request', 'WARNING'):
+            response = self.call(router, self.factory.get('/swap/items/', HTTP_X_API_VERSION='2'))
+        self.assertEqual(response.status_code, 406)
+
+    def test_validation(self):
+        router = Router('/wrong', 'wrong')
+        with self.assertRaises(ValueError):
+            router.get('items', version='1')(hot_swap_views.sales_report)
+        with self.assertRaises(ValueError):
+            Router('/wrong', 'wrong', versioning='cookie')
+        with self.assertRaises(ValueError):
+            Router('/wrong', 'wrong', default_version='1')
+
+        router = Router('/wrong', 'wrong', versioning='query')
+        router.get('items', version='1')(hot_swap_views.sales_report)
+        with self.assertRaises(ValueError):
+            router.get('items', version='1', name='other')(hot_swap_views.sales_report_v2)
+
+
+class FastLaneTests(unittest.TestCase):
+    URLCONF = 'tests.fast_lane_tests.urls'
+
+    def setUp(self):
+        from django.core.handlers.wsgi import WSGIHandler
+
+        self.settings = override_settings(
+            ROOT_URLCONF=self.URLCONF,
+            ALLOWED_HOSTS=['testserver'],
+            MIDDLEWARE=['tests.fast_lane_tests.middleware.mark_middleware'],
+        )
+        self.settings.enable()
+        self.factory = RequestFactory()
+        self.application = FastLaneWSGI(WSGIHandler())
+
+    def tearDown(self):
+        self.settings.disable()
+
+    def call(self, request):
+        status = []
+        response = self.application(request.environ, lambda line, headers: status.append(line))
+        content = b''.join(response)
+        response.close()
+        return status[0], json.loads(content) if content.startswith(b'{') else content
+
+    def test_fast_routes(self):
+        self.assertEqual(self.call(self.factory.get('/fast/health/')), ('200 OK', {'middleware': False}))
+        self.assertEqual(self.call(self.factory.get('/fast/items/7/')), ('200 OK', {'pk': 7, 'middleware': False}))
+        self.assertEqual(set(self.application.lane.static), {'fast/health/'})
+
+    def test_fall_through(self):
+        self.assertEqual(self.call(self.factory.get('/fast/profile/')), ('200 OK', {'middleware': True}))
+        # only GET of the path is fast
+        self.assertEqual(self.call(self.factory.post('/fast/items/7/')), ('200 OK', {'pk': 7, 'middleware': True}))
+        with self.assertLogs('django.request', 'WARNING'):
+            self.assertEqual(self.call(self.factory.get('/fast/missing/'))[0], '404 Not Found')
+
+    def test_shadowed_route(self):
+        # route which is not fast and registered before fast route is served by Django
+        self.assertEqual(self.call(self.factory.get('/fast/users/me/')), ('200 OK', b'profile me'))
+        self.assertNotIn('fast/users/me/', self.application.lane.static)
+        self.assertIsNone(self.application.lane.match('GET', '/fast/users/me/'))
+
+    def test_exception(self):
+        with self.assertLogs('django.request', 'WARNING'):
+            status, _ = self.call(self.factory.get('/fast/items/0/'))
+        self.assertEqual(status, '404 Not Found')
+
+    def test_routes_changed(self):
+        from django_routify.registry import get_version
+
+        self.call(self.factory.get('/fast/health/'))
+        # one counter of every router is compared per request
+        self.assertEqual(self.application.lane.version, get_version())
+        fast_router.add('/status', hot_swap_views.sales_report, ['GET'])
+        try:
+            self.assertEqual(self.call(self.factory.get('/fast/status/')), ('200 OK', b'Sales report'))
+            self.assertNotIn('fast/status/', self.application.lane.static)
+
+            fast_router.get('/ping', fast=True, name='ping')(hot_swap_views.export_report)
+            self.assertEqual(self.call(self.factory.get('/fast/ping/')), ('200 OK', b'Export report'))
+            self.assertIn('fast/ping/', self.application.lane.static)
+        finally:
+            fast_router.remove('sales_report')
+            fast_router.remove('ping')
+
+    def test_asgi(self):
+        from django.core.handlers.asgi import ASGIHandler
+
+        application = FastLaneASGI(ASGIHandler())
+
+        async def call(path):
+            scope = {
+                'type': 'http',
+                'method': 'GET',
+                'path': path,
+                'query_string': b'',
+                'headers': [(b'host', b'testserver')],
+            }
+            messages = []
+            requests = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+            async def receive():
+                if requests:
+                    return requests.pop()
+                await asyncio.Event().wait() # client never disconnects
+
+            async def send(message):
+                messages.append(message)
+
+            await application(scope, receive, send)
+            body = b''.join(message.get('body', b'') for message in messages[1:])
+            return messages[0]['status'], json.loads(body)
+
+        self.assertEqual(asyncio.run(call('/fast/health/')), (200, {'middleware': False}))
+        self.assertEqual(asyncio.run(call('/fast/items/3/')), (200, {'pk': 3, 'middleware': False}))
+        self.assertEqual(asyncio.run(call('/fast/profile/')), (200, {'middleware': True}))
+
+
+class RouterMiddlewareTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def call(self, router, path, data=None):
+        match = include_router(router).resolve(path.lstrip('/'))
+        response = match.func(self.factory.get(path, data), *match.args, **match.kwargs)
+        if asyncio.iscoroutine(response):
+            response = asyncio.run(response)
+        return response
+
+    def test_router_middleware(self):
+        response = self.call(scoped_router, '/scoped/items/5/')
+        self.assertEqual(json.loads(response.content), {'pk': 5, 'trace': ['outer']})
+        self.assertEqual(response['X-Outer'], 'sync')
+
+    def test_route_middleware(self):
+        # middleware of router is the outermost
+        response = self.call(scoped_router, '/scoped/orders/')
+        self.assertEqual(json.loads(response.content), {'trace': ['outer', 'inner']})
+
+    def test_async_view(self):
+        match = include_router(scoped_router).resolve('scoped/stream/')
+        self.assertTrue(iscoroutinefunction(match.func))
+        response = self.call(scoped_router, '/scoped/stream/')
+        self.assertEqual(json.loads(response.content), {'trace': ['outer']})
+        self.assertEqual(response['X-Outer'], 'async')
+
+        # sync only middleware is adapted, the view stays async
+        match = include_router(scoped_router).resolve('scoped/mixed/')
+        self.assertTrue(iscoroutinefunction(match.func))
+        response = self.call(scoped_router, '/scoped/mixed/')
+        self.assertEqual(json.loads(response.content), {'trace': ['outer', 'inner']})
+        self.assertEqual(response['X-Outer'], 'sync')
+
+    def test_get_middleware(self):
+        self.assertEqual(scoped_router.get_middleware('get_item'), [scoped_middleware.outer_middleware])
+        self.assertEqual(
+            scoped_router.get_middleware('get_orders'),
+            [scoped_middleware.outer_middleware, scoped_middleware.inner_middleware],
+        )
+        self.assertEqual(plain_router.get_middleware('ping'), [])
+        with self.assertRaises(ValueError):
+            scoped_router.get_middleware('missing')
+
+    def test_other_router(self):
+        response = self.call(plain_router, '/plain/ping/')
+        self.assertEqual(json.loads(response.content), {'trace': []})
+        self.assertFalse(response.has_header('X-Outer'))
+
+    def test_replace(self):
+        def replacement(request, pk):
+            return JsonResponse({'replaced': pk, 'trace': request.trace})
+
+        # replaced view is wrapped into middleware of router again
+        scoped_router.replace('get_item', replacement)
+        try:
+            response = self.call(scoped_router, '/scoped/items/5/')
+            self.assertEqual(json.loads(response.content), {'replaced': 5, 'trace': ['outer']})
+        finally:
+            scoped_router.replace('get_item', 'tests.router_middleware_tests.views.get_item')
+
+    def test_view_hooks(self):
+        # process_view runs after __call__ of every middleware, and may answer instead of view
+        response = self.call(hooks_router, '/hooked/items/5/')
+        self.assertEqual(json.loads(response.content), {'pk': 5, 'trace': ['view']})
+        response = self.call(hooks_router, '/hooked/items/5/', {'short': 1})
+        self.assertEqual(json.loads(response.content), {'short': True, 'kwargs': {'pk': 5}})
+
+        # process_exception converts exception of view into response
+        response = self.call(hooks_router, '/hooked/items/0/')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.content), {'error': 'missing item'})
+
+    def test_async_view_hooks(self):
+        match = include_router(hooks_router).resolve('hooked/stream/5/')
+        self.assertTrue(iscoroutinefunction(match.func))
+        response = self.call(hooks_router, '/hooked/stream/5/')
+        self.assertEqual(json.loads(response.content), {'pk': 5, 'trace': ['view']})
+        response = self.call(hooks_router, '/hooked/stream/0/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_template_response_hooks(self):
+        # template response is rendered after hooks, so middleware can read its content
+        response = self.call(hooks_router, '/hooked/page/')
+        self.assertTrue(response.is_rendered)
+        self.assertEqual(response.content, b'view')
+        self.assertEqual(response['X-Length'], '4')
+
+    def test_exception_response(self):
+        # exception of view is converted into response before middleware gets it
+        with override_settings(ROOT_URLCONF='tests.router_middleware_tests.urls'):
+            response = self.call(scoped_router, '/scoped/gone/')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response['X-Outer'], 'sync')
+
+    def test_csrf_middleware(self):
+        resolver = include_router(hooks_router)
+        match = resolver.resolve('hooked/submit/')
+        self.assertEqual(match.func(self.factory.post('/hooked/submit/'), **match.kwargs).status_code, 403)
+        request = self.factory.post('/hooked/submit/')
+        request._dont_enforce_csrf_checks = True
+        self.assertEqual(match.func(request, **match.kwargs).status_code, 200)
+
+        match = resolver.resolve('hooked/hook/')
+        self.assertEqual(match.func(self.factory.post('/hooked/hook/'), **match.kwargs).status_code, 200)
+
+    def test_validation(self):
+        with self.assertRaises(TypeError):
+            Router(middleware='tests.router_middleware_tests.middleware.inner_middleware')
+        with self.assertRaises(TypeError):
+            Router(middleware=[1])
+        with self.assertRaises(ImportError):
+            Router().get('/x', middleware=['tests.router_middleware_tests.middleware.missing'])(lambda request: None)
+
+
+class AsyncGuardTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.resolver = include_router(async_router)
+
+    def call(self, request):
+        from asgiref.sync import AsyncToSync, SyncToAsync
+
+        # every thread pool hop goes through SyncToAsync or AsyncToSync
+        hops = []
+        sync_to_async_call = SyncToAsync.__call__
+        async_to_sync_call = AsyncToSync.__call__
+
+        def count_sync_to_async(adapter, *args, **kwargs):
+            hops.append(adapter.func)
+            return sync_to_async_call(adapter, *args, **kwargs)
+
+        def count_async_to_sync(adapter, *args, **kwargs):
+            hops.append(adapter.awaitable)
+            return async_to_sync_call(adapter, *args, **kwargs)
+
+        match = self.resolver.resolve(request.path_info.lstrip('/'))
+        with mock.patch.object(SyncToAsync, '__call__', count_sync_to_async), \
+                mock.patch.object(AsyncToSync, '__call__', count_async_to_sync):
+            response = match.func(request, *match.args, **match.kwargs)
+            if asyncio.iscoroutine(response):
+                response = asyncio.run(response)
+        return response, len(hops)
+
+    def test_async_view(self):
+        # url path with sync view is dispatched sync, only async view is adapted
+        self.assertFalse(iscoroutinefunction(self.resolver.resolve('async/items/').func))
+        response, hops = self.call(self.factory.get('/async/items/'))
+        self.assertEqual((response.content, hops), (b'Items', 1))
+
+        with self.assertLogs('django.request', 'WARNING'):
+            response, hops = self.call(self.factory.delete('/async/items/'))
+        self.assertEqual((response.status_code, hops), (405, 0))
+
+        response, hops = self.call(self.factory.post('/async/items/'))
+        self.assertEqual((response.status_code, hops), (201, 0))
+
+    def test_class_based_view(self):
+        self.assertTrue(iscoroutinefunction(self.resolver.resolve('async/hello/routify/').func))
+        response, hops = self.call(self.factory.get('/async/hello/routify/'))
+        self.assertEqual((response.content, hops), (b'Hello, routify', 0))
+
+        with self.assertLogs('django.request', 'WARNING'):
+            response, hops = self.call(self.factory.post('/async/hello/routify/'))
+        self.assertEqual((response.status_code, hops), (405, 0))
+
+    def test_legacy_class_based_view(self):
+        # view of Django < 4.1 is wrapped into coroutine function at registration
+        self.assertFalse(iscoroutinefunction(LegacyView.as_view()))
+        self.assertTrue(iscoroutinefunction(self.resolver.resolve('async/legacy/').func))
+        response, hops = self.call(self.factory.get('/async/legacy/'))
+        self.assertEqual((response.content, hops), (b'Legacy', 0))
+
+        response, hops = self.call(self.factory.options('/async/legacy/'))
+        self.assertEqual((response.status_code, hops), (200, 0))
+
+    def test_mixed_handlers(self):
+        from django.core.exceptions import ImproperlyConfigured
+        from django.views import View
+
+        class MixedView(View):
+            async def get(self, request):
+                pass
+
+            def post(self, request):
+                pass
+
+        with self.assertRaises(ImproperlyConfigured):
+            Router().route('/mixed')(MixedView)
+
+
+class PersistentLoopTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.resolver = include_router(loop_views.router)
+
+    def call(self, path):
+        match = self.resolver.resolve(path.lstrip('/'))
+        # dispatcher stays sync, so Django WSGI handler calls it directly
+        self.assertFalse(iscoroutinefunction(match.func))
+        response = match.func(self.factory.get(path), *match.args, **match.kwargs)
+        return json.loads(response.content)
+
+    def test_one_loop(self):
+        first = self.call('/loop/items/1/')
+        second = self.call('/loop/items/2/')
+        self.assertEqual(first['loop'], second['loop'])
+        self.assertEqual(self.call('/loop/hello/')['loop'], first['loop'])
+        self.assertEqual(first['thread'], persistent_loop.thread.ident)
+
+        # sync views run in calling thread
+        self.assertEqual(self.call('/loop/ping/')['thread'], threading.get_ident())
+
+    def test_context(self):
+        token = loop_views.tenant.set('acme')
+        try:
+            self.assertEqual(self.call('/loop/items/1/')['tenant'], 'acme')
+        finally:
+            loop_views.tenant.reset(token)
+
+    def test_exception(self):
+        from django.http import Http404
+
+        with self.assertRaises(Http404):
+            self.call('/loop/items/0/')
+
+    def test_close_connections(self):
+        from django.db import connections
+
+        # connections of thread sensitive thread are closed in it when request ends
+        closed = []
+        with mock.patch.object(connections, 'close_all', side_effect=lambda: closed.append(threading.get_ident())):
+            thread = self.call('/loop/query/')['thread']
+            self.assertEqual(closed, [thread])
+
+            # no thread is started only to close connections
+            closed.clear()
+            self.call('/loop/items/1/')
+            self.assertEqual(closed, [])
+
+    def test_own_thread(self):
+        async def nested():
+            return persistent_loop.run(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run_coroutine_threadsafe(nested(), persistent_loop.get_loop()).result()
+
+    def test_validation(self):
+        with self.assertRaises(TypeError):
+            Router(persistent_loop='yes')
+        self.assertFalse(Router().persistent_loop)
+
+
+class RouteExecutorTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    async def call(self, router, path):
+        match = include_router(router).resolve(path.lstrip('/'))
+        self.assertTrue(iscoroutinefunction(match.func))
+        response = await match.func(self.factory.get(path), *match.args, **match.kwargs)
+        return json.loads(response.content)
+
+    def test_parallel(self):
+        async def run():
+            return await asyncio.gather(
+                self.call(executor_views.router, '/exec/report/'),
+                self.call(executor_views.router, '/exec/report/'),
+            )
+
+        completed = executor_views.reports.metrics.completed
+        first, second = asyncio.run(run())
+        self.assertTrue(first['thread'].startswith('routify-reports'))
+        self.assertNotEqual(first['thread'], second['thread'])
+        self.assertEqual(first['active'], [2])
+
+        metrics = executor_views.reports.metrics
+        self.assertEqual((metrics.active, metrics.queued, metrics.utilization), (0, 0, 0))
+        self.assertEqual(metrics.completed, completed + 2)
+        self.assertIn(metrics, executor_metrics())
+
+    def test_route_executor(self):
+        response = asyncio.run(self.call(executor_views.router, '/exec/export/'))
+        self.assertFalse(response['thread'].startswith('routify-reports'))
+
+        # async views are not affected
+        response = asyncio.run(self.call(executor_views.router, '/exec/status/'))
+        self.assertEqual(response['thread'], threading.current_thread().name)
+
+    def test_other_router(self):
+        match = include_router(executor_views.plain_router).resolve('plain/ping/')
+        self.assertFalse(iscoroutinefunction(match.func))
+
+    def test_wsgi(self):
+        from asgiref.sync import AsyncToSync
+        from django_routify.fastlane import FastLane
+
+        # sync dispatcher calls view of executor without event loop
+        match = include_router(executor_views.plain_router).resolve('plain/mixed/')
+        self.assertFalse(iscoroutinefunction(match.func))
+        with mock.patch.object(AsyncToSync, '__call__', side_effect=AssertionError('event loop')):
+            response = match.func(self.factory.post('/plain/mixed/'))
+            self.assertTrue(json.loads(response.content)['thread'].startswith('routify-reports'))
+
+            # so does fast lane under WSGI, for path of executor views only
+            match = include_router(executor_views.router).resolve('exec/export/')
+            self.assertTrue(iscoroutinefunction(match.func))
+            response = FastLane.get_response(self.factory.get('/exec/export/'), (match.func, True, (), {}))
+            self.assertEqual(response.status_code, 200)
+
+    def test_connections(self):
+        closed = []
+        with mock.patch(
+            'django_routify.executors.close_old_connections',
+            side_effect=lambda: closed.append(threading.current_thread().name),
+        ):
+            asyncio.run(self.call(executor_views.plain_router, '/plain/manual/'))
+        self.assertEqual(len(closed), 2)
+        self.assertTrue(all(name.startswith('routify-reports') for name in closed))
+
+    def test_atomic_requests(self):
+        from django.core.handlers.base import BaseHandler
+        from django.db import connections
+
+        atomic = []
+        resolver = include_router(executor_views.plain_router)
+        with mock.patch.dict(connections.settings['default'], ATOMIC_REQUESTS=True), mock.patch(
+            'django.db.transaction.atomic',
+            side_effect=lambda using: lambda view: atomic.append((using, threading.current_thread().name)) or view,
+        ):
+            # Django handler does not open transaction for async view of executor, it is opened in thread of executor
+            view = BaseHandler().make_view_atomic(include_router(executor_views.router).resolve('exec/export/').func)
+            asyncio.run(view(self.factory.get('/exec/export/')))
+            self.assertEqual(len(atomic), 1)
+            self.assertNotEqual(atomic.pop()[1], threading.current_thread().name)
+
+            view = BaseHandler().make_view_atomic(resolver.resolve('plain/manual/').func)
+            asyncio.run(view(self.factory.get('/plain/manual/')))
+            self.assertEqual(atomic, [])
+
+            match = resolver.resolve('plain/mixed/')
+            view = BaseHandler().make_view_atomic(match.func)
+            self.assertEqual(atomic, [('default', threading.current_thread().name)])
+            view(self.factory.post('/plain/mixed/'))
+            self.assertEqual(atomic[1][0], 'default')
+            self.assertTrue(atomic[1][1].startswith('routify-reports'))
+
+    def test_settings(self):
+        from django_routify.executors import get_executor
+
+        with override_settings(ROUTIFY_EXECUTORS={'imports': 3}):
+            self.assertEqual(get_executor('imports').max_workers, 3)
+        with self.assertRaises(ValueError):
+            get_executor('missing')
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            register_executor('reports', 1)
+        with self.assertRaises(ValueError):
+            register_executor('non_thread_sensitive', 1)
+        with self.assertRaises(ValueError):
+            Router(persistent_loop=True, executor='reports')
+        with self.assertRaises(ValueError):
+            Router().get('/x', executor='missing')(lambda request: None)
+
+
+class StatelessViewTests(unittest.TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.resolver = include_router(stateless_router)
+
+    def call(self, request):
+        match = self.resolver.resolve(request.path_info.lstrip('/'))
+        response = match.func(request, *match.args, **match.kwargs)
+        if asyncio.iscoroutine(response):
+            response = asyncio.run(response)
+        return response
+
+    def test_dispatch(self):
+        with mock.patch('django.views.View.setup') as setup:
+            response = self.call(self.factory.get('/stateless/items/3/'))
+            self.assertEqual(json.loads(response.content), {'item': 'item-3'})
+            response = self.call(self.factory.post('/stateless/items/3/'))
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(self.call(self.factory.head('/stateless/items/3/')).status_code, 200)
+        setup.assert_not_called()
+
+        response = self.call(self.factory.options('/stateless/items/3/'))
+        self.assertIn('POST', response['Allow'])
+        with self.assertLogs('django.request', 'WARNING'):
+            self.assertEqual(self.call(self.factory.delete('/stateless/items/3/')).status_code, 405)
+
+        match = self.resolver.resolve('stateless/items/3/')
+        self.assertEqual(match.func.view_class.__name__, 'ItemView')
+
+    def test_async(self):
+        match = self.resolver.resolve('stateless/async-items/3/')
+        self.assertTrue(iscoroutinefunction(match.func))
+        response = self.call(self.factory.get('/stateless/async-items/3/'))
+        self.assertEqual(json.loads(response.content), {'item': 3})
+        with self.assertLogs('django.request', 'WARNING'):
+            self.assertEqual(self.call(self.factory.post('/stateless/async-items/3/')).status_code, 405)
+
+    def test_stateful(self):
+        from django.contrib.auth.decorators import login_required
+        from django.utils.decorators import method_decorator
+        from django.views import View
+
+        class StoresState(View):
+            def get(self, request):
+                self.items = []
+                return JsonResponse({})
+
+        class ReadsKwargs(View):
+            def get(self, request, pk):
+                return JsonResponse({'pk': self.get_pk()})
+
+            def get_pk(self):
+                return self.kwargs['pk']
+
+        class OverridesSetup(View):
+            def setup(self, request, *args, **kwargs):
+                super().setup(request, *args, **kwargs)
+
+        @method_decorator(login_required, name='dispatch')
+        class DecoratesDispatch(View):
+            def get(self, request):
+                return JsonResponse({})
+
+        # state kept by nested functions, lambdas and comprehensions
+        class StoresInClosure(View):
+            def get(self, request):
+                def remember(items):
+                    self.items = items
+                remember([])
+                return JsonResponse({})
+
+        class ReadsInComprehension(View):
+            def get(self, request):
+                return JsonResponse({'args': [arg for arg in self.args]})
+
+        class ReadsInLambda(View):
+            def get(self, request):
+                return JsonResponse({'pk': (lambda: self.kwargs['pk'])()})
+
+        class UsesSetattr(View):
+            def get(self, request):
+                setattr(self, 'items', [])
+                return JsonResponse({})
+
+        class UsesNestedSetattr(View):
+            def get(self, request):
+                target = self
+                return JsonResponse({'items': [setattr(target, 'item', item) for item in range(2)]})
+
+        class UsesDict(View):
+            def get(self, request):
+                self.__dict__['items'] = []
+                return JsonResponse({})
+
+        stateful = (
+            StoresState,
+            ReadsKwargs,
+            OverridesSetup,
+            DecoratesDispatch,
+            StoresInClosure,
+            ReadsInComprehension,
+            ReadsInLambda,
+            UsesSetattr,
+            UsesNestedSetattr,
+            UsesDict,
+        )
+        for view in stateful:
+            with self.subTest(view=view.__name__), self.assertRaises(ValueError):
+                Router().route('/view', stateless=True)(view)
+
+        # nested code which does not close over instance keeps no state in it
+        class UsesClosure(View):
+            prefix = 'item'
+
+            def get(self, request, pk):
+                prefix = self.prefix
+                return JsonResponse({'items': [f'{prefix}-{item}' for item in range(pk)]})
+
+        Router().route('/view/<int:pk>', stateless=True)(UsesClosure)
+
+        with self.assertRaises(TypeError):
+            Router().route('/view', stateless=True)(lambda request: None)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.settings = override_settings(ALLOWED_HOSTS=['testserver', '.example.com'])
+        self.settings.enable()
+        self.factory = RequestFactory()
+        self.resolver = include_router(cache_views.router)
+        cache_views.calls.clear()
+        for name in ('get_product', 'cart', 'prices', 'reports', 'stock', 'quotes', 'ticker'):
+            cache_views.router.get_cache(name).clear()
+        cache_views.tenant_router.get_cache('dashboard').clear()
+
+    def tearDown(self):
+        self.settings.disable()
+
+    def call(self, request):
+        match = self.resolver.resolve(request.path_info.lstrip('/'))
+        response = match.func(request, *match.args, **match.kwargs)
+        if asyncio.iscoroutine(response):
+            response = asyncio.run(response)
+        return json.loads(response.content), response
+
+    def test_hit(self):
+        content, _ = self.call(self.factory.get('/catalog/products/1/'))
+        self.assertEqual(content, {'pk': 1, 'calls': 1})
+        content, response = self.call(self.factory.get('/catalog/products/1/'))
+        self.assertEqual(content, {'pk': 1, 'calls': 1})
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        # query and listed headers are parts of key
+        self.assertEqual(self.call(self.factory.get('/catalog/products/1/', {'a': 1}))[0]['calls'], 2)
+        self.assertEqual(self.call(self.factory.get('/catalog/products/1/?a=1'))[0]['calls'], 2)
+        _, response = self.call(self.factory.get('/catalog/products/1/', HTTP_ACCEPT_LANGUAGE='uk'))
+        self.assertEqual(response['X-Language'], 'uk')
+
+        stats = cache_views.router.get_cache('get_product').stats
+        self.assertEqual((stats['size'], stats['evictions']), (2, 1))
+
+    def test_not_cached(self):
+        self.call(self.factory.post('/catalog/products/1/'))
+        self.assertEqual(self.call(self.factory.post('/catalog/products/1/'))[0]['calls'], 2)
+        self.assertEqual(cache_views.router.get_cache('update_product').stats['size'], 0)
+
+        # responses setting cookies are not cached
+        self.call(self.factory.get('/catalog/cart/'))
+        self.assertEqual(self.call(self.factory.get('/catalog/cart/'))[0]['calls'], 2)
+
+        # neither are responses of authenticated requests
+        self.call(self.factory.get('/catalog/stock/', HTTP_AUTHORIZATION='Bearer token'))
+        self.assertEqual(self.call(self.factory.get('/catalog/stock/', HTTP_AUTHORIZATION='Bearer token'))[0]['calls'], 2)
+        self.factory.cookies['sessionid'] = 'session'
+        try:
+            self.assertEqual(self.call(self.factory.get('/catalog/stock/'))[0]['calls'], 3)
+        finally:
+            del self.factory.cookies['sessionid']
+        self.assertEqual(cache_views.router.get_cache('stock').stats['size'], 0)
+
+    def test_method_key(self):
+        # responses of HEAD requests may have no content, so they are cached apart from GET ones
+        self.call(self.factory.get('/catalog/ticker/'))
+        self.assertEqual(self.call(self.factory.head('/catalog/ticker/'))[0], {'calls': 2})
+        self.assertEqual(self.call(self.factory.head('/catalog/ticker/'))[0], {'calls': 2})
+        self.assertEqual(self.call(self.factory.get('/catalog/ticker/'))[0], {'calls': 1})
+
+    def test_stale_while_revalidate(self):
+        with mock.patch('django_routify.caching.monotonic', return_value=100):
+            self.assertEqual(self.call(self.factory.get('/catalog/prices/'))[0]['calls'], 1)
+
+        with mock.patch('django_routify.caching.monotonic', return_value=105), \
+                mock.patch('django_routify.caching.Thread') as thread:
+            # stale response is served and only one refresh is started
+            self.assertEqual(self.call(self.factory.get('/catalog/prices/'))[0]['calls'], 1)
+            self.assertEqual(self.call(self.factory.get('/catalog/prices/'))[0]['calls'], 1)
+            self.assertEqual(thread.call_count, 1)
+            target, args = thread.call_args.kwargs['target'], thread.call_args.kwargs['args']
+
+            # view is refreshed with copy of request, without its cookies and session
+            self.assertIsInstance(args[1], RefreshRequest)
+            self.assertEqual((args[1].method, args[1].path), ('GET', '/catalog/prices/'))
+            self.assertNotIn('HTTP_COOKIE', args[1].META)
+            target(*args)
+            self.assertEqual(self.call(self.factory.get('/catalog/prices/'))[0]['calls'], 2)
+
+        with mock.patch('django_routify.caching.monotonic', return_value=200):
+            self.assertEqual(self.call(self.factory.get('/catalog/prices/'))[0]['calls'], 3)
+
+    def test_async_refresh(self):
+        from io import BytesIO
+        from django.core.handlers.asgi import ASGIRequest
+
+        async def run(request):
+            match = self.resolver.resolve('catalog/quotes/')
+            with mock.patch('django_routify.caching.monotonic', return_value=100):
+                await match.func(request())
+            with mock.patch('django_routify.caching.monotonic', return_value=105):
+                response = await match.func(request())
+                await asyncio.sleep(0)
+            return json.loads(response.content)
+
+        # under ASGI stale response is refreshed in running event loop
+        scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': '/catalog/quotes/',
+            'query_string': b'',
+            'headers': [(b'host', b'testserver')],
+        }
+        with mock.patch.object(persistent_loop, 'submit') as submit:
+            self.assertEqual(asyncio.run(run(lambda: ASGIRequest(scope, BytesIO()))), {'calls': 1})
+        submit.assert_not_called()
+        self.assertEqual(cache_views.calls['quotes'], 2)
+
+        # under WSGI event loop of request is closed with it
+        cache_views.router.get_cache('quotes').clear()
+        with mock.patch.object(persistent_loop, 'submit', side_effect=lambda refresh: refresh.close()) as submit:
+            asyncio.run(run(lambda: self.factory.get('/catalog/quotes/')))
+        self.assertEqual(submit.call_count, 1)
+
+    def test_coalesced_misses(self):
+        cache_views.release.clear()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.call(self.factory.get('/catalog/reports/?year=2024'))[0]))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        cache_views.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache_views.calls['reports'], 1)
+        self.assertEqual(results, [{'calls': 1}] * 4)
+
+    def test_async_view(self):
+        match = self.resolver.resolve('catalog/stock/')
+        self.assertTrue(iscoroutinefunction(match.func))
+        self.call(self.factory.get('/catalog/stock/'))
+        self.assertEqual(self.call(self.factory.get('/catalog/stock/'))[0]['calls'], 1)
+
+    def test_hosts(self):
+        # responses are not shared between hosts and tenants of host pattern
+        with override_settings(ROOT_URLCONF='tests.response_cache_tests.urls'):
+            def get(host):
+                def get_response(request):
+                    match = get_resolver().resolve(request.path_info)
+                    return match.func(request, *match.args, **match.kwargs)
+
+                response = HostMiddleware(get_response)(self.factory.get('/dashboard/', HTTP_HOST=host))
+                return json.loads(response.content)
+
+            self.assertEqual(get('acme.example.com'), {'tenant': 'acme', 'calls': 1})
+            self.assertEqual(get('globex.example.com'), {'tenant': 'globex', 'calls': 2})
+            self.assertEqual(get('acme.example.com'), {'tenant': 'acme', 'calls': 1})
+
+        # the same path on other host is another entry
+        self.call(self.factory.get('/catalog/stock/'))
+        self.assertEqual(self.call(self.factory.get('/catalog/stock/', HTTP_HOST='shop.example.com'))[0]['calls'], 2)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            CachePolicy(ttl=0)
+        with self.assertRaises(TypeError):
+            CachePolicy(ttl=30, key='year')
+        with self.assertRaises(TypeError):
+            Router().get('/x', cache=30)(lambda request: None)
+        with self.assertRaises(ValueError):
+            cache_views.router.get_cache('missing')
+
+
 if __name__ == '__main__':
     # Run test
     unittest.main()
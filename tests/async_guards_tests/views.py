@@ -0,0 +1,40 @@
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+from django_routify import Router
+
+router = Router('/async', 'async', auto_trailing_slash=True)
+
+
+@router.get('/items')
+async def list_items(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Items')
+
+
+@router.post('/items')
+def create_item(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Created', status=201)
+
+
+@router.route('/hello/<str:name>')
+class HelloView(View):
+    async def get(self, request: HttpRequest, name: str) -> HttpResponse:
+        return HttpResponse(f'Hello, {name}')
+
+
+class LegacyView(View):
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        return HttpResponse('Legacy')
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        # the same as view of Django < 4.1, which is not marked as coroutine function
+        def legacy_view(request: HttpRequest, *args, **kwargs):
+            return view(request, *args, **kwargs)
+        legacy_view.view_class = cls
+        return legacy_view
+
+
+router.route('/legacy')(LegacyView)
@@ -0,0 +1,53 @@
+import threading
+
+from django.db.transaction import non_atomic_requests
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+from django_routify import Router, register_executor, executor_metrics
+
+reports = register_executor('reports', 2)
+
+router = Router('/exec', 'exec', auto_trailing_slash=True, executor='reports')
+plain_router = Router('/plain', 'plain', auto_trailing_slash=True)
+
+barrier = threading.Barrier(2, timeout=5)
+
+
+@router.get('/report')
+def report(request: HttpRequest) -> HttpResponse:
+    # both requests must run at once to pass the barrier, and keep running until metrics are taken
+    barrier.wait()
+    active = [metrics.active for metrics in executor_metrics() if metrics.name == 'reports']
+    barrier.wait()
+    return JsonResponse({'thread': threading.current_thread().name, 'active': active})
+
+
+@router.get('/export', executor='non_thread_sensitive')
+def export(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
+
+
+@router.get('/status')
+async def status(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
+
+
+@plain_router.get('/ping')
+def ping(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
+
+
+@plain_router.get('/mixed')
+def read_mixed(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
+
+
+@plain_router.post('/mixed', executor='reports')
+def write_mixed(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
+
+
+@plain_router.get('/manual', executor='reports')
+@non_atomic_requests
+def manual(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.current_thread().name})
@@ -0,0 +1,8 @@
+from django.http import HttpRequest, HttpResponse
+
+
+def mark_middleware(get_response):
+    def middleware(request: HttpRequest) -> HttpResponse:
+        request.middleware = True
+        return get_response(request)
+    return middleware
@@ -0,0 +1,37 @@
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+
+from django_routify import Router
+
+router = Router('/fast', 'fast', auto_trailing_slash=True)
+
+
+@router.get('/health', fast=True)
+def health(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'middleware': hasattr(request, 'middleware')})
+
+
+@router.get('/items/<int:pk>', fast=True)
+async def get_item(request: HttpRequest, pk: int) -> HttpResponse:
+    if pk == 0:
+        raise Http404('No item')
+    return JsonResponse({'pk': pk, 'middleware': hasattr(request, 'middleware')})
+
+
+@router.post('/items/<int:pk>')
+def update_item(request: HttpRequest, pk: int) -> HttpResponse:
+    return JsonResponse({'pk': pk, 'middleware': hasattr(request, 'middleware')})
+
+
+@router.get('/profile')
+def profile(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'middleware': hasattr(request, 'middleware')})
+
+
+@router.get('/users/<slug:name>')
+def user_profile(request: HttpRequest, name: str) -> HttpResponse:
+    return HttpResponse(f'profile {name}')
+
+
+@router.get('/users/me', fast=True)
+def me(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('me')
@@ -0,0 +1,21 @@
+from django_routify import include_router
+
+from .views import router
+
+nested_urlpatterns = [
+    include_router(router),
+]
+
+flat_urlpatterns = [
+    include_router(router, flat=True),
+]
+
+radix_urlpatterns = [
+    include_router(router, engine='radix', flat=True),
+]
+
+compiled_urlpatterns = [
+    include_router(router, engine='compiled', flat=True),
+]
+
+urlpatterns = flat_urlpatterns
@@ -0,0 +1,53 @@
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router
+
+router = Router('/api', 'api', auto_trailing_slash=True)
+users_router = Router('/users', 'users', auto_trailing_slash=True)
+posts_router = Router('/<int:user_id>/posts', 'posts', auto_trailing_slash=True)
+health_router = Router('/health', auto_trailing_slash=True)
+
+
+@router.get('/')
+def index(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Index')
+
+
+@users_router.get('/')
+def list_users(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('List users')
+
+
+@users_router.get('/<int:pk>')
+def get_user(request: HttpRequest, pk: int) -> HttpResponse:
+    return HttpResponse(f'User #{pk}')
+
+
+@users_router.get('/me', name='me')
+def current_user(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Current user')
+
+
+@posts_router.get('/')
+def list_posts(request: HttpRequest, user_id: int) -> HttpResponse:
+    return HttpResponse(f'Posts of user #{user_id}')
+
+
+@posts_router.get('/<slug:slug>')
+def get_post(request: HttpRequest, user_id: int, slug: str) -> HttpResponse:
+    return HttpResponse(f'Post {slug}')
+
+
+@health_router.get('/')
+def health(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('OK')
+
+
+users_router.include(posts_router)
+router.include(users_router)
+router.include(health_router)
+
+
+@router.get('/about')
+def about(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('About')
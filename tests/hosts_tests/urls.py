@@ -0,0 +1,7 @@
+from django_routify import include_hosts
+
+from .views import api_router, tenant_router, region_router, site_router
+
+urlpatterns = [
+    include_hosts(api_router, tenant_router, region_router, site_router, engine='radix'),
+]
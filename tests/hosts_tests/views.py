@@ -0,0 +1,28 @@
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router, get_current_host
+
+api_router = Router('/v1', 'api', host='API.example.com', auto_trailing_slash=True)
+tenant_router = Router('/', 'tenant', host='{tenant}.example.com', auto_trailing_slash=True)
+region_router = Router('/', 'region', host='{tenant}.{region}.eu.example.com', auto_trailing_slash=True)
+site_router = Router('/', 'site', auto_trailing_slash=True)
+
+
+@api_router.get('/status')
+def status(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(f'API status on {get_current_host()}')
+
+
+@tenant_router.get('/dashboard')
+def dashboard(request: HttpRequest, tenant: str) -> HttpResponse:
+    return HttpResponse(f'Dashboard of {tenant}')
+
+
+@region_router.get('/dashboard')
+def region_dashboard(request: HttpRequest, tenant: str, region: str) -> HttpResponse:
+    return HttpResponse(f'Dashboard of {tenant} in {region}')
+
+
+@site_router.get('/')
+def home(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Home')
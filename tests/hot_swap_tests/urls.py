@@ -0,0 +1,10 @@
+from django.urls import include, path
+
+from django_routify import include_router
+
+from .views import router
+
+urlpatterns = [
+    include_router(router, engine='radix', cache_size=16),
+    path('legacy/', include(router.urls)),
+]
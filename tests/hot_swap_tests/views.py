@@ -0,0 +1,28 @@
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router
+
+router = Router('/plugins', 'plugins', auto_trailing_slash=True)
+
+
+@router.get('/')
+def list_plugins(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('List plugins')
+
+
+@router.get('/<slug:slug>')
+def get_plugin(request: HttpRequest, slug: str) -> HttpResponse:
+    return HttpResponse(f'Plugin {slug}')
+
+
+# views enabled and disabled at runtime
+def sales_report(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Sales report')
+
+
+def sales_report_v2(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Sales report v2')
+
+
+def export_report(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Export report')
@@ -0,0 +1,6 @@
+from django.http import HttpRequest, HttpResponse
+
+
+# imported only by the first request to reports/<id>/
+def detail(request: HttpRequest, id: int) -> HttpResponse:
+    return HttpResponse(f'Report detail #{id}')
@@ -0,0 +1,23 @@
+from django_routify import include_router, Router, ColonPattern
+
+router = Router(
+    '/lazy',
+    'lazy',
+    auto_trailing_slash=True,
+    dynamic_pattern=ColonPattern,
+)
+
+router.get('/reports', view='tests.lazy_views_tests.views.list_reports')
+router.get('/reports/:pk', view='tests.lazy_views_tests.views.ReportView', parameters={'pk': int})
+router.get(
+    '/reports/:pk/export',
+    view='tests.lazy_views_tests.views.export_report',
+    parameters={'pk': int},
+    is_async=True,
+)
+router.post('/webhook', view='tests.lazy_views_tests.views.webhook', csrf_exempt=True)
+router.get('/details/:id', view='tests.lazy_views_tests.reports.detail', parameters={'id': int})
+
+urlpatterns = [
+    include_router(router),
+]
@@ -0,0 +1,21 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic import View
+
+
+def list_reports(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('List reports')
+
+
+class ReportView(View):
+    def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return HttpResponse(f'Report #{pk}')
+
+
+async def export_report(request: HttpRequest, pk: int) -> HttpResponse:
+    return HttpResponse(f'Export report #{pk}')
+
+
+@csrf_exempt
+def webhook(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Webhook')
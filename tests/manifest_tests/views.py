@@ -0,0 +1,38 @@
+import uuid
+
+from django.http import HttpRequest, HttpResponse
+from django.views.generic import View
+
+from django_routify import Router, ColonPattern
+
+
+def list_orders(request: HttpRequest, shop: str) -> HttpResponse:
+    return HttpResponse('List orders')
+
+
+def get_order(request: HttpRequest, shop: str, pk: int) -> HttpResponse:
+    return HttpResponse(f'Order #{pk}')
+
+
+class OrderItemView(View):
+    def get(self, request: HttpRequest, shop: str, pk: int, item: uuid.UUID) -> HttpResponse:
+        return HttpResponse(f'Item {item}')
+
+
+def build_router(manifest: str, **kwargs) -> Router:
+    router = Router(
+        '/:shop/orders',
+        'orders',
+        auto_trailing_slash=True,
+        dynamic_pattern=ColonPattern,
+        manifest=manifest,
+        **kwargs,
+    )
+
+    router.get('/')(list_orders)
+    router.get('/:pk')(get_order)
+    router.post('/:pk', name='update_order')(get_order)
+    router.get('/:pk/items/:item')(OrderItemView)
+    router.get('/reports', view='tests.lazy_views_tests.views.list_reports')
+
+    return router
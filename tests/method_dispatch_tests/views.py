@@ -0,0 +1,56 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic import View
+
+from django_routify import Router
+
+router = Router('/items', 'items', auto_trailing_slash=True)
+
+
+@router.get('/', name='list')
+def list_items(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('List items')
+
+
+# Same url path as list_items, dispatched by method
+@router.post('/', name='create')
+def create_item(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Create item')
+
+
+@router.get('/<int:pk>')
+class ItemView(View):
+    def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return HttpResponse(f'Item #{pk}')
+
+
+@router.delete('/<int:pk>')
+async def delete_item(request: HttpRequest, pk: int) -> HttpResponse:
+    return HttpResponse(f'Delete item #{pk}')
+
+
+@router.put('/async')
+async def put_async(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('PUT async')
+
+
+@router.patch('/async')
+async def patch_async(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('PATCH async')
+
+
+@router.get('/hooks')
+def list_hooks(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('List hooks')
+
+
+# Exempt view and protected view on the same url path
+@router.post('/hooks')
+@csrf_exempt
+def receive_hook(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Hook received')
+
+
+@router.put('/hooks')
+def replace_hooks(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Hooks replaced')
@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.views import View
+
+from django_routify import Router
+
+router = Router('/loop', 'loop', auto_trailing_slash=True, persistent_loop=True)
+
+tenant: ContextVar[str] = ContextVar('tenant', default='')
+
+
+@router.get('/items/<int:pk>')
+async def get_item(request: HttpRequest, pk: int) -> HttpResponse:
+    if pk == 0:
+        raise Http404('No item')
+    return JsonResponse({
+        'pk': pk,
+        'loop': id(asyncio.get_running_loop()),
+        'thread': threading.get_ident(),
+        'tenant': tenant.get(),
+    })
+
+
+@router.get('/ping')
+def ping(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'thread': threading.get_ident()})
+
+
+@router.route('/hello')
+class HelloView(View):
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        return JsonResponse({'loop': id(asyncio.get_running_loop())})
+
+
+@router.get('/query')
+async def query(request: HttpRequest) -> HttpResponse:
+    thread = await sync_to_async(threading.get_ident, thread_sensitive=True)()
+    return JsonResponse({'thread': thread})
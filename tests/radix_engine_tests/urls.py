@@ -0,0 +1,20 @@
+from django_routify import include_router
+
+from .views import router
+
+# Django based engine, linear scan of urls
+django_urlpatterns = [
+    include_router(router),
+]
+
+# Radix tree based engine
+radix_urlpatterns = [
+    include_router(router, engine='radix'),
+]
+
+# Generated module based engine
+compiled_urlpatterns = [
+    include_router(router, engine='compiled'),
+]
+
+urlpatterns = radix_urlpatterns
@@ -0,0 +1,62 @@
+import uuid
+
+from django.http import HttpRequest, HttpResponse
+from django.views.generic import View
+
+from django_routify import Router
+
+router = Router('/radix', 'radix', auto_trailing_slash=True)
+
+
+@router.get('/')
+def index(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Index')
+
+
+@router.get('/books')
+def books(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Books')
+
+
+@router.get('/<slug:slug>')
+def page(request: HttpRequest, slug: str) -> HttpResponse:
+    return HttpResponse(f'Page "{slug}"')
+
+
+# Unreachable, <slug:slug> is registered before and matches it first
+@router.get('/config')
+def config(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Config')
+
+
+@router.get('/users/<int:user_id>')
+def user_by_id(request: HttpRequest, user_id: int) -> HttpResponse:
+    return HttpResponse(f'User #{user_id}')
+
+
+@router.get('/users/<uuid:user_uuid>')
+def user_by_uuid(request: HttpRequest, user_uuid: uuid.UUID) -> HttpResponse:
+    return HttpResponse(f'User {user_uuid}')
+
+
+@router.get('/users/<int:user_id>/posts/<slug:post>')
+class UserPostView(View):
+    def get(self, request: HttpRequest, user_id: int, post: str) -> HttpResponse:
+        return HttpResponse(f'Post "{post}" of user #{user_id}')
+
+
+@router.get('/items/<str:item>')
+def item(request: HttpRequest, item: str) -> HttpResponse:
+    return HttpResponse(f'Item "{item}"')
+
+
+# Can not be stored in radix tree, path converter matches across segments
+@router.get('/files/<path:file_path>')
+def file(request: HttpRequest, file_path: str) -> HttpResponse:
+    return HttpResponse(f'File "{file_path}"')
+
+
+# Can not be stored in radix tree, segment mixes text and parameter
+@router.get('/report-<int:year>')
+def report(request: HttpRequest, year: int) -> HttpResponse:
+    return HttpResponse(f'Report for {year}')
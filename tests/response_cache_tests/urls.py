@@ -0,0 +1,7 @@
+from django_routify import include_hosts
+
+from .views import tenant_router
+
+urlpatterns = [
+    include_hosts(tenant_router),
+]
@@ -0,0 +1,72 @@
+import threading
+
+from collections import Counter
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+from django_routify import CachePolicy, Router
+
+router = Router('/catalog', 'catalog', auto_trailing_slash=True)
+tenant_router = Router('/', 'tenant', host='{tenant}.example.com', auto_trailing_slash=True)
+
+calls = Counter()
+release = threading.Event()
+
+
+@router.get('/products/<int:pk>', cache=CachePolicy(ttl=30, max_entries=2, vary=['Accept-Language']))
+def get_product(request: HttpRequest, pk: int) -> HttpResponse:
+    calls['get_product'] += 1
+    response = JsonResponse({'pk': pk, 'calls': calls['get_product']})
+    response['X-Language'] = request.headers.get('Accept-Language', '')
+    return response
+
+
+@router.post('/products/<int:pk>', cache=CachePolicy(ttl=30))
+def update_product(request: HttpRequest, pk: int) -> HttpResponse:
+    calls['update_product'] += 1
+    return JsonResponse({'calls': calls['update_product']})
+
+
+@router.get('/cart', cache=CachePolicy(ttl=30))
+def cart(request: HttpRequest) -> HttpResponse:
+    calls['cart'] += 1
+    response = JsonResponse({'calls': calls['cart']})
+    response.set_cookie('cart', '1')
+    return response
+
+
+@router.get('/prices', cache=CachePolicy(ttl=1, stale=10))
+def prices(request: HttpRequest) -> HttpResponse:
+    calls['prices'] += 1
+    return JsonResponse({'calls': calls['prices']})
+
+
+@router.get('/reports', cache=CachePolicy(ttl=30, key=lambda request: request.GET.get('year')))
+def reports(request: HttpRequest) -> HttpResponse:
+    calls['reports'] += 1
+    release.wait(5) # concurrent misses wait for the first one
+    return JsonResponse({'calls': calls['reports']})
+
+
+@router.get('/stock', cache=CachePolicy(ttl=30))
+async def stock(request: HttpRequest) -> HttpResponse:
+    calls['stock'] += 1
+    return JsonResponse({'calls': calls['stock']})
+
+
+@router.get('/quotes', cache=CachePolicy(ttl=1, stale=10))
+async def quotes(request: HttpRequest) -> HttpResponse:
+    calls['quotes'] += 1
+    return JsonResponse({'calls': calls['quotes']})
+
+
+@router.route('/ticker', cache=CachePolicy(ttl=30))
+def ticker(request: HttpRequest) -> HttpResponse:
+    calls['ticker'] += 1
+    return JsonResponse({'calls': calls['ticker']})
+
+
+@tenant_router.get('/dashboard', cache=CachePolicy(ttl=30))
+def dashboard(request: HttpRequest, tenant: str) -> HttpResponse:
+    calls['dashboard'] += 1
+    return JsonResponse({'tenant': tenant, 'calls': calls['dashboard']})
@@ -0,0 +1,12 @@
+from django.urls import include, path
+
+from django_routify import include_router
+
+from .views import router, unnamed_router
+
+urlpatterns = [
+    path('api/', include([
+        include_router(router),
+    ])),
+    include_router(unnamed_router),
+]
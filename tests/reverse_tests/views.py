@@ -0,0 +1,44 @@
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router
+
+router = Router('/shop/<slug:shop>', 'shop', auto_trailing_slash=True)
+
+
+@router.get('/')
+def index(request: HttpRequest, shop: str) -> HttpResponse:
+    return HttpResponse(f'Shop {shop}')
+
+
+@router.get('/products/<int:pk>')
+def product(request: HttpRequest, shop: str, pk: int) -> HttpResponse:
+    return HttpResponse(f'Product #{pk}')
+
+
+@router.post('/products/<int:pk>', name='update_product')
+def update_product(request: HttpRequest, shop: str, pk: int) -> HttpResponse:
+    return HttpResponse(f'Update product #{pk}')
+
+
+@router.get('/search/<str:query>')
+def search(request: HttpRequest, shop: str, query: str) -> HttpResponse:
+    return HttpResponse(f'Search {query}')
+
+
+@router.get('/files/<path:file_path>')
+def files(request: HttpRequest, shop: str, file_path: str) -> HttpResponse:
+    return HttpResponse(f'File {file_path}')
+
+
+# Same name as product, Django tries the last registered pattern first
+@router.get('/products/<uuid:pk>', name='product')
+def product_by_uuid(request: HttpRequest, shop: str, pk: str) -> HttpResponse:
+    return HttpResponse(f'Product {pk}')
+
+
+unnamed_router = Router('/unnamed', auto_trailing_slash=True)
+
+
+@unnamed_router.get('/about')
+def about(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('About')
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError: # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+
+def _trace(request: HttpRequest, name: str) -> None:
+    if not hasattr(request, 'trace'):
+        request.trace = []
+    request.trace.append(name)
+
+
+@sync_and_async_middleware
+def outer_middleware(get_response):
+    if iscoroutinefunction(get_response):
+        async def middleware(request: HttpRequest) -> HttpResponse:
+            _trace(request, 'outer')
+            response = await get_response(request)
+            response['X-Outer'] = 'async'
+            return response
+    else:
+        def middleware(request: HttpRequest) -> HttpResponse:
+            _trace(request, 'outer')
+            response = get_response(request)
+            response['X-Outer'] = 'sync'
+            return response
+    return middleware
+
+
+def inner_middleware(get_response):
+    def middleware(request: HttpRequest) -> HttpResponse:
+        _trace(request, 'inner')
+        return get_response(request)
+    return middleware
+
+
+def length_middleware(get_response):
+    def middleware(request: HttpRequest) -> HttpResponse:
+        response = get_response(request)
+        response['X-Length'] = str(len(response.content))
+        return response
+    return middleware
+
+
+def unused_middleware(get_response):
+    raise MiddlewareNotUsed
+
+
+class HookMiddleware(MiddlewareMixin):
+    def process_view(self, request: HttpRequest, view, args, kwargs) -> Optional[HttpResponse]:
+        _trace(request, 'view')
+        if request.GET.get('short'):
+            return JsonResponse({'short': True, 'kwargs': kwargs})
+        return None
+
+    def process_exception(self, request: HttpRequest, exception: Exception) -> Optional[HttpResponse]:
+        if isinstance(exception, LookupError):
+            return JsonResponse({'error': str(exception)}, status=404)
+        return None
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        response.context_data['trace'] = request.trace
+        return response
@@ -0,0 +1,93 @@
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.template.response import SimpleTemplateResponse
+from django.views.decorators.csrf import csrf_exempt
+
+from django_routify import Router
+
+router = Router(
+    '/scoped',
+    'scoped',
+    auto_trailing_slash=True,
+    middleware=[
+        'tests.router_middleware_tests.middleware.outer_middleware',
+        'tests.router_middleware_tests.middleware.unused_middleware',
+    ],
+)
+
+plain_router = Router('/plain', 'plain', auto_trailing_slash=True)
+
+
+@router.get('/items/<int:pk>')
+def get_item(request: HttpRequest, pk: int) -> HttpResponse:
+    return JsonResponse({'pk': pk, 'trace': request.trace})
+
+
+@router.get('/orders', middleware=['tests.router_middleware_tests.middleware.inner_middleware'])
+def get_orders(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'trace': request.trace})
+
+
+@router.get('/gone')
+def gone(request: HttpRequest) -> HttpResponse:
+    raise Http404('No such page')
+
+
+@router.get('/stream')
+async def stream(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'trace': request.trace})
+
+
+@router.get('/mixed', middleware=['tests.router_middleware_tests.middleware.inner_middleware'])
+async def mixed(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'trace': request.trace})
+
+
+@plain_router.get('/ping')
+def ping(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'trace': getattr(request, 'trace', [])})
+
+
+class TraceTemplate:
+    def render(self, context: dict, request: HttpRequest = None) -> str:
+        return ','.join(context['trace'])
+
+
+hooks_router = Router(
+    '/hooked',
+    'hooked',
+    auto_trailing_slash=True,
+    middleware=[
+        'django.middleware.csrf.CsrfViewMiddleware',
+        'tests.router_middleware_tests.middleware.HookMiddleware',
+    ],
+)
+
+
+@hooks_router.get('/items/<int:pk>')
+def get_hooked_item(request: HttpRequest, pk: int) -> HttpResponse:
+    if pk == 0:
+        raise LookupError('missing item')
+    return JsonResponse({'pk': pk, 'trace': request.trace})
+
+
+@hooks_router.get('/stream/<int:pk>')
+async def stream_hooked_item(request: HttpRequest, pk: int) -> HttpResponse:
+    if pk == 0:
+        raise LookupError('missing item')
+    return JsonResponse({'pk': pk, 'trace': request.trace})
+
+
+@hooks_router.get('/page', middleware=['tests.router_middleware_tests.middleware.length_middleware'])
+def page(request: HttpRequest) -> HttpResponse:
+    return SimpleTemplateResponse(TraceTemplate(), {})
+
+
+@hooks_router.post('/submit')
+def submit(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'submitted': True})
+
+
+@hooks_router.post('/hook')
+@csrf_exempt
+def hook(request: HttpRequest) -> HttpResponse:
+    return JsonResponse({'received': True})
@@ -0,0 +1,28 @@
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.views import View
+
+from django_routify import Router
+
+router = Router('/stateless', 'stateless', auto_trailing_slash=True)
+
+
+class ItemView(View):
+    prefix = 'item'
+
+    def format(self, pk: int) -> str:
+        return f'{self.prefix}-{pk}'
+
+    def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return JsonResponse({'item': self.format(pk)})
+
+    def post(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return JsonResponse({'created': self.format(pk)}, status=201)
+
+
+class AsyncItemView(View):
+    async def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        return JsonResponse({'item': pk})
+
+
+router.route('/items/<int:pk>', stateless=True)(ItemView)
+router.route('/async-items/<int:pk>', stateless=True)(AsyncItemView)
@@ -0,0 +1,42 @@
+from django.http import HttpRequest, HttpResponse
+
+from django_routify import Router
+
+accept_router = Router('/api', 'api', auto_trailing_slash=True, versioning='accept', default_version='1')
+header_router = Router('/reports', 'reports', auto_trailing_slash=True, versioning='header', version_param='X-Version')
+query_router = Router('/search', 'search', auto_trailing_slash=True, versioning='query')
+
+
+@accept_router.get('/items', version='1')
+def list_items(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Items v1')
+
+
+@accept_router.get('/items', version='2')
+def list_items_v2(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Items v2')
+
+
+@accept_router.post('/items', version='2')
+def create_item_v2(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Created v2', status=201)
+
+
+@header_router.get('/sales')
+def sales(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Sales')
+
+
+@header_router.route('/sales', version='2')
+def sales_v2(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(f'Sales v2 {request.method}')
+
+
+@query_router.get('/', version='1')
+def search(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Search v1')
+
+
+@query_router.get('/', version='2')
+async def search_v2(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('Search v2')
@@ -0,0 +1,8 @@
+from django_routify import include_hosts, include_router
+
+from .views import admin_router, api_router, tenant_router
+
+urlpatterns = [
+    include_router(api_router),
+    include_hosts(admin_router, tenant_router),
+]
@@ -0,0 +1,69 @@
+from django.http import Http404, HttpRequest, HttpResponse
+
+from django_routify import Router
+
+router = Router('/warm', 'warm', auto_trailing_slash=True)
+calls = []
+
+
+@router.get('/')
+def index(request: HttpRequest) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse('Index')
+
+
+@router.get('/reports/<int:pk>', warm_kwargs={'pk': 1})
+def report(request: HttpRequest, pk: int) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse(f'Report #{pk}')
+
+
+@router.get('/users/<int:pk>')
+def user(request: HttpRequest, pk: int) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse(f'User #{pk}')
+
+
+@router.post('/webhook')
+def webhook(request: HttpRequest) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse('Webhook')
+
+
+@router.get('/broken')
+def broken(request: HttpRequest) -> HttpResponse:
+    raise RuntimeError('Broken')
+
+
+api_router = Router('/api', 'api', auto_trailing_slash=True, versioning='header', default_version='1')
+admin_router = Router('/admin', 'admin', host='admin.example.com', auto_trailing_slash=True)
+tenant_router = Router('/', 'tenant', host='{tenant}.example.com', auto_trailing_slash=True)
+
+
+@api_router.get('/items', version='1')
+def items(request: HttpRequest) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse('Items v1')
+
+
+@api_router.get('/items', version='2')
+def items_v2(request: HttpRequest) -> HttpResponse:
+    calls.append(request.path + ' v2')
+    return HttpResponse('Items v2')
+
+
+@api_router.get('/gone')
+def gone(request: HttpRequest) -> HttpResponse:
+    raise Http404('Gone')
+
+
+@admin_router.get('/')
+def admin(request: HttpRequest) -> HttpResponse:
+    calls.append(request.get_host() + request.path)
+    return HttpResponse('Admin')
+
+
+@tenant_router.get('/dashboard')
+def dashboard(request: HttpRequest, tenant: str) -> HttpResponse:
+    calls.append(request.path)
+    return HttpResponse(f'Dashboard of {tenant}')